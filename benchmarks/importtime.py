@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------
+# Copyright 2019-2020 Airinnova AB and the Schemadict authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------------------
+
+"""
+Measure the import time of the schemadict package
+
+Usage:
+
+    python benchmarks/importtime.py --budget 15 --output importtime.json
+
+'import schemadict' is run in fresh interpreters with 'python -X importtime'.
+The cumulative import time of the package (including the modules it imports)
+is reported as minimum and median over all runs. The exit status is 1 if the
+median exceeds the budget, or if modules which should only be imported on
+first use (see FORBIDDEN) are imported.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules which must not be imported by 'import schemadict'
+FORBIDDEN = (
+    'asyncio',
+    'concurrent.futures',
+    'difflib',
+    'hashlib',
+    'numpy',
+    'pickle',
+    're',
+    'schemadict._codegen',
+    'threading',
+)
+
+_SCRIPT = (
+    "import sys; before = set(sys.modules); import schemadict; " +
+    "print(','.join(set(sys.modules) - before))"
+)
+
+
+def measure_once():
+    """
+    Import schemadict in a new interpreter
+
+    Returns:
+        :import_time: (float) cumulative import time in milliseconds
+        :modules: (set) names of the modules imported by schemadict
+    """
+
+    # Note: bytecode must be cached, otherwise compilation is measured
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _SCRIPT],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True, env=env,
+    )
+    for line in proc.stderr.splitlines():
+        # Format: 'import time: self [us] | cumulative | imported package'
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == 'schemadict':
+            return int(fields[1])/1000, set(proc.stdout.strip().split(','))
+    raise RuntimeError("import time of 'schemadict' not found")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of schemadict")
+    parser.add_argument('--runs', type=int, default=20, help="number of interpreters to start")
+    parser.add_argument('--budget', type=float, default=None, help="budget for the median in ms")
+    parser.add_argument('--output', '-o', help="write results to a JSON file")
+    args = parser.parse_args(argv)
+
+    if sys.version_info < (3, 7):
+        print("skipped: 'python -X importtime' requires Python 3.7 or later")
+        return 0
+
+    measure_once()  # Write bytecode caches
+    times = []
+    for _ in range(args.runs):
+        import_time, modules = measure_once()
+        times.append(import_time)
+
+    result = {
+        'min_ms': min(times),
+        'median_ms': statistics.median(times),
+        'forbidden_modules': sorted(name for name in FORBIDDEN if name in modules),
+        'budget_ms': args.budget,
+    }
+    print(f"import schemadict: min {result['min_ms']:.2f} ms, median {result['median_ms']:.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(result, fp, indent=2)
+
+    status = 0
+    if result['forbidden_modules']:
+        print(f"modules imported eagerly: {', '.join(result['forbidden_modules'])}", file=sys.stderr)
+        status = 1
+    if args.budget is not None and result['median_ms'] > args.budget:
+        print(f"import time exceeds budget of {args.budget} ms", file=sys.stderr)
+        status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------
+# Copyright 2019-2020 Airinnova AB and the Schemadict authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------------------
+
+"""
+Compare compiling a schemadict with loading regexes from a cache file
+
+Usage:
+
+    python benchmarks/plan_cache.py --keys 300 --runs 10
+
+A schema with one regex per key is compiled in fresh interpreters (the 're'
+module caches patterns within a process), once with 'compile()' and once with
+'compile(cache_file=...)' and an existing cache file. The minimum and median
+times are reported. The exit status is 1 if loading is not faster.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_SCRIPT = """
+import sys, time
+from schemadict import schemadict
+
+num_keys, cache_file = int(sys.argv[1]), sys.argv[2] or None
+schema = schemadict({
+    f"key{i}": {
+        'type': str,
+        'regex_full': rf"(?P<user>[\\w.+-]+)@(?P<host>[a-z0-9-]+)\\.(?:com|org|x{i})",
+        'one_of': [f"value{j}" for j in range(20)],
+    }
+    for i in range(num_keys)
+})
+
+start = time.perf_counter()
+schema.compile(cache_file=cache_file)
+print((time.perf_counter() - start)*1000)
+"""
+
+
+def measure_once(num_keys, cache_file=''):
+    """Return the time to compile the schema in a new interpreter (in ms)"""
+
+    proc = subprocess.run(
+        [sys.executable, '-c', _SCRIPT, str(num_keys), cache_file],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    return float(proc.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare compiling and loading from a cache file")
+    parser.add_argument('--keys', type=int, default=300, help="number of schema keys (one regex each)")
+    parser.add_argument('--runs', type=int, default=10, help="number of interpreters to start")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, 'schema.cache')
+        measure_once(args.keys, cache_file)  # Write the cache file
+
+        results = {}
+        for label, filename in (('compile', ''), ('load', cache_file)):
+            times = [measure_once(args.keys, filename) for _ in range(args.runs)]
+            results[label] = statistics.median(times)
+            print(f"{label:>8}: min {min(times):.2f} ms, median {results[label]:.2f} ms")
+
+    print(f"speedup: {results['compile']/results['load']:.1f}x")
+    return 0 if results['load'] < results['compile'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------
+# Copyright 2019-2020 Airinnova AB and the Schemadict authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------------------
+
+"""
+Run the benchmark workloads
+
+Usage:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare results.json --threshold 0.1
+    python benchmarks/run.py flat deep --backend codegen
+
+For each workload, the throughput (validated test dictionaries per second),
+percentiles of the latency per test dictionary and the peak memory allocated
+during validation (tracemalloc) are reported. Results can be saved as JSON.
+With '--compare', the throughput is compared with a previous result file and
+the exit status is 1 if any workload is slower by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from schemadict.__version__ import __version__  # noqa: E402
+from workloads import WORKLOADS  # noqa: E402
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values, p):
+    """Return the p-th percentile of sorted values (nearest rank)"""
+
+    index = max(0, min(len(sorted_values) - 1, round(p/100*len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def get_validate(schema, backend):
+    if backend == 'codegen':
+        return schema.generate_validator()
+    return schema.validate
+
+
+def run_workload(name, backend='validate', min_time=1.0):
+    """
+    Run a single workload
+
+    Args:
+        :name: (str) name of the workload
+        :backend: (str) 'validate' or 'codegen'
+        :min_time: (float) minimum measurement time in seconds
+
+    Returns:
+        :result: (dict) measured values
+    """
+
+    schema, records = WORKLOADS[name]()
+    validate = get_validate(schema, backend)
+
+    # Warm up (compiles the schema)
+    validate(records[0])
+
+    perf_counter = time.perf_counter
+    latencies = []
+    start = perf_counter()
+    while True:
+        for record in records:
+            t0 = perf_counter()
+            validate(record)
+            latencies.append(perf_counter() - t0)
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+
+    # Allocations are measured in a separate pass (tracemalloc is slow)
+    tracemalloc.start()
+    try:
+        for record in records[:100]:
+            validate(record)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    result = {
+        'backend': backend,
+        'ops': len(latencies),
+        'ops_per_sec': len(latencies)/elapsed,
+        'peak_alloc_bytes': peak,
+    }
+    for p in PERCENTILES:
+        result[f"p{p}_us"] = percentile(latencies, p)*1e6
+    return result
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline
+
+    Args:
+        :results: (dict) results of this run
+        :baseline: (dict) results of a previous run
+        :threshold: (float) tolerated relative loss of throughput
+
+    Returns:
+        :regressions: list of (name, relative change) for regressed workloads
+    """
+
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name, None)
+        if base is None or base['backend'] != result['backend']:
+            continue
+        change = result['ops_per_sec']/base['ops_per_sec'] - 1
+        print(f"{name:>20}: {change:+.1%} ops/sec")
+        if change < -threshold:
+            regressions.append((name, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run schemadict benchmarks")
+    parser.add_argument('workloads', nargs='*', metavar='WORKLOAD',
+                        help=f"workloads to run (default: all of {', '.join(WORKLOADS)})")
+    parser.add_argument('--backend', choices=('validate', 'codegen'), default='validate',
+                        help="validate with 'validate()' or 'generate_validator()'")
+    parser.add_argument('--min-time', type=float, default=1.0,
+                        help="minimum measurement time per workload in seconds")
+    parser.add_argument('--output', '-o', help="write results to a JSON file")
+    parser.add_argument('--compare', help="compare with results in a JSON file")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="tolerated relative loss of throughput (default: 0.1)")
+    args = parser.parse_args(argv)
+    for name in args.workloads:
+        if name not in WORKLOADS:
+            parser.error(f"unknown workload {name!r}")
+
+    results = {}
+    print(f"{'workload':>20} {'ops/sec':>12} " +
+          ' '.join(f"{f'p{p} [us]':>10}" for p in PERCENTILES) + f" {'peak [KiB]':>11}")
+    for name in args.workloads or WORKLOADS:
+        result = run_workload(name, args.backend, args.min_time)
+        results[name] = result
+        print(f"{name:>20} {result['ops_per_sec']:>12.1f} " +
+              ' '.join(f"{result[f'p{p}_us']:>10.1f}" for p in PERCENTILES) +
+              f" {result['peak_alloc_bytes']/1024:>11.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump({
+                'meta': {
+                    'schemadict': __version__,
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                },
+                'results': results,
+            }, fp, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            for name, change in regressions:
+                print(f"regression: {name!r} is {-change:.1%} slower", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------
+# Copyright 2019-2020 Airinnova AB and the Schemadict authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------------------
+
+"""
+Standard benchmark workloads
+
+Each workload is a function which returns a schemadict and a list of (valid)
+test dictionaries. One "operation" is the validation of one test dictionary.
+Workloads are deterministic, so that results of different runs can be
+compared.
+"""
+
+import random
+
+from schemadict import schemadict, STANDARD_VALIDATORS, ValidatorDict
+
+WORKLOADS = {}
+
+
+def workload(func):
+    """Register a workload function"""
+
+    WORKLOADS[func.__name__] = func
+    return func
+
+
+@workload
+def flat():
+    """Flat records with 10 keys"""
+
+    schema = schemadict({
+        '$required_keys': ['id', 'name', 'email'],
+        'id': {'type': int, '>=': 0},
+        'name': {'type': str, 'min_len': 1, 'max_len': 64},
+        'email': {'type': str, 'regex': r'[^@]+@[^@]+'},
+        'age': {'type': int, '>=': 0, '<': 150},
+        'score': {'type': float, '>=': 0, '<=': 1},
+        'active': {'type': bool},
+        'country': {'type': str, 'one_of': ['SE', 'NO', 'DK', 'FI', 'DE']},
+        'tags': {'type': list, 'max_len': 10, 'item_types': str},
+        'balance': {'type': float},
+        'note': {'type': str, 'max_len': 200},
+    })
+
+    rng = random.Random(0)
+    records = [
+        {
+            'id': i,
+            'name': f"user{i}",
+            'email': f"user{i}@example.com",
+            'age': rng.randrange(150),
+            'score': rng.random(),
+            'active': bool(i % 2),
+            'country': rng.choice(['SE', 'NO', 'DK', 'FI', 'DE']),
+            'tags': ['a', 'b', 'c'],
+            'balance': rng.uniform(-100, 100),
+            'note': 'lorem ipsum',
+        }
+        for i in range(10000)
+    ]
+    return schema, records
+
+
+@workload
+def wide():
+    """Configuration with 2000 keys"""
+
+    num_keys = 2000
+    schema = {'$required_keys': [f"key{i}" for i in range(0, num_keys, 10)]}
+    record = {}
+    for i in range(num_keys):
+        if i % 3 == 0:
+            schema[f"key{i}"] = {'type': int, '>=': 0}
+            record[f"key{i}"] = i
+        elif i % 3 == 1:
+            schema[f"key{i}"] = {'type': str, 'max_len': 32}
+            record[f"key{i}"] = f"value{i}"
+        else:
+            schema[f"key{i}"] = {'type': float, '<': 1e9}
+            record[f"key{i}"] = float(i)
+
+    return schemadict(schema), [dict(record) for _ in range(100)]
+
+
+@workload
+def deep():
+    """Nested 'schema' chain with 20 levels"""
+
+    depth = 20
+    schema = {'name': {'type': str}}
+    record = {'name': 'leaf'}
+    for level in range(depth):
+        schema = {
+            'name': {'type': str, 'min_len': 1},
+            'level': {'type': int, '>=': 0},
+            'child': {'type': dict, 'schema': schema},
+        }
+        record = {'name': 'node', 'level': level, 'child': record}
+
+    return schemadict(schema), [record]*2000
+
+
+@workload
+def list_heavy():
+    """List with 100k items validated with 'item_schemadict'"""
+
+    schema = schemadict({
+        'points': {
+            'type': list,
+            'item_schemadict': {
+                'x': {'type': float},
+                'y': {'type': float},
+                'label': {'type': str, 'max_len': 8},
+            },
+        },
+    })
+
+    rng = random.Random(0)
+    points = [{'x': rng.random(), 'y': rng.random(), 'label': 'p'} for _ in range(100000)]
+    return schema, [{'points': points}]*3
+
+
+@workload
+def regex_heavy():
+    """Lists of strings validated with regular expressions"""
+
+    schema = schemadict({
+        'emails': {
+            'type': list,
+            'item_schema': {'type': str, 'regex_full': r'[\w.+-]+@[\w-]+\.[\w.]+'},
+        },
+        'codes': {
+            'type': list,
+            'item_schema': {'type': str, 'regex': r'[A-Z]{3}-\d{4}'},
+        },
+    })
+
+    records = [
+        {
+            'emails': [f"user{i}.{j}@example.com" for j in range(50)],
+            'codes': [f"ABC-{j:04d}" for j in range(50)],
+        }
+        for i in range(200)
+    ]
+    return schema, records
+
+
+def _is_even(key, value, is_even, _):
+    if is_even and value % 2:
+        raise ValueError(f"{key!r}: value {value!r} is not even")
+
+
+@workload
+def custom_validators():
+    """Records checked with custom validator functions"""
+
+    validators = ValidatorDict(STANDARD_VALIDATORS)
+    validators[int] = {**STANDARD_VALIDATORS[int], 'even': _is_even}
+    validators[str] = {**STANDARD_VALIDATORS[str], 'even': lambda k, v, e, _: _is_even(k, len(v), e, _)}
+
+    schema = schemadict({
+        'a': {'type': int, 'even': True},
+        'b': {'type': int, 'even': True, '>=': 0},
+        'c': {'type': str, 'even': True},
+        'd': {'type': list, 'item_schema': {'type': int, 'even': True}},
+    }, validators=validators)
+
+    records = [{'a': 2*i, 'b': 4*i, 'c': 'ab'*(i % 5), 'd': [0, 2, 4, 6]} for i in range(10000)]
+    return schema, records
+
@@ -14,6 +14,7 @@ DESCRIPTION = 'Validate Python dictionaries like JSON schema'
 URL = 'https://github.com/airinnova/schemadict/'
 REQUIRES_PYTHON = '>=3.6.0'
 REQUIRED = []
+EXTRAS = {'numpy': ['numpy']}
 README = 'README.rst'
 PACKAGE_DIR = 'src/'
 LICENSE = 'Apache License 2.0'
@@ -38,6 +39,7 @@ setuptools.setup(
     packages=[NAME],
     python_requires=REQUIRES_PYTHON,
     install_requires=REQUIRED,
+    extras_require=EXTRAS,
     # See: https://pypi.org/classifiers/
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------
+# Copyright 2019-2020 Airinnova AB and the Schemadict authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------------------
+
+"""
+Command line interface: validate JSON Lines records against a schemadict
+
+Usage:
+
+    python -m schemadict pkg.schemas:ORDER orders.jsonl --rejects rejects.txt
+
+Records are read and validated one by one (constant memory). Invalid records
+are reported with their line number. A summary with the number of records,
+failures and the throughput is printed at the end. The exit status is 1 if
+any record is invalid, and 2 for usage errors (e.g. a missing input file).
+"""
+
+from collections import deque
+import argparse
+import importlib
+import json
+import sys
+import time
+
+from .schemadict import schemadict
+
+
+def load_schema(spec):
+    """
+    Load a schema from a module attribute
+
+    Args:
+        :spec: (str) module and attribute name, e.g. 'pkg.schemas:ORDER'
+
+    Returns:
+        :schema: schemadict instance (plain dictionaries are converted)
+    """
+
+    module_name, sep, attr_name = spec.partition(':')
+    if not sep or not module_name or not attr_name:
+        raise ValueError(f"invalid schema {spec!r}: expected 'module:attribute'")
+
+    schema = importlib.import_module(module_name)
+    for name in attr_name.split('.'):
+        schema = getattr(schema, name)
+
+    if not isinstance(schema, schemadict):
+        schema = schemadict(schema)
+    return schema
+
+
+def iter_line_errors(schema, lines, jobs=1, chunksize=1000):
+    """
+    Validate JSON Lines and yield (line number, error) for each record
+
+    Blank lines are skipped. Lines which are not valid JSON are reported with
+    a 'ValueError'. The error is None if the record is valid.
+
+    Args:
+        :schema: schemadict instance
+        :lines: iterable of lines
+        :jobs: (int) number of worker processes
+        :chunksize: (int) number of records sent to a worker at once
+    """
+
+    # Line numbers (and JSON errors) of records which have been read, but for
+    # which no validation result has been yielded yet
+    queue = deque()
+
+    def iter_records():
+        for lineno, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                queue.append((lineno, e))
+                continue
+            queue.append((lineno, None))
+            yield record
+
+    if jobs > 1:
+        errors = schema._iter_errors_parallel(iter_records(), jobs, chunksize)
+    else:
+        errors = schema._iter_errors(iter_records())
+
+    for error in errors:
+        lineno, json_error = queue.popleft()
+        while json_error is not None:
+            yield lineno, json_error
+            lineno, json_error = queue.popleft()
+        yield lineno, error
+
+    yield from queue
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m schemadict',
+        description='Validate JSON Lines records against a schemadict',
+    )
+    parser.add_argument('schema', help="schema as module attribute, e.g. 'pkg.schemas:ORDER'")
+    parser.add_argument(
+        'input', nargs='?', default='-',
+        help="JSON Lines file (default: '-' for stdin)",
+    )
+    parser.add_argument('--rejects', metavar='FILE', help='write errors to FILE (default: stderr)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N', help='number of worker processes')
+    parser.add_argument('--chunksize', type=int, default=1000, metavar='N', help='records per chunk (with --jobs)')
+    args = parser.parse_args(argv)
+
+    try:
+        schema = load_schema(args.schema)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(f"cannot load schema: {e}")
+
+    try:
+        infile = sys.stdin if args.input == '-' else open(args.input, 'r')
+    except OSError as e:
+        parser.error(f"cannot open input file: {e}")
+    try:
+        rejects = sys.stderr if args.rejects is None else open(args.rejects, 'w')
+    except OSError as e:
+        if infile is not sys.stdin:
+            infile.close()
+        parser.error(f"cannot open rejects file: {e}")
+
+    num_records = 0
+    num_invalid = 0
+    start = time.perf_counter()
+    try:
+        for lineno, error in iter_line_errors(schema, infile, args.jobs, args.chunksize):
+            num_records += 1
+            if error is not None:
+                num_invalid += 1
+                rejects.write(f"{lineno}: {type(error).__name__}: {error}\n")
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if rejects is not sys.stderr:
+            rejects.close()
+    elapsed = time.perf_counter() - start
+
+    rate = num_records/elapsed if elapsed > 0 else float('inf')
+    print(
+        f"records: {num_records}, valid: {num_records - num_invalid}, invalid: {num_invalid}, " +
+        f"elapsed: {elapsed:.3f} s, records/s: {rate:.0f}"
+    )
+    return 1 if num_invalid else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------
+# Copyright 2019-2020 Airinnova AB and the Schemadict authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------------------
+
+"""
+Code generating validator backend
+
+A schemadict is translated into the source code of a single Python function
+which is built with 'exec()'. Standard validators are inlined as plain
+comparisons, nested schemas are unrolled into loops, and custom validators are
+called directly.
+
+Inlined checks only decide if a value passes. If it does not, the original
+validator function is called, so that exception types and messages are
+identical to those of 'schemadict.validate()'.
+"""
+
+from .schemadict import (
+    _VECTORIZE_MIN_ITEMS,
+    _check_items_vectorized,
+    SpecialValidators,
+    ValidationContext,
+    Validators,
+)
+
+_INDENT = '    '
+_MAX_DEPTH = 32
+
+
+class _CodeGenerator:
+    """Generate the source code of a validator function for a schemadict"""
+
+    def __init__(self, sd_instance):
+        self.sd_instance = sd_instance
+        self.namespace = {}
+        self.lines = []
+        self._const_names = {}
+        self._num_vars = 0
+        self._schema_stack = []
+
+    def const(self, obj, prefix='c'):
+        """Bind an object in the namespace and return its name"""
+
+        name = self._const_names.get(id(obj), None)
+        if name is None:
+            name = f"{prefix}{len(self.namespace)}"
+            self.namespace[name] = obj
+            self._const_names[id(obj)] = name
+        return name
+
+    def var(self, prefix):
+        """Return a new local variable name"""
+
+        self._num_vars += 1
+        return f"{prefix}{self._num_vars}"
+
+    def emit(self, level, line):
+        self.lines.append(_INDENT*level + line)
+
+    def generate(self):
+        """
+        Return the source code and the namespace of the validator function
+        """
+
+        self._schema_stack.append(id(self.sd_instance))
+        self.emit(0, 'def validate(testdict):')
+        self.emit_testdict_check(1, 'testdict', self.sd_instance)
+        self.emit_schema(1, 'testdict', self.sd_instance)
+        self.emit(1, 'return None')
+        return '\n'.join(self.lines) + '\n', self.namespace
+
+    def emit_testdict_check(self, level, td_var, sd_instance):
+        is_type = self.const(Validators.is_type, 'f')
+        dict_type = self.const(dict)
+        sd = self.const(sd_instance, 'sd')
+        self.emit(level, f"if not isinstance({td_var}, {dict_type}):")
+        self.emit(level + 1, f"{is_type}('$testdict', {td_var}, {dict_type}, {sd})")
+
+    def emit_schema(self, level, td_var, sd_instance):
+        """Unroll all checks of a schemadict for the test dictionary 'td_var'"""
+
+        special_checks, key_checks, _, _ = sd_instance._get_plan()
+        sd = self.const(sd_instance, 'sd')
+
+        for special_func, sd_key, sd_value in special_checks:
+            key = self.const(sd_key, 'k')
+            value = self.const(sd_value)
+            func = self.const(special_func, 'f')
+            context = self.const(ValidationContext)
+            fallback = f"{func}({key}, {value}, {context}({sd}, {td_var}))"
+            if special_func == SpecialValidators.check_req_keys_in_dict:
+                # Fast path: only call the validator if a key is missing
+                self.emit_cond(level, f"{value}.difference({td_var})", fallback)
+            elif special_func in _KEY_SET_CHECKS:
+                self.emit_cond(level, f"not {value}.issuperset({td_var})", fallback)
+            else:
+                self.emit(level, fallback)
+
+        for sd_key, checks in key_checks:
+            key = self.const(sd_key, 'k')
+            td_value = self.var('v')
+            self.emit(level, f"{td_value} = {td_var}.get({key}, None)")
+            self.emit(level, f"if {td_value} is not None:")
+            self.emit_checks(level + 1, key, td_value, checks, sd_instance)
+
+    def emit_checks(self, level, key, td_value, checks, sd_instance):
+        """Emit the checks of a single schema entry for the value 'td_value'"""
+
+        sd = self.const(sd_instance, 'sd')
+        if not checks:
+            self.emit(level, 'pass')
+
+        for validator_func, exp_value in checks:
+            func = self.const(validator_func, 'f')
+            exp = self.const(exp_value)
+            fallback = f"{func}({key}, {td_value}, {exp}, {sd})"
+
+            if validator_func == Validators.is_type:
+                # Note: 'True' is only accepted for type 'bool' (see 'is_type()')
+                cond = f"not isinstance({td_value}, {exp})"
+                if exp_value is not bool:
+                    cond = f"{td_value} is True or " + cond
+                self.emit_cond(level, cond, fallback)
+
+            elif validator_func in _COMPARISONS:
+                op = _COMPARISONS[validator_func]
+                self.emit_cond(level, f"not {td_value} {op} {exp}", fallback)
+
+            elif validator_func == Validators.has_min_len:
+                self.emit_cond(level, f"not len({td_value}) >= {exp}", fallback)
+
+            elif validator_func == Validators.has_max_len:
+                self.emit_cond(level, f"not len({td_value}) <= {exp}", fallback)
+
+            elif validator_func == Validators.one_of:
+                # Note: unhashable values raise 'TypeError' for set lookups
+                self.emit(level, 'try:')
+                self.emit_cond(level + 1, f"{td_value} not in {exp}", fallback)
+                self.emit(level, 'except TypeError:')
+                self.emit(level + 1, fallback)
+
+            elif validator_func == Validators.check_regex_match:
+                match = self.const(exp_value.match, 'm')
+                self.emit_cond(level, f"{match}({td_value}) is None", fallback)
+
+            elif validator_func == Validators.check_regex_fullmatch:
+                match = self.const(exp_value.fullmatch, 'm')
+                self.emit_cond(level, f"{match}({td_value}) is None", fallback)
+
+            elif validator_func == Validators.check_item_types:
+                item = self.var('i')
+                self.emit(level, f"for {item} in {td_value}:")
+                self.emit_cond(level + 1, f"not isinstance({item}, {exp})", fallback)
+
+            elif validator_func in _ITEM_CHECKS and sd_instance.sampling is not None:
+                # Sampled lists are checked by the validator functions
+                self.emit(level, fallback)
+
+            elif validator_func == Validators.check_item_schema:
+                item = self.var('i')
+                item_checks = sd_instance._compile_entry(exp_value)
+                vectorized = self.const(_check_items_vectorized, 'f')
+                cond = (
+                    f"not (len({td_value}) >= {_VECTORIZE_MIN_ITEMS} and " +
+                    f"{vectorized}({key}, {td_value}, {self.const(item_checks)}, {sd}))"
+                )
+                self.emit(level, f"if {cond}:")
+                self.emit(level + 1, f"for {item} in {td_value}:")
+                self.emit_checks(level + 2, key, item, item_checks, sd_instance)
+
+            elif validator_func == Validators.check_item_schemadict:
+                if not self.can_unroll(exp_value):
+                    self.emit(level, fallback)
+                    continue
+                child = sd_instance._child_schemadict(exp_value)
+                item = self.var('i')
+                self.emit(level, f"for {item} in {td_value}:")
+                self.emit_testdict_check(level + 1, item, child)
+                self.emit_nested_schema(level + 1, item, exp_value, child)
+
+            elif validator_func == Validators.check_schemadict:
+                if not self.can_unroll(exp_value):
+                    self.emit(level, fallback)
+                    continue
+                child = sd_instance._child_schemadict(exp_value)
+                self.emit_testdict_check(level, td_value, child)
+                self.emit_nested_schema(level, td_value, exp_value, child)
+
+            else:
+                # Custom validators (and checks which cannot be inlined)
+                self.emit(level, fallback)
+
+    def emit_cond(self, level, cond, fallback):
+        self.emit(level, f"if {cond}:")
+        self.emit(level + 1, fallback)
+
+    def can_unroll(self, schema):
+        """Recursive (or very deep) schemas are not unrolled"""
+
+        return id(schema) not in self._schema_stack and len(self._schema_stack) < _MAX_DEPTH
+
+    def emit_nested_schema(self, level, td_var, schema, child):
+        self._schema_stack.append(id(schema))
+        self.emit_schema(level, td_var, child)
+        self._schema_stack.pop()
+
+
+_ITEM_CHECKS = (
+    Validators.check_item_schema,
+    Validators.check_item_schemadict,
+)
+
+_KEY_SET_CHECKS = (
+    SpecialValidators.check_allowed_keys,
+    SpecialValidators.check_keys_in_schema,
+)
+
+_COMPARISONS = {
+    Validators.is_gt: '>',
+    Validators.is_lt: '<',
+    Validators.is_ge: '>=',
+    Validators.is_le: '<=',
+}
+
+
+def generate_validator(sd_instance):
+    """
+    Generate a validator function for a schemadict
+
+    Args:
+        :sd_instance: schemadict instance
+
+    Returns:
+        :validate: function which takes a test dictionary as its only argument
+    """
+
+    source, namespace = _CodeGenerator(sd_instance).generate()
+    exec(compile(source, '<schemadict>', 'exec'), namespace)
+    validate = namespace['validate']
+    validate.source = source
+    return validate
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------
+# Copyright 2019-2020 Airinnova AB and the Schemadict authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------------------
+
+"""
+Persistent cache of compiled regular expressions (see 'schemadict.compile()')
+
+Compiling regular expressions is by far the most expensive part of compiling
+a schemadict. Pickled regex patterns are compiled again when they are loaded,
+so cache files store the code generated by the 're' module instead. Patterns
+are built from the code with '_sre.compile()', which skips parsing and code
+generation.
+
+The code (and '_sre.compile()') is an implementation detail of CPython which
+differs between versions. Cache files are therefore only used by the same
+Python version, and are ignored otherwise.
+"""
+
+import os
+import pickle
+import sys
+
+
+def _version():
+    """Return the version key of cache files, or None if not supported"""
+
+    if sys.implementation.name != 'cpython':
+        return None
+    import _sre
+    return (sys.hexversion, _sre.MAGIC)
+
+
+def load(cache_file):
+    """
+    Return the compiled code of regular expressions from a cache file
+
+    Args:
+        :cache_file: (str, path) cache file
+
+    Returns:
+        :states: mapping of (pattern, flags) and compiled code (empty if the
+                 file is missing, corrupt or written by another Python version)
+    """
+
+    version = _version()
+    if version is None:
+        return {}
+    try:
+        with open(cache_file, 'rb') as fp:
+            data = pickle.load(fp)
+        if data['version'] != version:
+            return {}
+        return dict(data['regexes'])
+    except Exception:
+        return {}
+
+
+def dump(cache_file, states):
+    """
+    Write the compiled code of regular expressions to a cache file
+
+    Args:
+        :cache_file: (str, path) cache file
+        :states: mapping of (pattern, flags) and compiled code
+
+    Returns:
+        :written: (bool) False if the file could not be written
+    """
+
+    version = _version()
+    if version is None:
+        return False
+
+    data = {'version': version, 'regexes': states}
+    tmp_file = f"{os.fspath(cache_file)}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'wb') as fp:
+            pickle.dump(data, fp, protocol=4)
+        # Note: readers never see partially written files
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def get_state(pattern, flags):
+    """
+    Return the compiled code of a regular expression (None if not supported)
+
+    Args:
+        :pattern: (str, bytes) regex pattern
+        :flags: (int) regex flags
+
+    Returns:
+        :state: arguments for '_sre.compile()' following the pattern
+    """
+
+    if _version() is None:
+        return None
+    try:
+        # Python 3.11+
+        from re import _compiler, _parser
+    except ImportError:
+        import sre_compile as _compiler
+        import sre_parse as _parser
+
+    try:
+        p = _parser.parse(pattern, flags)
+        code = _compiler._code(p, flags)
+    except Exception:
+        return None
+
+    # Note: named 'pattern' in Python 3.6
+    parser_state = getattr(p, 'state', None) or p.pattern
+    index_group = [None]*parser_state.groups
+    for name, index in parser_state.groupdict.items():
+        index_group[index] = name
+    return (
+        flags | parser_state.flags,
+        [int(op) for op in code],
+        parser_state.groups - 1,
+        dict(parser_state.groupdict),
+        tuple(index_group),
+    )
+
+
+def from_state(pattern, state):
+    """
+    Return a regular expression built from its compiled code (see 'get_state()')
+
+    Returns:
+        :regex: compiled regular expression, or None if the code is invalid
+    """
+
+    import _sre
+    try:
+        return _sre.compile(pattern, *state)
+    except Exception:
+        return None
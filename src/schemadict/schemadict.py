@@ -28,10 +28,18 @@ Schema dictionaries
 # * https://docs.python.org/3/library/abc.html
 # * https://docs.python.org/3/library/collections.abc.html
 
-from collections import OrderedDict
-from collections.abc import MutableMapping
+from collections import deque, namedtuple, OrderedDict
+from collections.abc import Mapping, MutableMapping
 from numbers import Number
-import re
+import array
+import functools
+import operator
+import sys
+import time
+
+# Note: modules which are only needed by some features (e.g. 're', 'pickle',
+# 'hashlib', 'threading', 'difflib', 'asyncio', NumPy and the code generator)
+# are imported on first use, to keep 'import schemadict' fast.
 
 
 class SchemaError(Exception):
@@ -74,18 +82,32 @@ class Validators:
 
     @staticmethod
     def one_of(key, value, allowed_values, _):
-        if value not in set(allowed_values):
+        allowed_values = _prepare_lookup(allowed_values, None)
+        try:
+            is_allowed = value in allowed_values
+        except TypeError:
+            # Unhashable value cannot be in a set of hashable values
+            is_allowed = False
+        if not is_allowed:
             raise ValueError(
                 f"{key!r} value not allowed: " +
-                f"must be one of {set(allowed_values)!r}, but was {value!r}"
+                f"must be one of {_format_items(allowed_values)}, but was {value!r}"
             )
 
     @staticmethod
     def allowed_items(key, values, allowed_items, _):
-        if any(value not in set(allowed_items) for value in values):
+        allowed_items = _prepare_lookup(allowed_items, None)
+        if isinstance(allowed_items, frozenset):
+            try:
+                is_allowed = allowed_items.issuperset(values)
+            except TypeError:
+                is_allowed = False
+        else:
+            is_allowed = all(value in allowed_items for value in values)
+        if not is_allowed:
             raise ValueError(
                 f"{key!r} value not allowed: " +
-                f"must be from set {set(allowed_items)!r}, but was {set(values)!r}"
+                f"must be from set {_format_items(allowed_items)}, but was {_format_items(values)}"
             )
 
     @staticmethod
@@ -138,15 +160,30 @@ class Validators:
 
     @staticmethod
     def check_regex_match(key, string, pattern, _):
-        if not re.match(pattern, string):
+        if isinstance(pattern, str):
+            import re
+            pattern = re.compile(pattern)
+        if not pattern.match(string):
+            raise ValueError(
+                f"regex mismatch for {key!r}: " +
+                f"expected pattern {pattern.pattern!r}, got {string!r}"
+            )
+
+    @staticmethod
+    def check_regex_fullmatch(key, string, pattern, _):
+        if isinstance(pattern, str):
+            import re
+            pattern = re.compile(pattern)
+        if not pattern.fullmatch(string):
             raise ValueError(
                 f"regex mismatch for {key!r}: " +
-                f"expected pattern {pattern!r}, got {string!r}"
+                f"expected full match of pattern {pattern.pattern!r}, got {string!r}"
             )
 
     @staticmethod
     def check_item_types(key, iterable, exp_item_type, _):
-        if not all(isinstance(item, exp_item_type) for item in iterable):
+        # Only check each distinct item type once
+        if not all(issubclass(item_type, exp_item_type) for item_type in set(map(type, iterable))):
             raise TypeError(
                 f"unexpected type for item in iterable {key!r}: " +
                 f"expected {exp_item_type!r}"
@@ -155,24 +192,484 @@ class Validators:
     @staticmethod
     def check_item_schema(key, iterable, item_schema, sd_instance):
         # TODO: check that iterables are not of type dict !?
+        checks = sd_instance._compile_entry(item_schema)
+        if sd_instance.sampling is not None:
+            iterable = _sample_items(iterable, sd_instance)
+        if len(iterable) >= _VECTORIZE_MIN_ITEMS and _check_items_vectorized(key, iterable, checks, sd_instance):
+            return
         for item in iterable:
-            sd_instance._check_test_obj_against_test_funcs(key, item_schema, item)
+            for validator_func, exp_value in checks:
+                validator_func(key, item, exp_value, sd_instance)
 
     @classmethod
     def check_item_schemadict(cls, key, iterable, item_schema, sd_instance):
         # TODO: check that iterables are of type dict !?
+        validate = sd_instance._child_schemadict(item_schema).validate
+        if sd_instance.sampling is not None:
+            iterable = _sample_items(iterable, sd_instance)
         for item in iterable:
-            cls.check_schemadict(key, item, item_schema, sd_instance)
+            validate(item)
 
     @staticmethod
     def check_schemadict(key, testdict, schema, sd_instance):
-        schemadict(schema, validators=sd_instance.validators).validate(testdict)
+        sd_instance._child_schemadict(schema).validate(testdict)
+
+    @staticmethod
+    def check_typecode(key, value, typecodes, _):
+        # Note: a string of typecodes (e.g. 'fd') allows any of its characters
+        if value.typecode not in typecodes:
+            raise TypeError(
+                f"unexpected typecode for {key!r}: " +
+                f"expected {typecodes!r}, but was {value.typecode!r}"
+            )
+
+    @staticmethod
+    def check_buffer_format(key, buffer, formats, _):
+        # Note: a single format (e.g. 'i') or a collection of formats may be given
+        exp_formats = (formats,) if isinstance(formats, str) else formats
+        buffer_format = _buffer_format(memoryview(buffer))
+        if buffer_format not in map(_normalize_format, exp_formats):
+            raise TypeError(
+                f"unexpected buffer format for {key!r}: " +
+                f"expected {formats!r}, but was {buffer_format!r}"
+            )
+
+    @staticmethod
+    def check_buffer_item_types(key, buffer, exp_item_type, _):
+        # Note: all items of a buffer have the same type, given by its format
+        view = memoryview(buffer)
+        item_type = _buffer_item_type(view)
+        if item_type is None:
+            Validators.check_item_types(key, view.tolist(), exp_item_type, _)
+        elif len(view) and not issubclass(item_type, exp_item_type):
+            raise TypeError(
+                f"unexpected type for item in iterable {key!r}: " +
+                f"expected {exp_item_type!r}"
+            )
+
+    @staticmethod
+    def check_buffer_item_schema(key, buffer, item_schema, sd_instance):
+        checks = sd_instance._compile_entry(item_schema)
+        view = memoryview(buffer)
+        if _check_buffer_items(key, view, checks, sd_instance):
+            return
+        for item in _buffer_items(buffer, view):
+            for validator_func, exp_value in checks:
+                validator_func(key, item, exp_value, sd_instance)
 
 
 # Check type (required by all validators)
 Validators.FOR_TYPE = {'type': Validators.is_type}
 
 
+class _UnhashableItems(tuple):
+    """Collection of allowed values which cannot be put into a set"""
+    pass
+
+
+def _prepare_lookup(values, _):
+    """
+    Return a frozenset of allowed values for fast membership tests
+
+    If the values are not hashable, a '_UnhashableItems' tuple is returned
+    instead, and membership is tested linearly.
+    """
+
+    if isinstance(values, (frozenset, _UnhashableItems)):
+        return values
+    try:
+        return frozenset(values)
+    except TypeError:
+        return _UnhashableItems(values)
+
+
+def _format_items(items):
+    """Format a collection of items for error messages"""
+
+    try:
+        return repr(set(items))
+    except TypeError:
+        return repr(list(items))
+
+
+# Regular expressions loaded from cache files by (pattern, flags), see
+# 'schemadict.compile()'
+_loaded_regexes = {}
+
+
+def _prepare_regex(pattern, sd_instance):
+    """Compile a regex pattern with the flags of the schemadict"""
+
+    if isinstance(pattern, str):
+        regex = _loaded_regexes.get((pattern, sd_instance.regex_flags), None)
+        if regex is None:
+            import re
+            regex = re.compile(pattern, sd_instance.regex_flags)
+        return regex
+    return pattern
+
+
+# Fast path for large, homogeneous numeric iterables (see '_check_items_vectorized()')
+_VECTORIZE_MIN_ITEMS = 1000
+_VECTORIZE_ITEM_TYPES = {
+    int: {int},
+    float: {float},
+    Number: {int, float},
+}
+_VECTORIZE_COMPARISONS = {
+    Validators.is_gt: operator.gt,
+    Validators.is_lt: operator.lt,
+    Validators.is_ge: operator.ge,
+    Validators.is_le: operator.le,
+}
+_numpy = None
+
+
+def _import_numpy():
+    """Return the 'numpy' module (imported on first use), or False if not installed"""
+
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy as _numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+
+def _is_exact_float(value):
+    """Return True if a number can be compared exactly as a float"""
+
+    return (
+        isinstance(value, float) or
+        (isinstance(value, int) and not isinstance(value, bool) and abs(value) <= 2**53)
+    )
+
+
+def _exact_bounds(np, items, bounds):
+    """
+    Return comparison bounds for which NumPy compares the items exactly, or
+    None if the comparison would be inexact
+
+    Args:
+        :np: NumPy module
+        :items: NumPy array of numbers (integer or float)
+        :bounds: list of (comparison function, bound), bounds are exact floats
+
+    Note:
+        * Integers are converted to float64 for comparisons with floats,
+          which is only exact up to 2**53
+        * Python numbers are converted to the type of the array (e.g.
+          float32), so bounds of float arrays are given as float64
+    """
+
+    if items.dtype.kind in 'iu':
+        if any(isinstance(comp_value, float) for _, comp_value in bounds):
+            if not (-2**53 <= int(items.min()) and int(items.max()) <= 2**53):
+                return None
+        return bounds
+    return [(comp_func, np.float64(comp_value)) for comp_func, comp_value in bounds]
+
+
+def _check_items_vectorized(key, iterable, checks, sd_instance):
+    """
+    Check the items of a homogeneous numeric list or tuple with vectorized
+    operations
+
+    Item types are checked once per distinct type. Comparison bounds are
+    checked with NumPy. If an item is invalid, the regular checks are run for
+    the first offending item, so that the same error is raised as with the
+    per-item loop.
+
+    Args:
+        :key: related dictionary key (used in error message)
+        :iterable: list or tuple of items
+        :checks: compiled checks of the item schema
+        :sd_instance: instance of the schemadict from which tests are called
+
+    Returns:
+        :handled: True if all items were checked, False if the fast path does
+                  not apply (the caller must then check items one by one)
+    """
+
+    if not isinstance(iterable, (list, tuple)):
+        return False
+
+    item_types = None
+    bounds = []
+    for validator_func, exp_value in checks:
+        if validator_func is Validators.is_type:
+            item_types = _VECTORIZE_ITEM_TYPES.get(exp_value, None)
+        elif validator_func in _VECTORIZE_COMPARISONS and _is_exact_float(exp_value):
+            bounds.append((_VECTORIZE_COMPARISONS[validator_func], exp_value))
+        else:
+            return False
+
+    # Note: subclasses (including 'bool') are checked by the per-item loop
+    actual_item_types = set(map(type, iterable))
+    if item_types is None or not item_types.issuperset(actual_item_types):
+        return False
+
+    if not bounds:
+        return True
+
+    np = _import_numpy()
+    if not np:
+        return False
+
+    # Note: mixed int and float items are converted to float (inexact)
+    array = np.asarray(iterable)
+    if array.dtype.kind not in 'if' or (array.dtype.kind == 'f' and int in actual_item_types):
+        return False
+    bounds = _exact_bounds(np, array, bounds)
+    if bounds is None:
+        return False
+
+    is_valid = np.ones(len(array), dtype=bool)
+    for comp_func, comp_value in bounds:
+        is_valid &= comp_func(array, comp_value)
+    if is_valid.all():
+        return True
+
+    index = int(np.argmin(is_valid))
+    for validator_func, exp_value in checks:
+        validator_func(key, iterable[index], exp_value, sd_instance)
+    return False
+
+
+# Python types of buffer items by (native) struct format, see 'memoryview.format'
+_BUFFER_ITEM_TYPES = {
+    **dict.fromkeys('bBhHiIlLqQnN', int),
+    **dict.fromkeys('efd', float),
+    **dict.fromkeys('uw', str),
+    '?': bool,
+    'c': bytes,
+}
+
+
+# Note: memoryviews of 'array.array' with typecode 'u' have the format 'w'
+_FORMAT_ALIASES = {'u': 'w'}
+
+# Formats of which memoryviews cannot access items
+_NON_INDEXABLE_FORMATS = frozenset('w')
+
+
+def _normalize_format(buffer_format):
+    """Return a struct format without native prefix '@', and without aliases"""
+
+    buffer_format = buffer_format.lstrip('@')
+    return _FORMAT_ALIASES.get(buffer_format, buffer_format)
+
+
+def _buffer_format(view):
+    """Return the (normalized) struct format of a memoryview"""
+
+    return _normalize_format(view.format)
+
+
+def _buffer_items(buffer, view):
+    """
+    Return an iterable of the items of a bytes-like object
+
+    One-dimensional buffers are not copied. Multi-dimensional views are
+    converted to (nested) lists.
+    """
+
+    if view.ndim != 1:
+        return view.tolist()
+    if _buffer_format(view) in _NON_INDEXABLE_FORMATS:
+        if isinstance(buffer, array.array):
+            return buffer
+        return array.array('u', view.tobytes())
+    return view
+
+
+def _buffer_item_type(view):
+    """
+    Return the type of the items of a one-dimensional memoryview, or None if
+    the format is not a single native type
+    """
+
+    if view.ndim != 1:
+        return None
+    return _BUFFER_ITEM_TYPES.get(_buffer_format(view), None)
+
+
+def _check_buffer_items(key, view, checks, sd_instance):
+    """
+    Check the items of a bytes-like object without copying the buffer
+
+    All items share the type given by the buffer format, so type checks are
+    done once. Comparison bounds only depend on the smallest and the largest
+    item. Large buffers are compared with NumPy, using an array which shares
+    the memory of the buffer. If an item is invalid, the regular checks are
+    run for the first offending item, so that the same error is raised as with
+    the per-item loop.
+
+    Args:
+        :key: related dictionary key (used in error message)
+        :view: memoryview of the buffer
+        :checks: compiled checks of the item schema
+        :sd_instance: instance of the schemadict from which tests are called
+
+    Returns:
+        :handled: True if all items were checked, False if the fast path does
+                  not apply (the caller must then check items one by one)
+    """
+
+    item_type = _buffer_item_type(view)
+    if item_type is None or not len(view) or _buffer_format(view) in _NON_INDEXABLE_FORMATS:
+        return False
+
+    bounds = []
+    for validator_func, exp_value in checks:
+        if validator_func is Validators.is_type:
+            # Note: 'True' is only accepted for type 'bool' (see 'is_type()')
+            if item_type is bool and exp_value is not bool:
+                return False
+            if not issubclass(item_type, exp_value):
+                return False
+        elif validator_func in _VECTORIZE_COMPARISONS:
+            bounds.append((_VECTORIZE_COMPARISONS[validator_func], exp_value))
+        else:
+            return False
+
+    if not bounds:
+        return True
+
+    try:
+        np = _import_numpy()
+        if (
+            np and len(view) >= _VECTORIZE_MIN_ITEMS and item_type in (int, float) and
+            all(_is_exact_float(comp_value) for _, comp_value in bounds)
+        ):
+            # Note: the NumPy array shares the memory of the buffer
+            items = np.asarray(view)
+            exact_bounds = _exact_bounds(np, items, bounds)
+            if exact_bounds is not None:
+                is_valid = np.ones(len(items), dtype=bool)
+                for comp_func, comp_value in exact_bounds:
+                    is_valid &= comp_func(items, comp_value)
+                if is_valid.all():
+                    return True
+                index = int(np.argmin(is_valid))
+                for validator_func, exp_value in checks:
+                    validator_func(key, view[index], exp_value, sd_instance)
+                return False
+
+        # Note: Python numbers are compared exactly
+        smallest, largest = min(view), max(view)
+        # Note: 'min()' and 'max()' do not detect NaN, which fails every comparison
+        if item_type is float:
+            total = sum(view)
+            if total != total:
+                return False
+        for comp_func, comp_value in bounds:
+            extreme = smallest if comp_func in (operator.gt, operator.ge) else largest
+            if not comp_func(extreme, comp_value):
+                return False
+        return True
+    except TypeError:
+        # Incomparable bounds are reported by the per-item loop
+        return False
+
+
+# Functions which convert expected values once, when the schema is compiled.
+# Prepare functions must accept two arguments: the expected value from the
+# schema entry and the schemadict instance.
+Validators.PREPARE = {
+    Validators.one_of: _prepare_lookup,
+    Validators.allowed_items: _prepare_lookup,
+    Validators.check_regex_match: _prepare_regex,
+    Validators.check_regex_fullmatch: _prepare_regex,
+}
+
+
+# Predicates decide if a value passes a validator, without raising errors or
+# building messages (see 'schemadict.is_valid()'). Predicates must accept three
+# arguments: the value to be checked, the expected (prepared) value and the
+# schemadict instance. Custom validator functions may be registered as well;
+# validators without predicate are called and errors are caught.
+
+def _pred_is_type(value, exp_type, _):
+    # Note: isinstance(True, int) evaluates to True
+    return isinstance(value, exp_type) and (value is not True or exp_type is bool)
+
+
+def _pred_one_of(value, allowed_values, _):
+    try:
+        return value in allowed_values
+    except TypeError:
+        return False
+
+
+def _pred_allowed_items(values, allowed_items, _):
+    if isinstance(allowed_items, frozenset):
+        try:
+            return allowed_items.issuperset(values)
+        except TypeError:
+            return False
+    return all(value in allowed_items for value in values)
+
+
+def _pred_regex_match(string, pattern, _):
+    return pattern.match(string) is not None
+
+
+def _pred_regex_fullmatch(string, pattern, _):
+    return pattern.fullmatch(string) is not None
+
+
+def _pred_item_types(iterable, exp_item_type, _):
+    return all(issubclass(item_type, exp_item_type) for item_type in set(map(type, iterable)))
+
+
+def _pred_item_schema(iterable, item_schema, sd_instance):
+    checks = sd_instance._compile_entry(item_schema)
+    if sd_instance.sampling is not None:
+        iterable = _sample_items(iterable, sd_instance)
+    if len(iterable) >= _VECTORIZE_MIN_ITEMS:
+        try:
+            if _check_items_vectorized('', iterable, checks, sd_instance):
+                return True
+        except (KeyError, TypeError, ValueError):
+            return False
+    find_error = sd_instance._find_value_error
+    return all(find_error('', item, checks) is None for item in iterable)
+
+
+def _pred_item_schemadict(iterable, item_schema, sd_instance):
+    child = sd_instance._child_schemadict(item_schema)
+    plan = child._get_plan()
+    if sd_instance.sampling is not None:
+        iterable = _sample_items(iterable, sd_instance)
+    return all(child._find_cached_error(item, plan) is None for item in iterable)
+
+
+def _pred_schemadict(testdict, schema, sd_instance):
+    child = sd_instance._child_schemadict(schema)
+    return child._find_cached_error(testdict, child._get_plan()) is None
+
+
+Validators.PREDICATES = {
+    Validators.is_type: _pred_is_type,
+    Validators.one_of: _pred_one_of,
+    Validators.allowed_items: _pred_allowed_items,
+    Validators.is_gt: lambda value, comp_value, _: value > comp_value,
+    Validators.is_lt: lambda value, comp_value, _: value < comp_value,
+    Validators.is_ge: lambda value, comp_value, _: value >= comp_value,
+    Validators.is_le: lambda value, comp_value, _: value <= comp_value,
+    Validators.has_min_len: lambda value, min_len, _: len(value) >= min_len,
+    Validators.has_max_len: lambda value, max_len, _: len(value) <= max_len,
+    Validators.check_regex_match: _pred_regex_match,
+    Validators.check_regex_fullmatch: _pred_regex_fullmatch,
+    Validators.check_item_types: _pred_item_types,
+    Validators.check_item_schema: _pred_item_schema,
+    Validators.check_item_schemadict: _pred_item_schemadict,
+    Validators.check_schemadict: _pred_schemadict,
+}
+
+
 class SpecialValidators:
     """
     Collection of special validator functions
@@ -183,16 +680,254 @@ class SpecialValidators:
     Args:
         :sd_key: special key from the schemadict
         :sd_value: special value from the schemadict
-        :sd_instance: instance of the schemadict from which tests are called
+        :context: validation context (see `ValidationContext`)
+
+    Note:
+        * The validation context provides the test dictionary ('testdict')
+          and gives access to all attributes of the schemadict instance from
+          which tests are called
     """
 
     @staticmethod
-    def check_req_keys_in_dict(sd_key, req_keys, sd_instance):
+    def check_req_keys_in_dict(sd_key, req_keys, context):
         """Check that required keys are in a test dictionary"""
-        testdict_keys = list(sd_instance.testdict.keys())
-        for req_key in req_keys:
-            if req_key not in testdict_keys:
-                raise KeyError(f"{sd_key!r}: required key {req_key!r} not found")
+        req_keys = _prepare_key_set(req_keys, None)
+        if req_keys.difference(context.testdict):
+            # Report the first missing key in the declared order
+            testdict = context.testdict
+            req_key = next(key for key in getattr(req_keys, 'order', req_keys) if key not in testdict)
+            raise KeyError(f"{sd_key!r}: required key {req_key!r} not found")
+
+    @staticmethod
+    def check_allowed_keys(sd_key, allowed_keys, context):
+        """Check that a test dictionary has no other keys than the allowed keys"""
+        other_keys = context.testdict.keys() - _prepare_key_set(allowed_keys, None)
+        if other_keys:
+            other_key = min(other_keys, key=str)
+            raise KeyError(f"{sd_key!r}: key {other_key!r} not allowed")
+
+    @staticmethod
+    def check_keys_in_schema(sd_key, schema_keys, context):
+        """Check that a test dictionary has no other keys than the schema"""
+        SpecialValidators.check_allowed_keys(sd_key, schema_keys, context)
+
+
+class _KeySet(frozenset):
+    """Frozenset of keys which remembers the declared order of the keys"""
+
+    def __new__(cls, keys):
+        keys = tuple(dict.fromkeys(keys))
+        key_set = super().__new__(cls, keys)
+        key_set.order = keys
+        return key_set
+
+    def __reduce__(self):
+        return (self.__class__, (self.order,))
+
+
+def _prepare_key_set(keys, _):
+    """Return a frozenset of keys (a '_KeySet' if the keys are not a frozenset)"""
+
+    if isinstance(keys, frozenset):
+        return keys
+    return _KeySet(keys)
+
+
+def _prepare_strict(is_strict, sd_instance):
+    """Return the keys of the schemadict if strict mode is enabled"""
+
+    if isinstance(is_strict, frozenset):
+        return is_strict
+    if not is_strict:
+        return None
+    return frozenset(key for key in sd_instance if not key.startswith('$'))
+
+
+# Functions which convert special values once (see 'Validators.PREPARE'). If
+# the converted value is None, the special key is not checked.
+SpecialValidators.PREPARE = {
+    SpecialValidators.check_req_keys_in_dict: _prepare_key_set,
+    SpecialValidators.check_allowed_keys: _prepare_key_set,
+    SpecialValidators.check_keys_in_schema: _prepare_strict,
+}
+
+# Predicates for special validators (see 'Validators.PREDICATES'). Special
+# predicates must accept two arguments: the special (prepared) value from the
+# schemadict and the validation context.
+SpecialValidators.PREDICATES = {
+    SpecialValidators.check_req_keys_in_dict:
+        lambda req_keys, context: not req_keys.difference(context.testdict),
+    SpecialValidators.check_allowed_keys:
+        lambda allowed_keys, context: allowed_keys.issuperset(context.testdict),
+    SpecialValidators.check_keys_in_schema:
+        lambda schema_keys, context: schema_keys.issuperset(context.testdict),
+}
+
+
+class ValidationContext:
+    """
+    State of a single validation call
+
+    The test dictionary is kept in the context rather than in the schemadict
+    instance, so that a schemadict can be used from multiple threads at the
+    same time. Attributes which are not defined by the context are looked up
+    on the schemadict instance.
+
+    Attributes:
+        :schema: schemadict instance from which tests are called
+        :testdict: test dictionary
+    """
+
+    __slots__ = ('schema', 'testdict')
+
+    def __init__(self, schema, testdict):
+        self.schema = schema
+        self.testdict = testdict
+
+    def __getattr__(self, name):
+        return getattr(self.schema, name)
+
+
+class SamplingPolicy:
+    """
+    Policy for validating only a sample of the items of large lists
+
+    Sampling applies to the keywords 'item_schema' and 'item_schemadict'. The
+    first 'head' and the last 'tail' items are always checked. Of the
+    remaining items, every 'stride'-th item is checked if 'stride' is given,
+    otherwise a random sample with the fraction 'rate' is checked. Random
+    samples are reproducible for a given 'seed'. Lists with fewer than
+    'min_items' items are checked completely.
+
+    Args:
+        :head: (int) number of leading items which are always checked
+        :tail: (int) number of trailing items which are always checked
+        :rate: (float) fraction of the remaining items to check (0 to 1)
+        :stride: (int) check every 'stride'-th remaining item (instead of 'rate')
+        :seed: seed for the random sample
+        :min_items: (int) minimum length of lists which are sampled
+
+    Note:
+        * Sampling is a tripwire for trusted producers, invalid items which
+          are not sampled remain undetected
+        * Only lists and tuples are sampled
+    """
+
+    def __init__(self, head=10, tail=10, rate=0.01, stride=None, seed=0, min_items=1000):
+        if head < 0 or tail < 0:
+            raise ValueError("'head' and 'tail' must not be negative")
+        if not 0 <= rate <= 1:
+            raise ValueError(f"invalid rate {rate!r}: must be between 0 and 1")
+        if stride is not None and stride < 1:
+            raise ValueError(f"invalid stride {stride!r}: must be a positive integer")
+        self.head = head
+        self.tail = tail
+        self.rate = rate
+        self.stride = stride
+        self.seed = seed
+        self.min_items = min_items
+
+    def indices(self, num_items):
+        """
+        Return the indices of the items to check
+
+        Args:
+            :num_items: (int) length of the list
+
+        Returns:
+            :indices: range or sorted list of indices
+        """
+
+        if num_items < self.min_items or num_items <= self.head + self.tail:
+            return range(num_items)
+
+        middle = range(self.head, num_items - self.tail)
+        if self.stride is not None:
+            sampled = middle[::self.stride]
+        else:
+            import random
+            sampled = sorted(random.Random(self.seed).sample(middle, round(self.rate*len(middle))))
+        return [*range(self.head), *sampled, *range(num_items - self.tail, num_items)]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(head={self.head!r}, tail={self.tail!r}, " +
+            f"rate={self.rate!r}, stride={self.stride!r}, seed={self.seed!r}, " +
+            f"min_items={self.min_items!r})"
+        )
+
+
+class SamplingReport:
+    """
+    Coverage achieved by a sampled validation (see `schemadict.validate_sampled()`)
+
+    Attributes:
+        :num_lists: (int) number of checked lists ('item_schema', 'item_schemadict')
+        :num_items: (int) total number of items in these lists
+        :num_checked: (int) number of items which were checked
+    """
+
+    def __init__(self):
+        self.num_lists = 0
+        self.num_items = 0
+        self.num_checked = 0
+
+    @property
+    def coverage(self):
+        """Fraction of checked items (1.0 if there were no items)"""
+
+        if not self.num_items:
+            return 1.0
+        return self.num_checked/self.num_items
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(lists={self.num_lists}, items={self.num_items}, " +
+            f"checked={self.num_checked}, coverage={self.coverage:.2%})"
+        )
+
+
+def _sample_items(iterable, sd_instance):
+    """Return the items of a list which are checked with the sampling policy"""
+
+    items = iterable
+    if isinstance(iterable, (list, tuple)):
+        indices = sd_instance.sampling.indices(len(iterable))
+        if len(indices) < len(iterable):
+            items = [iterable[i] for i in indices]
+
+    report = sd_instance._sampling_report
+    if report is not None:
+        report.num_lists += 1
+        report.num_items += len(iterable)
+        report.num_checked += len(items)
+    return items
+
+
+class _SampledValidation:
+    """
+    Schemadict with a sampling policy and a coverage report for a single call
+
+    Attributes which are not defined here are looked up on the schemadict
+    instance (compare `ValidationContext`).
+    """
+
+    __slots__ = ('schema', 'sampling', '_sampling_report')
+
+    def __init__(self, schema, sampling, report):
+        self.schema = schema
+        self.sampling = sampling
+        self._sampling_report = report
+
+    def __getattr__(self, name):
+        return getattr(self.schema, name)
+
+    def _child_schemadict(self, schema):
+        child = self.schema._child_schemadict(schema)
+        return _SampledValidation(child, self.sampling, self._sampling_report)
+
+    def validate(self, testdict):
+        schemadict._validate(self, testdict, self.schema._get_plan())
 
 
 class ValidatorDict(OrderedDict):
@@ -200,10 +935,121 @@ class ValidatorDict(OrderedDict):
     Use to map 'type' (=key) and validator functions
 
     Raise 'SchemaError' if meta schema for 'type' is not defined.
+
+    Note:
+        * Mappings of keywords and validator functions (plain dictionaries)
+          are converted to '_TypeValidators'. Modifications of any validator
+          dictionary increase the class attribute 'generation', so that
+          schemadicts can discard compiled plans and cached results.
+        * Mappings which are shared between types (e.g. for 'int' and
+          'float') remain shared
+        * Validators for a subclass of a registered type are found with
+          'for_type()' which follows the method resolution order
     """
+
+    generation = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._mro_cache = {}
+        self._mro_generation = None
+        self.update(*args, **kwargs)
+
+    @classmethod
+    def _touch(cls):
+        cls.generation += 1
+
+    def for_type(self, cls):
+        """
+        Return the validator functions for a type
+
+        If 'cls' is not registered, the validators of the first registered
+        class in the method resolution order of 'cls' are returned. Results
+        are cached per class until any validator dictionary is modified.
+
+        Args:
+            :cls: type/class
+
+        Returns:
+            :validators: mapping of keywords and validator functions
+
+        Raises:
+            :SchemaError: if no validators are defined for 'cls' or its base classes
+        """
+
+        if self._mro_generation != ValidatorDict.generation:
+            self._mro_cache = {}
+            self._mro_generation = ValidatorDict.generation
+
+        try:
+            return self._mro_cache[cls]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable 'type' values are never registered
+            raise SchemaError(f"validator functions not defined for {cls!r}") from None
+
+        if cls in self:
+            validators = self[cls]
+        else:
+            for base in getattr(cls, '__mro__', ())[1:]:
+                if base in self:
+                    validators = self[base]
+                    break
+            else:
+                validators = self[cls]
+
+        self._mro_cache[cls] = validators
+        return validators
+
     def __missing__(self, key):
         raise SchemaError(f"validator functions not defined for {key!r}")
 
+    def __reduce__(self):
+        # Note: the cache of 'for_type()' is not pickled (or copied), it may
+        # refer to local classes which cannot be pickled
+        cls, args, state, *items = super().__reduce__()
+        if state:
+            state = {
+                name: value for name, value in state.items()
+                if name not in ('_mro_cache', '_mro_generation')
+            } or None
+        return (cls, args, state, *items)
+
+    def __setitem__(self, key, value):
+        self.update({key: value})
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touch()
+
+    def update(self, *args, **kwargs):
+        converted = {}
+        for key, value in dict(*args, **kwargs).items():
+            if type(value) is dict:
+                if id(value) not in converted:
+                    converted[id(value)] = _TypeValidators(value)
+                value = converted[id(value)]
+            super().__setitem__(key, value)
+        self._touch()
+
+    def pop(self, *args):
+        self._touch()
+        return super().pop(*args)
+
+    def popitem(self, *args, **kwargs):
+        self._touch()
+        return super().popitem(*args, **kwargs)
+
+    def clear(self):
+        self._touch()
+        super().clear()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
     def register_type(self, new_type, add_val={}):
         """
         Register a new type
@@ -216,6 +1062,42 @@ class ValidatorDict(OrderedDict):
         self.update({new_type: {**Validators.FOR_TYPE, **add_val}})
 
 
+class _TypeValidators(dict):
+    """
+    Mapping of keywords and validator functions for a type
+
+    Modifications are tracked with 'ValidatorDict.generation'.
+    """
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        ValidatorDict._touch()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        ValidatorDict._touch()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        ValidatorDict._touch()
+
+    def pop(self, *args):
+        ValidatorDict._touch()
+        return super().pop(*args)
+
+    def popitem(self):
+        ValidatorDict._touch()
+        return super().popitem()
+
+    def clear(self):
+        ValidatorDict._touch()
+        super().clear()
+
+    def setdefault(self, key, default=None):
+        ValidatorDict._touch()
+        return super().setdefault(key, default)
+
+
 # Check if instance is one of a set
 _VAL_ONE_OF = {'one_of': Validators.one_of}
 
@@ -241,6 +1123,7 @@ _VAL_STRING = {
     **_VAL_COUNTABLE,
     **_VAL_ONE_OF,
     'regex': Validators.check_regex_match,
+    'regex_full': Validators.check_regex_fullmatch,
 }
 
 # Check iterable objects (list, tuple)
@@ -253,58 +1136,740 @@ _VAL_ITERABLE = {
     'allowed_items': Validators.allowed_items,
 }
 
+# Check bytes-like objects (bytes, bytearray, memoryview, array.array)
+_VAL_BUFFER = {
+    **_VAL_COUNTABLE,
+    'format': Validators.check_buffer_format,
+    'item_types': Validators.check_buffer_item_types,
+    'item_schema': Validators.check_buffer_item_schema,
+}
+
+_VAL_ARRAY = {
+    **_VAL_BUFFER,
+    'typecode': Validators.check_typecode,
+}
+
 _VAL_SUBSCHEMA = {
     **Validators.FOR_TYPE,
     'schema': Validators.check_schemadict,
 }
 
+# Validators which check each item with a schema entry ('item_schema')
+_ITEM_SCHEMA_CHECKS = (
+    Validators.check_item_schema,
+    Validators.check_buffer_item_schema,
+)
+
 # Validators for primitive types
 STANDARD_VALIDATORS = ValidatorDict({
     # TODO: move special validators to separate dict!?
     '$required_keys': SpecialValidators.check_req_keys_in_dict,
-    '$allowed_keys': ...,  # TODO
+    '$allowed_keys': SpecialValidators.check_allowed_keys,
+    '$strict': SpecialValidators.check_keys_in_schema,
     Number: _VAL_NUM_REL,
+    array.array: _VAL_ARRAY,
     bool: Validators.FOR_TYPE,
+    bytearray: _VAL_BUFFER,
+    bytes: _VAL_BUFFER,
     dict: _VAL_SUBSCHEMA,
     float: _VAL_NUM_REL,
     int: _VAL_NUM_REL,
     list: _VAL_ITERABLE,
+    memoryview: _VAL_BUFFER,
     str: _VAL_STRING,
     tuple: _VAL_ITERABLE,
 })
 
 
-class schemadict(MutableMapping):
+# Validation plan of a schemadict (see 'schemadict.compile()')
+# * special_checks: tuples (special validator function, special key, special value)
+# * key_checks: tuples (key, checks), where 'checks' are tuples (validator function, expected value)
+# * checks_by_key: mapping of keys and checks
+# * generation: 'ValidatorDict.generation' when the plan was compiled
+_Plan = namedtuple('_Plan', ['special_checks', 'key_checks', 'checks_by_key', 'generation'])
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _describe(obj, stack):
     """
-    A *schemadict* is a dictionary that specifies the type and format of values
-    for some given key. To check if a test dictionary is conform with the
-    expected schema, *schemadict* provides the `validate()` method. If the test
-    dictionary is ill-defined, an error will be thrown, otherwise `None` is
-    returned.
+    Return a deterministic description of a schema value (see 'fingerprint()')
+
+    Types and functions are described by their module and qualified name.
+    Objects without a specific description are described by 'repr()'.
     """
 
-    def __init__(self, *args, validators=STANDARD_VALIDATORS, **kwargs):
+    if isinstance(obj, (str, bytes, int, float, complex, type(None))):
+        return f"{type(obj).__name__}:{obj!r}"
+    if isinstance(obj, type) or (callable(obj) and hasattr(obj, '__qualname__')):
+        owner = getattr(obj, '__self__', None)
+        if isinstance(owner, type):
+            return f"{_describe(owner, stack)}.{obj.__name__}"
+        return f"{getattr(obj, '__module__', None)}:{obj.__qualname__}"
+    if hasattr(obj, 'pattern') and hasattr(obj, 'flags'):
+        return f"Pattern:{obj.pattern!r}:{obj.flags}"
+
+    if id(obj) in stack:
+        return '<recursion>'
+    stack = (*stack, id(obj))
+    if isinstance(obj, Mapping):
+        items = ','.join(f"{_describe(k, stack)}:{_describe(v, stack)}" for k, v in obj.items())
+        return f"{{{items}}}"
+    if isinstance(obj, (list, tuple)):
+        return f"{type(obj).__name__}[{','.join(_describe(item, stack) for item in obj)}]"
+    if isinstance(obj, (set, frozenset)):
+        return f"{type(obj).__name__}[{','.join(sorted(_describe(item, stack) for item in obj))}]"
+    return repr(obj)
+
+
+class _ResultCache:
+    """
+    Bounded LRU cache of validation outcomes (see `schemadict.enable_cache()`)
+
+    Outcomes are stored by a content hash of the test dictionary (or of raw
+    bytes provided by the caller). The outcome is None for valid test
+    dictionaries, otherwise the exception (without traceback) or '_INVALID'
+    if the error has not been built.
+
+    Note:
+        * Outcomes must not refer to test dictionaries. These belong to the
+          caller, and may be modified or be large.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._generation = ValidatorDict.generation
+        import threading
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(testdict, cache_key=None):
+        """
+        Return the cache key for a test dictionary, or None if the test
+        dictionary cannot be hashed
+
+        Args:
+            :testdict: test dictionary
+            :cache_key: (bytes) raw bytes from which the test dictionary was
+                        decoded (optional)
+        """
+
+        import hashlib
+        import pickle
+
+        if cache_key is None:
+            try:
+                cache_key = pickle.dumps(testdict, protocol=4)
+            except Exception:
+                return None
+        return hashlib.blake2b(cache_key, digest_size=16).digest()
+
+    def get(self, key, need_error=False):
+        """
+        Return a tuple (found, outcome)
+
+        Args:
+            :key: cache key (see `make_key()`)
+            :need_error: (bool) if True, an '_INVALID' outcome is counted as
+                         a miss, since the error must be built again
+        """
+
+        if key is None:
+            return False, None
+        with self._lock:
+            if self._generation != ValidatorDict.generation:
+                self._clear()
+            if key in self._results:
+                self._results.move_to_end(key)
+                outcome = self._results[key]
+                if need_error and outcome is _INVALID:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                return True, outcome
+            self.misses += 1
+            return False, None
+
+    def put(self, key, outcome):
+        if key is None:
+            return
+        with self._lock:
+            self._results[key] = outcome
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self._results.clear()
+        self._generation = ValidatorDict.generation
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+
+# Cached outcome of an invalid test dictionary for which no error was built
+_INVALID = object()
+
+
+def _copy_error(error):
+    """
+    Return a copy of an exception (or None)
+
+    Note:
+        * Cached exceptions are never raised, raising would attach a
+          traceback to the cached exception
+    """
+
+    if error is None:
+        return None
+    import copy
+    try:
+        return copy.copy(error)
+    except Exception:
+        # Exceptions which cannot be rebuilt from their arguments
+        return error.with_traceback(None)
+
+
+class LazyError:
+    """
+    Validation error which is only materialized when it is accessed
+
+    The error message is built (by calling the failing validator function
+    again) only when the error is read, e.g. with `str()` or `exception`.
+
+    Args:
+        :func: validator function which failed
+        :args: arguments for the validator function
+    """
+
+    __slots__ = ('_func', '_args', '_exception')
+
+    def __init__(self, func, *args):
+        self._func = func
+        self._args = args
+        self._exception = None
+
+    @classmethod
+    def from_exception(cls, exception):
+        """Wrap an exception which has already been raised"""
+
+        error = cls(None)
+        error._exception = exception
+        return error
+
+    @property
+    def exception(self):
+        """Exception raised by `validate()` (built on first access)"""
+
+        if self._exception is None:
+            try:
+                self._func(*self._args)
+            except (KeyError, TypeError, ValueError) as e:
+                self._exception = e
+            else:
+                # Predicate and validator function disagree
+                self._exception = ValueError(
+                    f"{self._func.__qualname__} failed for arguments {self._args!r}"
+                )
+        return self._exception
+
+    @property
+    def message(self):
+        return str(self.exception)
+
+    def raise_error(self):
+        """Raise the exception"""
+
+        raise self.exception
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}({self.exception!r})"
+
+
+class BatchResult:
+    """
+    Result of a batch validation (see `schemadict.validate_many()`)
+
+    Attributes:
+        :valid: (bytearray) one flag per record (1 if valid, 0 if invalid)
+        :errors: (dict) errors of invalid records keyed by record index
+    """
+
+    def __init__(self):
+        self.valid = bytearray()
+        self.errors = {}
+
+    def append(self, error):
+        """
+        Add the outcome of the next record
+
+        Args:
+            :error: error raised for the record, or None if the record is valid
+        """
+
+        if error is not None:
+            self.errors[len(self.valid)] = error
+        self.valid.append(error is None)
+
+    def __len__(self):
+        return len(self.valid)
+
+    @property
+    def num_invalid(self):
+        return len(self.errors)
+
+    @property
+    def num_valid(self):
+        return len(self.valid) - len(self.errors)
+
+    @property
+    def all_valid(self):
+        return not self.errors
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(records={len(self)}, " +
+            f"valid={self.num_valid}, invalid={self.num_invalid})"
+        )
+
+
+ProfileRecord = namedtuple('ProfileRecord', ['path', 'keyword', 'calls', 'time', 'failures'])
+
+
+class _ProfileEntry:
+    """Mutable counters for a single (path, keyword) pair"""
+
+    __slots__ = ('calls', 'time', 'failures')
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.failures = 0
+
+
+class ProfileStats:
+    """
+    Validation statistics per schema path and validator keyword
+
+    Statistics are collected by a schemadict with enabled profiling (see
+    `schemadict.enable_profiling()`). Paths of nested schemas are joined with
+    '.', items of 'item_schemadict' lists are marked with '[]' (e.g.
+    'cities[].name'). Special keys are recorded for the path of their schema
+    ('' for the top level).
+
+    Args:
+        :hook: function called after each check with the arguments
+               (path, keyword, elapsed time, failed) or None
+
+    Note:
+        * Times are cumulative: the time of a nested schema (e.g. keyword
+          'schema') includes the time of all checks of the nested schema
+        * Counters are not locked, counts may be slightly off if a
+          schemadict is used by several threads at the same time
+    """
+
+    def __init__(self, hook=None):
+        self.hook = hook
+        self._entries = {}
+
+    def _entry(self, path, keyword):
+        entry = self._entries.get((path, keyword), None)
+        if entry is None:
+            entry = self._entries[(path, keyword)] = _ProfileEntry()
+        return entry
+
+    def wrap(self, func, path, keyword):
+        """
+        Return a validator function which records calls of 'func'
+
+        Args:
+            :func: validator function
+            :path: (str) schema path
+            :keyword: validator keyword (or special key)
+
+        Returns:
+            :profiled: wrapped validator function
+        """
+
+        entry = self._entry(path, keyword)
+        hook = self.hook
+        perf_counter = time.perf_counter
+
+        def profiled(*args):
+            failed = True
+            start = perf_counter()
+            try:
+                result = func(*args)
+                failed = False
+                return result
+            finally:
+                elapsed = perf_counter() - start
+                entry.calls += 1
+                entry.time += elapsed
+                entry.failures += failed
+                if hook is not None:
+                    hook(path, keyword, elapsed, failed)
+
+        profiled.__wrapped__ = func
+        return profiled
+
+    def records(self):
+        """Return a list of 'ProfileRecord' for all checks"""
+
+        return [
+            ProfileRecord(path, keyword, entry.calls, entry.time, entry.failures)
+            for (path, keyword), entry in self._entries.items()
+        ]
+
+    def top(self, n=10, sort_by='time'):
+        """
+        Return the most expensive checks
+
+        Args:
+            :n: (int) number of records
+            :sort_by: (str) 'time', 'calls' or 'failures'
+
+        Returns:
+            :records: list of 'ProfileRecord' in descending order
+        """
+
+        if sort_by not in ('time', 'calls', 'failures'):
+            raise ValueError(f"invalid sort key {sort_by!r}")
+        return sorted(self.records(), key=operator.attrgetter(sort_by), reverse=True)[:n]
+
+    def report(self, n=10, sort_by='time'):
+        """Return a table of the most expensive checks (see `top()`)"""
+
+        lines = [f"{'path':<30} {'keyword':<16} {'calls':>10} {'time [ms]':>12} {'failures':>10}"]
+        for record in self.top(n, sort_by):
+            lines.append(
+                f"{record.path:<30} {str(record.keyword):<16} {record.calls:>10} " +
+                f"{record.time*1e3:>12.3f} {record.failures:>10}"
+            )
+        return '\n'.join(lines)
+
+    def reset(self):
+        """Reset all counters"""
+
+        for entry in self._entries.values():
+            entry.calls = 0
+            entry.time = 0.0
+            entry.failures = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(checks={len(self._entries)})"
+
+
+class _FrozenEntry(dict):
+    """
+    Read-only schema entry which is shared between schemadicts (see
+    `schemadict.compact()`)
+
+    Compiled checks are stored with the entry, so that they are shared as
+    well. Frozen entries are pickled (and copied) as plain dictionaries.
+    """
+
+    __slots__ = ('_hash', '_compiled', '__weakref__')
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("compacted schema entries are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+# Interned schema entries (see '_intern()'), created on first use
+_INTERNED = None
+
+
+def _intern_key(value):
+    """Return a hashable key which identifies an (interned) value"""
+
+    if isinstance(value, (_FrozenEntry, MutableMapping)):
+        return id(value)
+    if type(value) is tuple:
+        return (tuple, tuple(map(_intern_key, value)))
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    return (type(value), value)
+
+
+def _intern(value, _stack=()):
+    """
+    Return a shared, immutable equivalent of a schema value
+
+    Mappings are converted to interned '_FrozenEntry' instances and lists to
+    tuples (recursively). Schemadicts are compacted in place. Other values are
+    returned as they are. Recursive schemas are kept where they refer to
+    themselves. Default values of schema entries are kept as they are (a list
+    default must remain a list).
+    """
+
+    if id(value) in _stack:
+        return value
+    if isinstance(value, schemadict):
+        value._compact(_stack)
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_intern(item, _stack) for item in value)
+    if isinstance(value, _FrozenEntry) or not isinstance(value, Mapping):
+        return value
+
+    global _INTERNED
+    if _INTERNED is None:
+        import weakref
+        _INTERNED = weakref.WeakValueDictionary()
+
+    _stack = (*_stack, id(value))
+    # Note: in nested schemas, 'default' may also be a key of the test dictionary
+    is_entry = 'type' in value and not isinstance(value['type'], Mapping)
+    items = [
+        (key, item if is_entry and key == 'default' else _intern(item, _stack))
+        for key, item in value.items()
+    ]
+    key = frozenset((key, _intern_key(item)) for key, item in items)
+    entry = _INTERNED.get(key, None)
+    if entry is None:
+        entry = _FrozenEntry(items)
+        entry._hash = hash(key)
+        _INTERNED[key] = entry
+    return entry
+
+
+Footprint = namedtuple('Footprint', ['entries', 'distinct_entries', 'size'])
+
+
+def footprint(*schemas):
+    """
+    Return the memory footprint of one or more schemadicts
+
+    Objects which are shared between schemadicts (e.g. interned entries, see
+    `schemadict.compact()`) are counted once. Compiled validation plans are
+    included. Types, functions and validator dictionaries are not counted.
+
+    Args:
+        :schemas: schemadict instances
+
+    Returns:
+        :footprint: named tuple (entries, distinct_entries, size), where
+                    'entries' is the number of schema entries (including
+                    nested entries), 'distinct_entries' the number of distinct
+                    entry objects and 'size' the size in bytes
+    """
+
+    import types
+
+    # Objects which are shared globally are not counted
+    shared_types = (
+        type, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+        types.ModuleType, ValidatorDict,
+    )
+    entry_ids = []
+
+    def count_entries(schema, stack):
+        # Recursive schemas are counted once
+        if id(schema) in stack:
+            return
+        stack = (*stack, id(schema))
+        for sd_key, sd_value in schema.items():
+            if isinstance(sd_key, str) and not sd_key.startswith('$'):
+                count_entry(sd_value, stack)
+
+    def count_entry(sd_value, stack):
+        if not isinstance(sd_value, Mapping):
+            return
+        entry_ids.append(id(sd_value))
+        for keyword in ('schema', 'item_schemadict'):
+            if isinstance(sd_value.get(keyword, None), Mapping):
+                count_entries(sd_value[keyword], stack)
+        if sd_value.get('item_schema', None) is not None:
+            count_entry(sd_value['item_schema'], stack)
+
+    seen = set()
+    size = 0
+    stack = list(schemas)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, shared_types):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, schemadict):
+            # Result caches and generated functions are not part of the schema
+            stack.extend((obj.mapping, obj._plan, obj._entry_plans, obj._children))
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+            if isinstance(obj, _FrozenEntry):
+                stack.append(getattr(obj, '_compiled', None))
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+
+    for schema in schemas:
+        count_entries(schema, ())
+    return Footprint(len(entry_ids), len(set(entry_ids)), size)
+
+
+# Template for default value dictionaries (see 'schemadict.get_default_value_dict()')
+_Defaults = namedtuple('_Defaults', ['static', 'factories', 'nested'])
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), frozenset, type)
+
+
+def _is_immutable(value):
+    if isinstance(value, tuple):
+        return all(map(_is_immutable, value))
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+def _copy_factory(value):
+    """Return a function which returns a copy of a mutable default value"""
+
+    import copy
+    return lambda: copy.deepcopy(value)
+
+
+# Keywords which may be used in any schema entry
+_META_KEYWORDS = frozenset(('type', 'default'))
+
+
+def _did_you_mean(word, candidates):
+    """Return a suggestion for a misspelled keyword (or an empty string)"""
+
+    import difflib
+    matches = difflib.get_close_matches(word, [str(c) for c in candidates], n=1)
+    return f" (did you mean {matches[0]!r}?)" if matches else ''
+
+
+class schemadict(MutableMapping):
+    """
+    A *schemadict* is a dictionary that specifies the type and format of values
+    for some given key. To check if a test dictionary is conform with the
+    expected schema, *schemadict* provides the `validate()` method. If the test
+    dictionary is ill-defined, an error will be thrown, otherwise `None` is
+    returned.
+
+    Validation does not store any state in the schemadict instance (see
+    `ValidationContext`). A schemadict may be shared between threads, as long
+    as it is not modified during validation.
+
+    Args:
+        :validators: validator dictionary (see `STANDARD_VALIDATORS`)
+        :regex_flags: flags used to compile 'regex' patterns (e.g. `re.I`)
+        :trusted: (bool) if True, schema entries are not checked (see note)
+        :sampling: `SamplingPolicy` for large lists (default: check all items)
+
+    Raises:
+        :SchemaError: if a schema entry is ill-defined
+
+    Note:
+        * Schema entries are checked once when they are added (meta schema
+          validation): entries must define a 'type' for which validators
+          exist, all keywords must be known for that type, and special keys
+          must be known. Nested schemas are checked recursively. Use
+          'trusted=True' to skip the checks for schemas which are known to be
+          well-defined (e.g. loaded from a verified source).
+        * Before the first validation, the schema is compiled into a
+          validation plan (see `compile()`). The plan is cached and discarded
+          whenever the schemadict is modified.
+    """
+
+    __slots__ = (
+        'mapping', '_validators', '_regex_flags', '_sampling', '_trusted', '_plan',
+        '_entry_plans', '_children', '_generated_validator', '_cache', '_profiler',
+        '_profile_prefix', '_defaults', '__weakref__',
+    )
+
+    # Coverage report of the current call (see '_SampledValidation')
+    _sampling_report = None
+
+    def __init__(self, *args, validators=STANDARD_VALIDATORS, regex_flags=0, trusted=False,
+                 sampling=None, **kwargs):
         self.mapping = {}
-        self.update(*args, **kwargs)
+        self._regex_flags = regex_flags
+        self._sampling = sampling
+        self._trusted = trusted
+        self._plan = None
+        self._entry_plans = None
+        self._children = None
+        self._generated_validator = None
+        self._cache = None
+        self._profiler = None
+        self._profile_prefix = ''
+        self._defaults = None
 
         # Default validator functions (map validator functions to keywords for each type)
         self.validators = validators
-        self.testdict = None
+        self.update(*args, **kwargs)
+
+    @property
+    def validators(self):
+        return self._validators
+
+    @validators.setter
+    def validators(self, validators):
+        old_validators = getattr(self, '_validators', None)
+        self._validators = validators
+        if not self._trusted:
+            try:
+                for sd_key, sd_value in self.mapping.items():
+                    self._check_schema_entry(sd_key, sd_value)
+            except SchemaError:
+                self._validators = old_validators
+                raise
+        self._invalidate()
+
+    @property
+    def regex_flags(self):
+        return self._regex_flags
+
+    @regex_flags.setter
+    def regex_flags(self, regex_flags):
+        self._regex_flags = regex_flags
+        self._invalidate()
+
+    @property
+    def sampling(self):
+        return self._sampling
+
+    @sampling.setter
+    def sampling(self, sampling):
+        self._sampling = sampling
+        self._invalidate()
 
     def __setitem__(self, key, value):
         # Only allow string as keys
         if not isinstance(key, str):
             raise SchemaError(f"invalid key {key!r}: must be of type {str}, not {type(key)}")
-        # ============================================================
-        # TODO: Perform meta schema validation here...
-        # ============================================================
+        if not self._trusted:
+            self._check_schema_entry(key, value)
         self.mapping[key] = value
+        self._invalidate()
 
     def __getitem__(self, key):
         return self.mapping[key]
 
     def __delitem__(self, key):
         del self.mapping[key]
+        self._invalidate()
 
     def __iter__(self):
         return iter(self.mapping)
@@ -318,7 +1883,632 @@ class schemadict(MutableMapping):
     def __repr__(self):
         return f"{self.__class__.__qualname__}({self.mapping!r})"
 
-    def validate(self, testdict):
+    def _check_schema_entry(self, sd_key, sd_value, _stack=()):
+        """
+        Check that a schema entry is well-defined (meta schema validation)
+
+        Args:
+            :sd_key: schemadict key
+            :sd_value: schema entry or value of a special key
+            :_stack: identities of the schemas which are being checked
+
+        Raises:
+            :SchemaError: if the schema entry is ill-defined
+        """
+
+        if sd_key.startswith('$'):
+            if sd_key not in self.validators:
+                raise SchemaError(
+                    f"{sd_key!r}: unknown special key" +
+                    _did_you_mean(sd_key, (k for k in self.validators if isinstance(k, str)))
+                )
+            return
+
+        if not isinstance(sd_value, Mapping):
+            raise SchemaError(f"{sd_key!r}: schema entry must be a mapping, not {type(sd_value)}")
+        if 'type' not in sd_value:
+            raise SchemaError(f"{sd_key!r}: schema entry must define a 'type'")
+
+        exp_type = sd_value['type']
+        try:
+            type_validators = self.validators.for_type(exp_type)
+        except (SchemaError, TypeError):
+            raise SchemaError(f"{sd_key!r}: validator functions not defined for type {exp_type!r}")
+
+        for keyword, exp_value in sd_value.items():
+            if keyword in _META_KEYWORDS:
+                continue
+            validator_func = type_validators.get(keyword, None)
+            if validator_func is None:
+                raise SchemaError(
+                    f"{sd_key!r}: unknown keyword {keyword!r} for type {exp_type!r}" +
+                    _did_you_mean(keyword, (*type_validators, *_META_KEYWORDS))
+                )
+
+            # Nested schemas are checked recursively (recursive schemas only once)
+            if exp_value is None or id(exp_value) in _stack:
+                continue
+            if validator_func in _ITEM_SCHEMA_CHECKS:
+                self._check_schema_entry(f"{sd_key}[]", exp_value, _stack)
+            elif validator_func in (Validators.check_schemadict, Validators.check_item_schemadict):
+                if not isinstance(exp_value, Mapping):
+                    raise SchemaError(f"{sd_key!r}: {keyword!r} must be a mapping, not {type(exp_value)}")
+                for nested_key, nested_value in exp_value.items():
+                    if not isinstance(nested_key, str):
+                        raise SchemaError(f"{sd_key!r}: invalid key {nested_key!r} in {keyword!r}")
+                    self._check_schema_entry(nested_key, nested_value, (*_stack, id(exp_value)))
+
+    def compact(self):
+        """
+        Share identical schema entries between schemadicts
+
+        Schema entries (including nested schemas) are replaced by interned,
+        read-only equivalents, and lists (except default values) are replaced
+        by tuples. Identical entries, e.g. `{'type': str}`, are then stored
+        (and compiled) only once, no matter how many schemadicts use them.
+        Entries can still be added, replaced or deleted, but compacted entries
+        cannot be modified in place.
+
+        Returns:
+            :self: the schemadict instance (allows chaining)
+        """
+
+        self._compact(())
+        return self
+
+    def _compact(self, _stack):
+        _stack = (*_stack, id(self))
+        for sd_key, sd_value in self.mapping.items():
+            self.mapping[sd_key] = _intern(sd_value, _stack)
+        self._invalidate()
+
+    def footprint(self):
+        """
+        Return the memory footprint of the schemadict (see `footprint()`)
+
+        Returns:
+            :footprint: named tuple (entries, distinct_entries, size)
+        """
+
+        return footprint(self)
+
+    def _invalidate(self):
+        """Discard the cached validation plan"""
+
+        self._plan = None
+        self._entry_plans = None
+        self._children = None
+        self._generated_validator = None
+        self._defaults = None
+        if self._cache is not None:
+            self._cache.clear()
+
+    def enable_cache(self, maxsize=1024):
+        """
+        Enable a cache of validation outcomes
+
+        Outcomes (valid or invalid) are remembered for test dictionaries with
+        identical content. Test dictionaries are identified by a hash of their
+        pickled content, or by a hash of raw bytes passed as 'cache_key' (see
+        `validate()`). The least recently used outcomes are discarded first.
+        The cache is cleared when the schemadict or any validator dictionary
+        is modified.
+
+        Note:
+            * Only whole test dictionaries are cached, nested schemas (e.g.
+              items of 'item_schemadict') are not. Hashing a small nested
+              dictionary costs more than validating it. For a list of 100k
+              small items, a cache per item made validation slower, even if
+              all items were found in the cache.
+            * A cache pays off if identical test dictionaries are validated
+              repeatedly. Hashing a test dictionary costs roughly a third of
+              validating it (less with 'cache_key'), so the cache makes
+              validation slower if test dictionaries rarely repeat.
+
+        Args:
+            :maxsize: (int) maximum number of cached outcomes
+
+        Returns:
+            :self: the schemadict instance (allows chaining)
+        """
+
+        self._cache = _ResultCache(maxsize)
+        self._invalidate()
+        return self
+
+    def disable_cache(self):
+        """Disable the cache of validation outcomes"""
+
+        self._cache = None
+        self._invalidate()
+
+    def cache_info(self):
+        """
+        Return cache statistics (None if the cache is disabled)
+
+        Returns:
+            :cache_info: named tuple (hits, misses, maxsize, currsize)
+        """
+
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def enable_profiling(self, hook=None):
+        """
+        Enable collection of validation statistics
+
+        Validator functions are wrapped when the validation plan is compiled,
+        so that calls, time and failures are recorded per schema path and
+        keyword (see `ProfileStats`). Nested schemas record to the same
+        statistics. Without profiling, validator functions are not wrapped.
+
+        Args:
+            :hook: function called after each check with the arguments
+                   (path, keyword, elapsed time, failed) or None
+
+        Returns:
+            :stats: instance of `ProfileStats`
+        """
+
+        self._profiler = ProfileStats(hook)
+        self._invalidate()
+        return self._profiler
+
+    def disable_profiling(self):
+        """Disable collection of validation statistics"""
+
+        self._profiler = None
+        self._invalidate()
+
+    @property
+    def profile_stats(self):
+        """Validation statistics (None if profiling is disabled)"""
+
+        return self._profiler
+
+    def compile(self, cache_file=None):
+        """
+        Compile the schemadict into a validation plan
+
+        The plan maps each key to the validator functions (and expected values)
+        which actually apply to the corresponding schema entry. Special keys
+        (starting with '$') are kept separately. The plan is built
+        automatically on first use, but may also be built ahead of time.
+
+        If a 'cache_file' is given, the plans of all nested schemas are
+        compiled as well, and regular expressions (usually the most expensive
+        part of compiling) are loaded from the file. Regular expressions which
+        are not found in the file are compiled as usual and added to the file.
+        A single cache file may be shared by many schemadicts.
+
+        Args:
+            :cache_file: (str, path) file for a persistent regex cache (optional)
+
+        Note:
+            * The plan is discarded automatically if keys are set or deleted,
+              or if a 'ValidatorDict' is modified. However, if schema entries
+              or nested schemas are modified in place, `compile()` must be
+              called again.
+            * Cache files contain the code compiled by the 're' module of the
+              running Python version (CPython only). Files written by other
+              versions are ignored. Cache files are pickle files: only use
+              cache files from trusted locations.
+
+        Returns:
+            :self: the schemadict instance (allows chaining)
+        """
+
+        self._invalidate()
+        if cache_file is None or self._profiler is not None:
+            self._compile()
+            return self
+
+        from . import _regex_cache
+
+        states = _regex_cache.load(cache_file)
+        for key, state in states.items():
+            if key not in _loaded_regexes:
+                regex = _regex_cache.from_state(key[0], state)
+                if regex is not None:
+                    _loaded_regexes[key] = regex
+
+        new_states = {}
+        for key in self._collect_regexes():
+            if key not in states:
+                state = _regex_cache.get_state(*key)
+                if state is not None:
+                    new_states[key] = state
+        if new_states:
+            _regex_cache.dump(cache_file, {**states, **new_states})
+        return self
+
+    def fingerprint(self):
+        """
+        Return a fingerprint of the schemadict
+
+        The fingerprint is derived from the schema (including nested schemas),
+        the validator dictionary, the regex flags and the package version.
+        Types and functions are identified by their module and qualified name,
+        sets are described in sorted order. The fingerprint is therefore the
+        same in different processes.
+
+        Returns:
+            :fingerprint: (str) hexadecimal digest
+
+        Note:
+            * Objects without a specific description are described by
+              'repr()'. Objects whose representation contains their memory
+              address get a different fingerprint in each process.
+        """
+
+        import hashlib
+        from .__version__ import __version__
+
+        validators = [
+            (key, dict(value) if isinstance(value, dict) else value)
+            for key, value in self.validators.items()
+        ]
+        data = '|'.join((
+            __version__,
+            _describe(self.mapping, ()),
+            _describe(validators, ()),
+            repr(self.regex_flags),
+        )).encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _collect_regexes(self):
+        """
+        Compile the schemadict and all nested schemas
+
+        Returns:
+            :regexes: set of (pattern, flags) of all regular expressions
+        """
+
+        regexes = set()
+        visited = set()
+
+        def visit(sd_instance):
+            if id(sd_instance) in visited:
+                return
+            visited.add(id(sd_instance))
+            for _, checks in sd_instance._get_plan().key_checks:
+                visit_checks(sd_instance, checks)
+
+        def visit_checks(sd_instance, checks):
+            for validator_func, exp_value in checks:
+                if validator_func in _ITEM_SCHEMA_CHECKS:
+                    visit_checks(sd_instance, sd_instance._compile_entry(exp_value))
+                elif validator_func in (Validators.check_schemadict, Validators.check_item_schemadict):
+                    visit(sd_instance._child_schemadict(exp_value))
+                elif validator_func in (Validators.check_regex_match, Validators.check_regex_fullmatch):
+                    regexes.add((exp_value.pattern, int(sd_instance.regex_flags)))
+
+        visit(self)
+        return regexes
+
+    def _get_plan(self):
+        """
+        Return the validation plan
+
+        The plan is compiled if it does not exist yet, or if any validator
+        dictionary has been modified since it was compiled.
+
+        Note:
+            * Other threads may still be validating with the previous plan.
+              A new plan is therefore built separately and replaces the
+              previous one at once, caches are never discarded here.
+        """
+
+        plan = self._plan
+        if plan is None or plan.generation != ValidatorDict.generation:
+            plan = self._compile()
+        return plan
+
+    def _compile(self):
+        """
+        Build, cache and return the validation plan
+
+        Returns:
+            :plan: instance of '_Plan'
+        """
+
+        generation = ValidatorDict.generation
+        entry_plans = {}
+        special_checks = []
+        key_checks = []
+        for sd_key, sd_value in self.items():
+            if sd_key.startswith('$'):
+                special_func = self.validators[sd_key]
+                prepare = SpecialValidators.PREPARE.get(special_func, None)
+                if prepare is not None:
+                    sd_value = prepare(sd_value, self)
+                if sd_value is not None:
+                    special_checks.append((special_func, sd_key, sd_value))
+            else:
+                key_checks.append((sd_key, self._compile_entry(sd_value, entry_plans)))
+
+        if self._profiler is not None:
+            special_checks, key_checks = self._profile_checks(special_checks, key_checks)
+
+        key_checks = tuple(key_checks)
+        plan = _Plan(tuple(special_checks), key_checks, dict(key_checks), generation)
+        self._entry_plans = entry_plans or None
+        self._plan = plan
+        return plan
+
+    def _profile_checks(self, special_checks, key_checks):
+        """
+        Wrap all validator functions of a plan for profiling
+
+        Nested schemadicts are created ahead of time, so that they record to
+        the same statistics with the path of the nested schema.
+        """
+
+        profiler = self._profiler
+        path = self._profile_prefix.rstrip('.')
+        special_checks = [
+            (profiler.wrap(special_func, path, sd_key), sd_key, sd_value)
+            for special_func, sd_key, sd_value in special_checks
+        ]
+
+        profiled_key_checks = []
+        for sd_key, checks in key_checks:
+            path = f"{self._profile_prefix}{sd_key}"
+            sd_value = self[sd_key]
+            # Checks are compiled in the order of the type validators (see '_compile_entry()')
+            keywords = [
+                keyword for keyword in self.validators.for_type(sd_value['type'])
+                if sd_value.get(keyword, None) is not None
+            ]
+            profiled = []
+            for keyword, (validator_func, exp_value) in zip(keywords, checks):
+                if validator_func == Validators.check_schemadict:
+                    self._profile_child(exp_value, f"{path}.")
+                elif validator_func == Validators.check_item_schemadict:
+                    self._profile_child(exp_value, f"{path}[].")
+                profiled.append((profiler.wrap(validator_func, path, keyword), exp_value))
+            profiled_key_checks.append((sd_key, tuple(profiled)))
+
+        return special_checks, profiled_key_checks
+
+    def _profile_child(self, schema, prefix):
+        child = self._child_schemadict(schema)
+        # Shared (e.g. recursive) nested schemas keep the first path
+        if child._profiler is None:
+            child._profiler = self._profiler
+            child._profile_prefix = prefix
+            child._plan = None
+
+    def _compile_entry(self, sd_value, entry_plans=None):
+        """
+        Return the validator functions and expected values for a schema entry
+
+        Only validators for keywords which are actually used in the schema
+        entry are included. Expected values are converted with the prepare
+        functions in `Validators.PREPARE` (e.g. regex patterns are compiled).
+        Results are cached by the identity of the entry.
+
+        Args:
+            :sd_value: schema entry (mapping of test keywords and expected values)
+            :entry_plans: cache of compiled entries (default: cache of the
+                          current plan)
+
+        Returns:
+            :checks: tuple of (validator function, expected value) pairs
+        """
+
+        generation = ValidatorDict.generation
+        is_frozen = type(sd_value) is _FrozenEntry
+        if is_frozen:
+            # Compacted entries are compiled once for all schemadicts
+            cached = getattr(sd_value, '_compiled', None)
+            if (
+                cached is not None and cached[0] is self.validators and
+                cached[1] == self.regex_flags and cached[2] == generation
+            ):
+                return cached[3]
+        else:
+            if entry_plans is None:
+                entry_plans = self._entry_plans
+            cached = None if entry_plans is None else entry_plans.get(id(sd_value), None)
+            if cached is not None and cached[0] is sd_value and cached[1] == generation:
+                return cached[2]
+
+        checks = []
+        for validator_key, validator_func in self.validators.for_type(sd_value['type']).items():
+            exp_value = sd_value.get(validator_key, None)
+            if exp_value is not None:
+                prepare = Validators.PREPARE.get(validator_func, None)
+                if prepare is not None:
+                    exp_value = prepare(exp_value, self)
+                checks.append((validator_func, exp_value))
+
+        checks = tuple(checks)
+        if is_frozen:
+            sd_value._compiled = (self.validators, self.regex_flags, generation, checks)
+        else:
+            if entry_plans is None:
+                entry_plans = self._entry_plans = {}
+            # Keep a reference to the entry so that its 'id()' cannot be reused
+            entry_plans[id(sd_value)] = (sd_value, generation, checks)
+        return checks
+
+    def _child_schemadict(self, schema):
+        """
+        Return the schemadict for a nested schema
+
+        Nested schemas are converted once and cached by the identity of the
+        nested schema object. The schemadict for a nested schema uses the same
+        validators (and regex flags) as the parent schemadict. The cache is shared with all
+        nested schemadicts, so that recursive schemas resolve to the same
+        instance.
+
+        Args:
+            :schema: nested schema (mapping)
+
+        Returns:
+            :child: schemadict instance
+        """
+
+        # Note: the cache may be replaced by another thread at any time
+        children = self._children
+        if children is None:
+            children = self._children = {}
+        cached = children.get(id(schema), None)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        child = self._new_child(schema, children)
+        # Keep a reference to the schema so that its 'id()' cannot be reused
+        children[id(schema)] = (schema, child)
+        return child
+
+    def _new_child(self, schema, children=None):
+        # Note: nested schemas have been checked with the parent schemadict
+        child = schemadict(
+            schema, validators=self.validators, regex_flags=self.regex_flags,
+            trusted=True, sampling=self.sampling,
+        )
+        child._children = self._children if children is None else children
+        return child
+
+    def generate_validator(self):
+        """
+        Return a generated validator function for the schemadict
+
+        The schema is translated into the source code of a single Python
+        function with inlined checks (see module '_codegen'). The function
+        takes a test dictionary as its only argument and raises the same
+        errors as `validate()`. It is cached and discarded together with the
+        validation plan.
+
+        Returns:
+            :validate: generated validator function (source code is available
+                       as attribute 'source')
+        """
+
+        plan = self._get_plan()
+        # Note: the function is only valid for the plan it was generated for
+        generated = self._generated_validator
+        if generated is None or generated[0] is not plan:
+            from ._codegen import generate_validator
+            generated = (plan, generate_validator(self))
+            self._generated_validator = generated
+        return generated[1]
+
+    def get_default_value_dict(self):
+        """
+        Return a new dictionary with the default values of the schema
+
+        Default values are defined with the keyword 'default'. Callable
+        defaults (e.g. functions or types) are called for each new dictionary.
+        Without a 'default', the value is the "zero" value of the expected
+        built-in type (e.g. '', 0, False, []), a dictionary with the defaults
+        of a nested 'schema', or None for other types.
+
+        Note:
+            * A template is built once per schemadict. Static values are
+              shared, mutable values (e.g. lists) are copied for each call.
+
+        Returns:
+            :defaults: (dict) default value dictionary
+        """
+
+        return self._build_defaults(())
+
+    def _build_defaults(self, stack):
+        defaults = self._get_defaults(stack)
+        value_dict = defaults.static.copy()
+        for sd_key, factory in defaults.factories.items():
+            value_dict[sd_key] = factory()
+        return value_dict
+
+    def _get_defaults(self, stack=()):
+        """
+        Return the (cached) template for default value dictionaries
+
+        Args:
+            :stack: identities of the schemadicts which are being processed
+                    (nested schemas which refer to themselves default to None)
+
+        Returns:
+            :defaults: instance of '_Defaults'
+        """
+
+        defaults = self._defaults
+        if defaults is not None:
+            return defaults
+
+        stack = (*stack, id(self))
+        static = {}
+        factories = {}
+        nested = {}
+        for sd_key, sd_value in self.mapping.items():
+            if sd_key.startswith('$'):
+                continue
+
+            exp_type = sd_value['type']
+            schema = sd_value.get('schema', None)
+            if schema is not None and isinstance(schema, Mapping):
+                nested[sd_key] = self._child_schemadict(schema)
+
+            if 'default' in sd_value:
+                default = sd_value['default']
+            elif sd_key in nested:
+                child = nested[sd_key]
+                if id(child) in stack:
+                    default = None
+                else:
+                    child._get_defaults(stack)
+                    default = functools.partial(child._build_defaults, stack)
+            elif getattr(exp_type, '__module__', None) == 'builtins':
+                # Zero value of the type (e.g. '', 0, False, [])
+                try:
+                    default = exp_type()
+                except TypeError:
+                    default = None
+            else:
+                default = None
+
+            if callable(default):
+                static[sd_key] = None
+                factories[sd_key] = default
+            elif _is_immutable(default):
+                static[sd_key] = default
+            else:
+                static[sd_key] = None
+                factories[sd_key] = _copy_factory(default)
+
+        defaults = _Defaults(static, factories, nested)
+        self._defaults = defaults
+        return defaults
+
+    def _fill_defaults(self, testdict, missing_keys):
+        """
+        Add default values for missing keys to a (valid) test dictionary
+
+        Nested dictionaries (keyword 'schema') are filled recursively.
+
+        Args:
+            :testdict: (dict) test dictionary
+            :missing_keys: keys of the schema which are not in 'testdict'
+                           (None to find them)
+        """
+
+        defaults = self._get_defaults()
+        if missing_keys is None:
+            missing_keys = [sd_key for sd_key in defaults.static if sd_key not in testdict]
+
+        for sd_key in missing_keys:
+            factory = defaults.factories.get(sd_key, None)
+            testdict[sd_key] = defaults.static[sd_key] if factory is None else factory()
+
+        for sd_key, child in defaults.nested.items():
+            if sd_key not in missing_keys and isinstance(testdict.get(sd_key, None), dict):
+                child._fill_defaults(testdict[sd_key], None)
+
+    def validate(self, testdict, *, cache_key=None, fill_defaults=False):
         """
         Check that a dictionary conforms to a schema dictionary. This function
         will raise an error if the 'testdict' is not in agreement with the
@@ -326,45 +2516,456 @@ class schemadict(MutableMapping):
 
         Args:
             :testdict: (dict) dictionary to test against the schema
+            :cache_key: (bytes) raw bytes from which the test dictionary was
+                        decoded, used as cache key if the cache is enabled
+                        (see `enable_cache()`)
+            :fill_defaults: (bool) if True, add default values for missing
+                            keys to a valid test dictionary, also in nested
+                            dictionaries (see `get_default_value_dict()`)
 
         Raises:
             :KeyError: if test dictionary does not have a required key
             :SchemaError: if the schema itself is ill-defined
             :TypeError: if test dictionary has a value of wrong type
             :ValueError: if test dictionary has a value of wrong 'size'
+
+        Note:
+            * Default values are not validated. Invalid test dictionaries are
+              not modified.
+        """
+
+        plan = self._get_plan()
+        if fill_defaults:
+            self._validate_and_fill(testdict, plan, cache_key)
+            return
+
+        if self._cache is None:
+            self._validate(testdict, plan)
+            return
+
+        error = self._get_error(testdict, plan, cache_key)
+        if error is not None:
+            raise error
+
+    def validate_sampled(self, testdict, sampling=None):
+        """
+        Validate a test dictionary, check only a sample of large lists
+
+        Args:
+            :testdict: (dict) dictionary to test against the schema
+            :sampling: `SamplingPolicy` for this call (default: policy of the
+                       schemadict, or all items if there is none)
+
+        Returns:
+            :report: `SamplingReport` with the achieved coverage
+
+        Raises:
+            :KeyError, TypeError, ValueError: see `validate()`
+        """
+
+        if sampling is None:
+            sampling = self.sampling or SamplingPolicy(min_items=float('inf'))
+        report = SamplingReport()
+        _SampledValidation(self, sampling, report).validate(testdict)
+        return report
+
+    def _validate_and_fill(self, testdict, plan, cache_key):
+        """
+        Validate a test dictionary and add default values for missing keys
+
+        Missing keys are collected while the test dictionary is validated,
+        and filled in once it is known to be valid.
+        """
+
+        if self._cache is not None:
+            error = self._get_error(testdict, plan, cache_key)
+            if error is not None:
+                raise error
+            self._fill_defaults(testdict, None)
+            return
+
+        Validators.is_type('$testdict', testdict, dict, self)
+        special_checks, key_checks, _, _ = plan
+        if special_checks:
+            context = ValidationContext(self, testdict)
+            for special_func, sd_key, sd_value in special_checks:
+                special_func(sd_key, sd_value, context)
+
+        missing_keys = []
+        for sd_key, checks in key_checks:
+            td_value = testdict.get(sd_key, None)
+            if td_value is None:
+                if sd_key not in testdict:
+                    missing_keys.append(sd_key)
+                continue
+
+            for validator_func, exp_value in checks:
+                validator_func(sd_key, td_value, exp_value, self)
+
+        self._fill_defaults(testdict, missing_keys)
+
+    def _validate(self, testdict, plan):
+        """
+        Validate a test dictionary with a given validation plan
+
+        Args:
+            :testdict: (dict) dictionary to test against the schema
+            :plan: validation plan (see `_compile()`)
         """
 
         # Check that testdict actually is a dictionary
         Validators.is_type('$testdict', testdict, dict, self)
 
-        # Keep a reference to the test dictionary
-        self.testdict = testdict
+        special_checks, key_checks, _, _ = plan
 
-        for sd_key, sd_value in self.items():
-            # A special key starting with '$' does not define a corresponding
-            # entry in the test dictionary. Intercept, run check and continue.
-            if sd_key.startswith('$'):
-                self._check_special_keys(sd_key, sd_value)
-                continue
+        # A special key starting with '$' does not define a corresponding
+        # entry in the test dictionary.
+        if special_checks:
+            context = ValidationContext(self, testdict)
+            for special_func, sd_key, sd_value in special_checks:
+                special_func(sd_key, sd_value, context)
 
+        for sd_key, checks in key_checks:
             # If 'testdict' does not have corresponding sd_value, continue.
             # Note: required keys are checked separately with special keys.
             td_value = testdict.get(sd_key, None)
             if td_value is None:
                 continue
 
-            self._check_test_obj_against_test_funcs(sd_key, sd_value, td_value)
+            for validator_func, exp_value in checks:
+                validator_func(sd_key, td_value, exp_value, self)
+
+    def validate_many(self, records, *, stop_on_first=False):
+        """
+        Validate many test dictionaries
+
+        The schema is compiled once, and records are validated one by one.
+        Records may be provided by any iterable (including generators), only
+        errors of invalid records are kept in memory.
+
+        Args:
+            :records: iterable of test dictionaries
+            :stop_on_first: (bool) if True, stop after the first invalid record
+
+        Returns:
+            :result: instance of `BatchResult`
+
+        Raises:
+            :SchemaError: if the schema itself is ill-defined
+        """
+
+        result = BatchResult()
+        for error in self._iter_errors(records):
+            result.append(error)
+            if stop_on_first and error is not None:
+                break
+        return result
+
+    def _iter_errors(self, records):
+        """
+        Validate records and yield the error for each record (None if valid)
+
+        Any exception raised by a (custom) validator function is yielded as the
+        error of the record, so that a single record cannot abort the whole
+        batch. Errors are yielded without traceback.
 
-    def _check_special_keys(self, sd_key, sd_value):
+        Args:
+            :records: iterable of test dictionaries
+        """
+
+        plan = self._get_plan()
+        for testdict in records:
+            try:
+                error = self._get_error(testdict, plan)
+            except SchemaError:
+                raise
+            except Exception as e:
+                error = e.with_traceback(None)
+            yield error
+
+    def is_valid(self, testdict, *, cache_key=None):
         """
-        Run the test function for a special key (starting with '$')
+        Return True if a dictionary conforms to the schema, False otherwise
+
+        Same checks as `validate()`, but no errors are raised and no error
+        messages are built. Validators which are registered in
+        `Validators.PREDICATES` are evaluated as boolean predicates, all other
+        validators are called and errors are caught.
 
         Args:
-            :sd_key: special key from the schemadict
-            :sd_value: special value from the schemadict
+            :testdict: (dict) dictionary to test against the schema
+            :cache_key: (bytes) optional raw bytes (see `validate()`)
+
+        Raises:
+            :SchemaError: if the schema itself is ill-defined
+        """
+
+        return self._find_cached_error(testdict, self._get_plan(), cache_key, need_error=False) is None
+
+    def get_error(self, testdict, *, cache_key=None):
         """
+        Return the error for a dictionary, or None if it conforms to the schema
 
-        self.validators[sd_key](sd_key, sd_value, self)
+        Same checks as `is_valid()`. The error message is only built when the
+        returned error is read.
+
+        Args:
+            :testdict: (dict) dictionary to test against the schema
+            :cache_key: (bytes) optional raw bytes (see `validate()`)
+
+        Returns:
+            :error: instance of `LazyError` or None
+        """
+
+        return self._find_cached_error(testdict, self._get_plan(), cache_key)
+
+    def _find_cached_error(self, testdict, plan, cache_key=None, need_error=True):
+        """
+        Same as `_find_error()`, but use the cache if it is enabled
+
+        Args:
+            :need_error: (bool) False if only the validity is needed (see
+                         `_ResultCache.get()`)
+        """
+
+        cache = self._cache
+        if cache is None:
+            return self._find_error(testdict, plan)
+
+        key = cache.make_key(testdict, cache_key)
+        found, error = cache.get(key, need_error)
+        if found:
+            if error is None:
+                return None
+            if error is not _INVALID:
+                return LazyError.from_exception(_copy_error(error))
+            # Note: the error is only built (by validating the current test
+            # dictionary again) when it is read
+            return LazyError(self._validate, testdict, plan)
+
+        error = self._find_error(testdict, plan)
+        cache.put(key, None if error is None else _INVALID)
+        return error
+
+    def _find_error(self, testdict, plan):
+        """
+        Return a 'LazyError' for the first failing check (None if valid)
+
+        Args:
+            :testdict: (dict) dictionary to test against the schema
+            :plan: validation plan (see `_compile()`)
+        """
+
+        if not _pred_is_type(testdict, dict, self):
+            return LazyError(Validators.is_type, '$testdict', testdict, dict, self)
+
+        special_checks, key_checks, _, _ = plan
+
+        if special_checks:
+            context = ValidationContext(self, testdict)
+            for special_func, sd_key, sd_value in special_checks:
+                predicate = SpecialValidators.PREDICATES.get(special_func, None)
+                try:
+                    if predicate is None:
+                        special_func(sd_key, sd_value, context)
+                    elif not predicate(sd_value, context):
+                        return LazyError(special_func, sd_key, sd_value, context)
+                except (KeyError, TypeError, ValueError) as e:
+                    return LazyError.from_exception(e)
+
+        for sd_key, checks in key_checks:
+            td_value = testdict.get(sd_key, None)
+            if td_value is None:
+                continue
+
+            error = self._find_value_error(sd_key, td_value, checks)
+            if error is not None:
+                return error
+        return None
+
+    def _find_value_error(self, sd_key, td_value, checks):
+        """
+        Return a 'LazyError' for the first failing check of a value (None if
+        valid)
+
+        Args:
+            :sd_key: common key for test dictionary and schemadict entry
+            :td_value: test dictionary value (object to test)
+            :checks: compiled checks (see `_compile_entry()`)
+        """
+
+        for validator_func, exp_value in checks:
+            predicate = Validators.PREDICATES.get(validator_func, None)
+            try:
+                if predicate is None:
+                    validator_func(sd_key, td_value, exp_value, self)
+                elif not predicate(td_value, exp_value, self):
+                    return LazyError(validator_func, sd_key, td_value, exp_value, self)
+            except (KeyError, TypeError, ValueError) as e:
+                # Note: predicates may raise for unorderable values
+                return LazyError.from_exception(e)
+        return None
+
+    def _get_error(self, testdict, plan, cache_key=None):
+        """
+        Return the error raised for a test dictionary (None if it is valid)
+
+        Args:
+            :testdict: (dict) dictionary to test against the schema
+            :plan: validation plan (see `_compile()`)
+            :cache_key: (bytes) optional raw bytes (see `validate()`)
+        """
+
+        cache = self._cache
+        if cache is not None:
+            key = cache.make_key(testdict, cache_key)
+            found, error = cache.get(key, need_error=True)
+            if found and error is not _INVALID:
+                return _copy_error(error)
+
+        try:
+            self._validate(testdict, plan)
+        except (KeyError, TypeError, ValueError) as e:
+            # Note: the traceback refers to the test dictionary and all locals
+            error = e.with_traceback(None)
+        else:
+            error = None
+
+        if cache is not None:
+            cache.put(key, _copy_error(error))
+        return error
+
+    async def validate_stream_async(self, records, concurrency=4, executor=None):
+        """
+        Validate test dictionaries from an asynchronous iterable
+
+        This is an asynchronous generator which yields a tuple (record, error)
+        for each record in input order, where 'error' is the exception raised
+        by `validate()`, or None if the record is valid.
+
+        Records are validated in an executor (by default the thread pool of
+        the event loop), so that large documents do not block the event loop.
+        At most 'concurrency' records are validated at a time. No further
+        records are read from 'records' before a result has been consumed
+        (backpressure).
+
+        Args:
+            :records: asynchronous iterable of test dictionaries
+            :concurrency: (int) maximum number of records validated at a time
+            :executor: executor (see 'loop.run_in_executor()')
+
+        Raises:
+            :SchemaError: if the schema itself is ill-defined
+        """
+
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except AttributeError:
+            # Python 3.6
+            loop = asyncio.get_event_loop()
+        plan = self._get_plan()
+        pending = deque()
+
+        async for record in records:
+            future = loop.run_in_executor(executor, self._get_error, record, plan)
+            pending.append((record, future))
+            if len(pending) >= concurrency:
+                record, future = pending.popleft()
+                yield record, await future
+
+        while pending:
+            record, future = pending.popleft()
+            yield record, await future
+
+    def validate_parallel(self, records, workers=None, chunksize=1000):
+        """
+        Validate many test dictionaries in parallel worker processes
+
+        The schemadict is sent to each worker process once. Records are sent
+        in chunks, and results are collected in input order. The number of
+        chunks in flight is bounded, so that records may be provided by a
+        generator of any length.
+
+        Args:
+            :records: iterable of test dictionaries
+            :workers: (int) number of worker processes (default: CPU count)
+            :chunksize: (int) number of records sent to a worker at once
+
+        Returns:
+            :result: instance of `BatchResult` (errors are exception instances
+                     without traceback)
+
+        Raises:
+            :SchemaError: if the schemadict cannot be sent to worker processes
+        """
+
+        result = BatchResult()
+        for error in self._iter_errors_parallel(records, workers, chunksize):
+            result.append(error)
+        return result
+
+    def _iter_errors_parallel(self, records, workers=None, chunksize=1000):
+        """
+        Validate records in worker processes and yield the error for each
+        record (None if valid) in input order
+
+        See `validate_parallel()`.
+        """
+
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import islice
+        import os
+
+        schema_bytes = self._dumps_for_workers()
+        workers = workers or os.cpu_count() or 1
+        records = iter(records)
+
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(schema_bytes,)) as executor:
+            pending = deque()
+            while True:
+                chunk = list(islice(records, chunksize))
+                if chunk:
+                    pending.append(executor.submit(_validate_chunk, chunk))
+                if pending and (not chunk or len(pending) >= 2*workers):
+                    yield from pending.popleft().result()
+                if not chunk and not pending:
+                    break
+
+    def _dumps_for_workers(self):
+        """Return the pickled schemadict, raise 'SchemaError' if not possible"""
+
+        import pickle
+        try:
+            return pickle.dumps(self)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise SchemaError(
+                f"schemadict cannot be sent to worker processes ({e}): " +
+                "types and validator functions must be defined at module level (no lambdas)"
+            )
+
+    def __getstate__(self):
+        # Caches are not pickled (generated functions cannot be pickled)
+        return {
+            'mapping': self.mapping,
+            'validators': self.validators,
+            'regex_flags': self.regex_flags,
+            'trusted': self._trusted,
+            'sampling': self._sampling,
+        }
+
+    def __setstate__(self, state):
+        # The schema was checked before it was pickled
+        self._cache = None
+        self._profiler = None
+        self._profile_prefix = ''
+        self._trusted = True
+        self.mapping = state['mapping']
+        self._regex_flags = state['regex_flags']
+        self._sampling = state['sampling']
+        self.validators = state['validators']
+        self._trusted = state['trusted']
 
     def _check_test_obj_against_test_funcs(self, sd_key, sd_value, td_value):
         """
@@ -377,7 +2978,151 @@ class schemadict(MutableMapping):
             :td_value: test dictionary value (object to test)
         """
 
-        for validator_key, validator_func in self.validators[sd_value['type']].items():
-            exp_value = sd_value.get(validator_key, None)
-            if exp_value is not None:
-                validator_func(sd_key, td_value, exp_value, self)
+        for validator_func, exp_value in self._compile_entry(sd_value):
+            validator_func(sd_key, td_value, exp_value, self)
+
+
+class ValidatedDict(MutableMapping):
+    """
+    A *ValidatedDict* is a dictionary which always conforms to a schemadict
+
+    The initial content is validated as a whole. Afterwards, only the values
+    which are written are validated, and required keys are checked when keys
+    are deleted. Invalid updates raise an error and leave the dictionary
+    unchanged.
+
+    Args:
+        :schema: schemadict instance (or mapping to create one from)
+        :args, kwargs: initial content (same as for 'dict')
+    """
+
+    # Special validators which cannot fail when keys are added
+    _UNAFFECTED_BY_SET = (SpecialValidators.check_req_keys_in_dict,)
+
+    # Special validators which cannot fail when keys are deleted
+    _UNAFFECTED_BY_DELETE = (
+        SpecialValidators.check_allowed_keys,
+        SpecialValidators.check_keys_in_schema,
+    )
+
+    # Special validators for which it is sufficient to check the new items
+    _CHECK_NEW_ITEMS = _UNAFFECTED_BY_DELETE
+
+    def __init__(self, schema, *args, **kwargs):
+        if not isinstance(schema, schemadict):
+            schema = schemadict(schema)
+        mapping = dict(*args, **kwargs)
+        schema.validate(mapping)
+
+        self.schema = schema
+        self.mapping = mapping
+
+    def __setitem__(self, key, value):
+        self.update({key: value})
+
+    def update(self, *args, **kwargs):
+        """Validate all new items, then update the dictionary"""
+
+        items = dict(*args, **kwargs)
+        plan = self.schema._get_plan()
+
+        for key, value in items.items():
+            checks = plan.checks_by_key.get(key, None)
+            # Note: 'None' values are not checked (same as 'validate()')
+            if checks is None or value is None:
+                continue
+            for validator_func, exp_value in checks:
+                validator_func(key, value, exp_value, self.schema)
+
+        special_checks = []
+        for special_check in plan.special_checks:
+            special_func, sd_key, sd_value = special_check
+            if special_func in self._CHECK_NEW_ITEMS:
+                special_func(sd_key, sd_value, ValidationContext(self.schema, items))
+            elif special_func not in self._UNAFFECTED_BY_SET:
+                special_checks.append(special_check)
+
+        if not special_checks:
+            self.mapping.update(items)
+            return
+
+        # Check special keys for the updated dictionary, restore on failure
+        old_items = {key: self.mapping[key] for key in items if key in self.mapping}
+        self.mapping.update(items)
+        try:
+            self._check_special_keys(special_checks)
+        except Exception:
+            for key in items:
+                del self.mapping[key]
+            self.mapping.update(old_items)
+            raise
+
+    def __delitem__(self, key):
+        self._check_delete([key])
+
+    def clear(self):
+        self._check_delete(list(self.mapping))
+
+    def _check_delete(self, keys):
+        """Delete keys if the dictionary remains valid"""
+
+        plan = self.schema._get_plan()
+        special_checks = []
+        for special_check in plan.special_checks:
+            special_func, sd_key, sd_value = special_check
+            if special_func is SpecialValidators.check_req_keys_in_dict:
+                for key in keys:
+                    if key in sd_value and key in self.mapping:
+                        raise KeyError(f"{sd_key!r}: required key {key!r} cannot be deleted")
+            elif special_func not in self._UNAFFECTED_BY_DELETE:
+                special_checks.append(special_check)
+
+        old_items = {key: self.mapping.pop(key) for key in keys}
+        try:
+            self._check_special_keys(special_checks)
+        except Exception:
+            self.mapping.update(old_items)
+            raise
+
+    def _check_special_keys(self, special_checks):
+        context = ValidationContext(self.schema, self.mapping)
+        for special_func, sd_key, sd_value in special_checks:
+            special_func(sd_key, sd_value, context)
+
+    def __getitem__(self, key):
+        return self.mapping[key]
+
+    def __iter__(self):
+        return iter(self.mapping)
+
+    def __len__(self):
+        return len(self.mapping)
+
+    def __str__(self):
+        return str(self.mapping)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}({self.mapping!r})"
+
+
+# Schemadict used by a worker process (see 'schemadict.validate_parallel()')
+_worker_schema = None
+
+
+def _init_worker(schema_bytes):
+    """Initialize a worker process with a pickled schemadict"""
+
+    import pickle
+
+    global _worker_schema
+    _worker_schema = pickle.loads(schema_bytes)
+
+
+def _validate_chunk(records):
+    """
+    Return the error for each record in a chunk (None if valid)
+
+    See `schemadict._iter_errors()`.
+    """
+
+    return list(_worker_schema._iter_errors(records))
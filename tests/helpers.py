@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Helper functions shared by tests
+"""
+
+
+def get_error(func, testdict):
+    """Return the type and message of the error raised by 'func' (None if valid)"""
+
+    try:
+        func(testdict)
+    except Exception as e:
+        return type(e), str(e)
+    return None
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+from schemadict import schemadict, SchemaError
+
+SCHEMA = schemadict({
+    '$required_keys': ['name'],
+    'name': {'type': str},
+    'samples': {'type': list, 'item_schema': {'type': str, 'min_len': 1}},
+})
+
+
+async def _records(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        if i % 4 == 0:
+            yield {'samples': ['a']}
+        elif i % 4 == 1:
+            yield {'name': i}
+        else:
+            yield {'name': 'a', 'samples': ['a']*i}
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+def _run(coro):
+    """Run a coroutine in a new event loop (like 'asyncio.run()' in Python 3.7+)"""
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_validate_stream_async():
+    results = _run(_collect(SCHEMA.validate_stream_async(_records(50), concurrency=3)))
+
+    assert len(results) == 50
+    for i, (record, error) in enumerate(results):
+        if i % 4 == 0:
+            assert isinstance(error, KeyError)
+            assert error.__traceback__ is None
+        elif i % 4 == 1:
+            assert record == {'name': i}
+            assert isinstance(error, TypeError)
+        else:
+            assert len(record['samples']) == i
+            assert error is None
+
+
+def test_validate_stream_async_backpressure():
+    """No more than 'concurrency' records are read ahead"""
+
+    num_read = 0
+    max_ahead = 0
+
+    async def records():
+        nonlocal num_read
+        for i in range(20):
+            num_read += 1
+            yield {'name': 'a'}
+
+    async def consume():
+        nonlocal max_ahead
+        num_consumed = 0
+        async for _ in SCHEMA.validate_stream_async(records(), concurrency=2):
+            num_consumed += 1
+            max_ahead = max(max_ahead, num_read - num_consumed)
+
+    _run(consume())
+    assert num_read == 20
+    assert max_ahead <= 2
+
+
+def test_validate_stream_async_event_loop_not_blocked():
+    """Large documents do not block the event loop"""
+
+    big_record = {'name': 'a', 'samples': ['a']*500000}
+
+    async def records():
+        for _ in range(4):
+            yield big_record
+
+    async def main():
+        num_ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal num_ticks
+            while not done:
+                num_ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.ensure_future(ticker())
+        results = await _collect(SCHEMA.validate_stream_async(records(), concurrency=1))
+        done = True
+        await task
+        return results, num_ticks
+
+    results, num_ticks = _run(main())
+    assert [error for _, error in results] == [None]*4
+    assert num_ticks > 4
+
+
+def test_validate_stream_async_schema_error():
+    class MyOwnType:
+        pass
+
+    schema = schemadict({'a': {'type': MyOwnType}}, trusted=True)
+
+    async def records():
+        yield {'a': MyOwnType()}
+
+    with pytest.raises(SchemaError):
+        _run(_collect(schema.validate_stream_async(records())))
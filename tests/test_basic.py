@@ -30,11 +30,11 @@ SCHEMA_1 = schemadict({
     }
 })
 
-SCHEMA_1_DEFAULT_VALUE_DICT = schemadict({
+SCHEMA_1_DEFAULT_VALUE_DICT = {
     'name': '',
     'age': 0,
     'is_working': False,
-})
+}
 
 # Simple nested schema
 SCHEMA_2 = schemadict({
@@ -146,7 +146,11 @@ def test_schema_error():
     class MyOwnType:
         pass
 
-    schema = schemadict({'a': {'type': MyOwnType}})
+    with pytest.raises(SchemaError):
+        schemadict({'a': {'type': MyOwnType}})
+
+    # Schema is not checked if it is trusted
+    schema = schemadict({'a': {'type': MyOwnType}}, trusted=True)
 
     with pytest.raises(SchemaError):
         schema.validate({'a': MyOwnType()})
@@ -211,7 +215,7 @@ def test_list_with_subschemas():
         'name': {'type': str},
         'cities': {
             'type': list,
-            'item_type': dict,
+            'item_types': dict,
             'item_schemadict': schema_city
         },
     })
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from numbers import Number
+import re
 
 from schemadict import schemadict
 
@@ -165,6 +166,25 @@ def test_type_str():
 
     schema.validate({'ip_addrs': ['127.0.0.1', '192.168.1.1']})
 
+    # Test full match regex
+    schema = schemadict({
+        'a': {'type': str, 'regex_full': r'[a-z]*[0-9]'},
+    })
+    schema.validate({'a': 'hello1'})
+
+    with pytest.raises(ValueError):
+        schema.validate({'a': 'hello1world'})
+
+    # Precompiled patterns and regex flags
+    schema = schemadict({
+        'a': {'type': str, 'regex': re.compile(r'[a-z]+')},
+        'b': {'type': str, 'regex_full': r'[a-z]+'},
+    }, regex_flags=re.IGNORECASE)
+    schema.validate({'a': 'hello', 'b': 'HeLLo'})
+
+    with pytest.raises(ValueError):
+        schema.validate({'a': 'HELLO'})
+
     # Test 'one_of'
     schema = schemadict({
         'fruit': {'type': str, 'one_of': ['banana', 'strawberry', 'apple']},
@@ -270,3 +290,27 @@ def test_type_dict():
             'pet': {'animal': 'B', 'name': 'C', 'age': -111},
         }
         schema.validate(testdict)
+
+
+def test_allowed_values_lookup():
+    """Test 'one_of' and 'allowed_items' with hashable and unhashable values"""
+
+    schema = schemadict({
+        'numbers': {'type': list, 'allowed_items': list(range(500))},
+        'pairs': {'type': list, 'allowed_items': [[1, 2], [3, 4]]},
+        'number': {'type': int, 'one_of': list(range(500))},
+    })
+
+    schema.validate({'numbers': list(range(500))*20, 'pairs': [[1, 2]], 'number': 499})
+
+    with pytest.raises(ValueError):
+        schema.validate({'numbers': [1, 2, 500]})
+
+    with pytest.raises(ValueError):
+        schema.validate({'numbers': [1, 2, [3]]})
+
+    with pytest.raises(ValueError):
+        schema.validate({'pairs': [[1, 2], [2, 1]]})
+
+    with pytest.raises(ValueError):
+        schema.validate({'number': 500})
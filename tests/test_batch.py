@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from schemadict import schemadict, BatchResult, SchemaError
+
+SCHEMA = schemadict({
+    '$required_keys': ['name'],
+    'name': {'type': str, 'min_len': 1},
+    'age': {'type': int, '>=': 0},
+})
+
+
+def _records(n):
+    for i in range(n):
+        if i % 3 == 0:
+            yield {'name': 'Neil', 'age': -i - 1}
+        else:
+            yield {'name': 'Neil', 'age': i}
+
+
+def test_validate_many():
+    result = SCHEMA.validate_many(_records(10))
+
+    assert isinstance(result, BatchResult)
+    assert len(result) == 10
+    assert list(result.valid) == [0, 1, 1, 0, 1, 1, 0, 1, 1, 0]
+    assert sorted(result.errors) == [0, 3, 6, 9]
+    assert result.num_invalid == 4
+    assert result.num_valid == 6
+    assert not result.all_valid
+    assert all(isinstance(e, ValueError) for e in result.errors.values())
+    # Note: tracebacks would keep failed records and validation locals alive
+    assert all(e.__traceback__ is None for e in result.errors.values())
+
+
+def test_validate_many_error_types():
+    records = [{'name': 'Neil'}, {'age': 3}, {'name': 5}, 'not_a_dict', {'name': ''}]
+    result = SCHEMA.validate_many(records)
+
+    assert list(result.valid) == [1, 0, 0, 0, 0]
+    assert isinstance(result.errors[1], KeyError)
+    assert isinstance(result.errors[2], TypeError)
+    assert isinstance(result.errors[3], TypeError)
+    assert isinstance(result.errors[4], ValueError)
+
+
+def test_validate_many_stop_on_first():
+    result = SCHEMA.validate_many(_records(10), stop_on_first=True)
+    assert len(result) == 1
+    assert list(result.errors) == [0]
+
+    result = SCHEMA.validate_many([{'name': 'A'}, {'name': 'B'}], stop_on_first=True)
+    assert result.all_valid
+    assert len(result) == 2
+
+
+def test_validate_many_schema_error():
+    class MyOwnType:
+        pass
+
+    schema = schemadict({'a': {'type': MyOwnType}}, trusted=True)
+    with pytest.raises(SchemaError):
+        schema.validate_many([{'a': MyOwnType()}])
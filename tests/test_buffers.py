@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import array
+import sys
+
+import pytest
+
+from schemadict import schemadict
+
+from helpers import get_error
+
+N = 5000
+
+
+def _item_loop(key, buffer, item_schema):
+    """Reference: check each item of a buffer with the regular validators"""
+
+    schema = schemadict({key: {'type': list, 'item_schema': item_schema}})
+    return get_error(schema.validate, {key: memoryview(buffer).tolist()})
+
+
+@pytest.fixture(params=['numpy', 'no_numpy'])
+def numpy_backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(sys.modules['schemadict.schemadict'], '_numpy', False)
+    return request.param
+
+
+def test_buffer_types():
+    schema = schemadict({
+        'samples': {'type': array.array, 'typecode': 'fd', 'min_len': 2, 'max_len': 4},
+        'pixels': {'type': memoryview, 'format': ('B', 'b'), 'min_len': 1},
+        'raw': {'type': bytes, 'format': 'B', 'max_len': 3},
+        'packet': {'type': bytearray, 'min_len': 1},
+    })
+
+    schema.validate({
+        'samples': array.array('d', [1, 2, 3]),
+        'pixels': memoryview(b'abc'),
+        'raw': b'abc',
+        'packet': bytearray(b'x'),
+    })
+
+    assert get_error(schema.validate, {'samples': array.array('i', [1, 2])}) == \
+        (TypeError, "unexpected typecode for 'samples': expected 'fd', but was 'i'")
+    assert get_error(schema.validate, {'pixels': memoryview(array.array('i', [1]))}) == \
+        (TypeError, "unexpected buffer format for 'pixels': expected ('B', 'b'), but was 'i'")
+
+    with pytest.raises(ValueError):
+        schema.validate({'samples': array.array('d', [1])})
+    with pytest.raises(ValueError):
+        schema.validate({'raw': b'abcd'})
+    with pytest.raises(ValueError):
+        schema.validate({'packet': bytearray()})
+    with pytest.raises(TypeError):
+        schema.validate({'raw': bytearray(b'abc')})
+    with pytest.raises(TypeError):
+        schema.validate({'samples': [1.0, 2.0]})
+
+
+def test_item_types():
+    schema = schemadict({
+        'samples': {'type': array.array, 'item_types': float},
+        'raw': {'type': bytes, 'item_types': int},
+        'chars': {'type': memoryview, 'item_types': bytes},
+    })
+
+    schema.validate({
+        'samples': array.array('d', [1, 2]),
+        'raw': b'ab',
+        'chars': memoryview(b'ab').cast('c'),
+    })
+    schema.validate({'samples': array.array('i')})  # Empty buffer
+
+    assert get_error(schema.validate, {'samples': array.array('i', [1])}) == \
+        (TypeError, "unexpected type for item in iterable 'samples': expected <class 'float'>")
+    with pytest.raises(TypeError):
+        schema.validate({'chars': memoryview(b'ab')})
+
+
+@pytest.mark.parametrize('num_items', [10, N])
+def test_item_bounds(numpy_backend, num_items):
+    item_schema = {'type': float, '>=': 0, '<': 1}
+    schema = schemadict({'samples': {'type': array.array, 'item_schema': item_schema}})
+
+    samples = array.array('d', (i/num_items for i in range(num_items)))
+    schema.validate({'samples': samples})
+
+    for bad_value in (1.0, -0.5, float('nan')):
+        samples[num_items//3] = bad_value
+        samples[num_items//2] = 7.0
+        error = get_error(schema.validate, {'samples': samples})
+        assert error is not None
+        assert error == _item_loop('samples', samples, item_schema)
+        samples[num_items//3] = samples[num_items//2] = 0.5
+
+
+@pytest.mark.parametrize('num_items', [10, N])
+def test_integer_buffers(numpy_backend, num_items):
+    item_schema = {'type': int, '>': 0, '<=': 100}
+    schema = schemadict({
+        'counts': {'type': memoryview, 'item_schema': item_schema},
+        'raw': {'type': bytes, 'item_schema': item_schema},
+    })
+
+    counts = array.array('q', [50]*num_items)
+    schema.validate({'counts': memoryview(counts), 'raw': bytes([50])*num_items})
+
+    counts[-1] = 2**62
+    assert get_error(schema.validate, {'counts': memoryview(counts)}) == \
+        (ValueError, f"'counts' too large: expected <= 100, but was {2**62}")
+    assert get_error(schema.validate, {'raw': b'\x01\x00'}) == \
+        (ValueError, "'raw' too small: expected > 0, but was 0")
+
+    # The item type is derived from the buffer format
+    with pytest.raises(TypeError):
+        schemadict({'raw': {'type': bytes, 'item_schema': {'type': float}}}).validate({'raw': b'a'})
+
+
+def test_bool_buffers(numpy_backend):
+    """Items of format '?' are only of type 'bool', like in lists"""
+
+    flags = memoryview(bytes([0, 1])).cast('?')
+    for item_schema in ({'type': int, '>=': 0}, {'type': int}):
+        error = get_error(
+            schemadict({'flags': {'type': memoryview, 'item_schema': item_schema}}).validate,
+            {'flags': flags},
+        )
+        assert error is not None
+        assert error == _item_loop('flags', flags, item_schema)
+
+    schema = schemadict({'flags': {'type': memoryview, 'item_schema': {'type': bool}}})
+    schema.validate({'flags': flags})
+
+
+def test_unicode_arrays():
+    """Memoryviews cannot access the items of 'u' arrays (format 'w')"""
+
+    item_schema = {'type': str, 'one_of': ['a', 'b']}
+    schema = schemadict({
+        'chars': {
+            'type': array.array,
+            'typecode': 'u',
+            'format': 'u',
+            'item_types': str,
+            'item_schema': item_schema,
+        },
+        'view': {'type': memoryview, 'format': 'u', 'item_schema': item_schema},
+    })
+
+    chars = array.array('u', 'abba')
+    schema.validate({'chars': chars, 'view': memoryview(chars)})
+
+    chars.append('c')
+    for testdict in ({'chars': chars}, {'view': memoryview(chars)}):
+        with pytest.raises(ValueError, match="but was 'c'"):
+            schema.validate(testdict)
+
+
+def test_multidimensional_views():
+    schema = schemadict({'grid': {'type': memoryview, 'min_len': 2, 'item_types': list}})
+
+    grid = memoryview(array.array('i', range(6))).cast('B').cast('i', (2, 3))
+    schema.validate({'grid': grid})
+
+    schema = schemadict({'grid': {'type': memoryview, 'item_schema': {'type': list, 'min_len': 3}}})
+    schema.validate({'grid': grid})
+    with pytest.raises(ValueError):
+        schema.validate({'grid': grid.cast('B').cast('i', (3, 2))})
+
+
+def test_no_copy(numpy_backend):
+    """Checked buffers are not copied (the memoryview is released afterwards)"""
+
+    schema = schemadict({
+        'samples': {'type': bytearray, 'item_schema': {'type': int, '>=': 0, '<': 255}},
+    })
+
+    samples = bytearray(N)
+    schema.validate({'samples': samples})
+    samples.extend(b'\x00')  # Resizing fails if the buffer is still exported
+
+
+def test_generated_validator():
+    schema = schemadict({
+        'samples': {
+            'type': array.array,
+            'typecode': 'd',
+            'item_types': float,
+            'item_schema': {'type': float, '>=': 0},
+        },
+    })
+    validate = schema.generate_validator()
+
+    validate({'samples': array.array('d', [0, 1])})
+    for testdict in (
+        {'samples': array.array('d', [0, -1])},
+        {'samples': array.array('i', [0, 1])},
+    ):
+        assert get_error(validate, testdict) == get_error(schema.validate, testdict)
+        assert get_error(validate, testdict) is not None
+
+
+def test_float_bounds_exact(numpy_backend):
+    """Items are compared with bounds exactly, as with the per-item loop"""
+
+    for buffer, item_schema in (
+        # Integers above 2**53 cannot be converted to float exactly
+        (array.array('q', [2**53 + 1]*N), {'type': int, '<=': 9007199254740992.0}),
+        # Bounds are not rounded to the precision of float32 items
+        (array.array('f', [0.099999994]*N), {'type': float, '>=': 0.099999995}),
+    ):
+        schema = schemadict({'a': {'type': array.array, 'item_schema': item_schema}})
+        for validate in (schema.validate, schema.generate_validator()):
+            error = get_error(validate, {'a': buffer})
+            assert error is not None
+            assert error == _item_loop('a', buffer, item_schema)
+        assert not schema.is_valid({'a': buffer})
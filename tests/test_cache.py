@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from schemadict import schemadict, STANDARD_VALIDATORS, ValidatorDict, Validators
+
+
+def _schema():
+    return schemadict({
+        '$required_keys': ['name'],
+        'name': {'type': str, 'min_len': 3},
+        'cities': {
+            'type': list,
+            'item_schemadict': {'population': {'type': int, '>=': 0}},
+        },
+    })
+
+
+def test_cache_hits_and_misses():
+    schema = _schema().enable_cache(maxsize=2)
+    assert schema.cache_info() == (0, 0, 2, 0)
+
+    schema.validate({'name': 'Neil'})
+    schema.validate({'name': 'Neil'})
+    assert schema.is_valid({'name': 'Neil'})
+    assert schema.cache_info() == (2, 1, 2, 1)
+
+    # Same value, but different type
+    with pytest.raises(TypeError):
+        schema.validate({'name': 'Neil', 'cities': ()})
+    schema.validate({'name': 'Neil', 'cities': []})
+    assert schema.cache_info() == (2, 3, 2, 2)
+
+    # Least recently used outcome is discarded
+    schema.validate({'name': 'Neil'})
+    assert schema.cache_info().hits == 2
+    assert schema.cache_info().currsize == 2
+
+
+def test_cached_errors():
+    schema = _schema().enable_cache()
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="'name' too small"):
+            schema.validate({'name': 'A'})
+        assert not schema.is_valid({'name': 'A'})
+        assert str(schema.get_error({'name': 'A'})).startswith("length of 'name' too small")
+
+    assert schema.cache_info().hits == 8
+    assert schema.cache_info().misses == 1
+
+
+def test_cached_invalid_outcomes():
+    """Errors which have not been built are only built when they are read"""
+
+    num_calls = 0
+
+    def has_min_len(key, value, min_len, sd):
+        nonlocal num_calls
+        num_calls += 1
+        Validators.has_min_len(key, value, min_len, sd)
+
+    my_validators = ValidatorDict(STANDARD_VALIDATORS)
+    my_validators[str] = {'type': Validators.is_type, 'min_len': has_min_len}
+    schema = schemadict({'name': {'type': str, 'min_len': 3}}, validators=my_validators)
+    schema.enable_cache()
+
+    for _ in range(3):
+        assert not schema.is_valid({'name': 'A'})
+    assert num_calls == 1
+    assert schema.cache_info()[:2] == (2, 1)
+
+    error = schema.get_error({'name': 'A'})
+    assert num_calls == 1
+    assert schema.cache_info()[:2] == (2, 2)
+    assert str(error).startswith("length of 'name' too small")
+    assert num_calls == 2
+
+    # The error built by 'validate()' is cached
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'A'})
+    assert schema.cache_info()[:2] == (2, 3)
+    assert isinstance(schema.get_error({'name': 'A'}).exception, ValueError)
+    assert schema.cache_info()[:2] == (3, 3)
+    assert num_calls == 3
+
+
+def test_cached_errors_independent_of_testdict():
+    """Cached outcomes do not refer to test dictionaries of the caller"""
+
+    schema = _schema().enable_cache()
+
+    testdict = {'cities': []}
+    assert not schema.is_valid(testdict)
+    testdict['name'] = 'Neil'  # Modified by the caller
+
+    with pytest.raises(KeyError):
+        schema.validate({'cities': []})
+    error = schema.get_error({'cities': []})
+    assert isinstance(error.exception, KeyError)
+
+    # Raised exceptions do not keep a traceback in the cache
+    with pytest.raises(KeyError):
+        schema.validate({'cities': []})
+    for outcome in schema._cache._results.values():
+        assert outcome.__traceback__ is None
+
+
+def test_cache_raw_bytes():
+    schema = _schema().enable_cache()
+    raw = b'{"name": "Neil"}'
+
+    for _ in range(3):
+        schema.validate(json.loads(raw), cache_key=raw)
+    assert schema.cache_info().hits == 2
+
+
+def test_cache_nested_items():
+    """Only whole test dictionaries are cached, not nested items"""
+
+    schema = _schema().enable_cache()
+    cities = [{'population': 1}, {'population': 2}]*50
+    for _ in range(3):
+        schema.validate({'name': 'Neil', 'cities': cities})
+
+    child = schema._child_schemadict(schema['cities']['item_schemadict'])
+    assert child.cache_info() is None
+    assert schema.cache_info().hits == 2
+    assert schema.cache_info().misses == 1
+
+    cities.append({'population': -1})
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'Neil', 'cities': cities})
+
+
+def test_cache_invalidated():
+    my_validators = ValidatorDict(STANDARD_VALIDATORS)
+    my_validators[str] = {'type': Validators.is_type, 'min_len': Validators.has_min_len}
+    schema = schemadict({'name': {'type': str, 'min_len': 3}}, validators=my_validators)
+    schema.enable_cache()
+
+    schema.validate({'name': 'Neil'})
+    schema['name'] = {'type': str, 'min_len': 5}
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'Neil'})
+
+    # Modify a validator function in place
+    def no_min_len(key, value, min_len, _):
+        pass
+
+    my_validators[str]['min_len'] = no_min_len
+    schema.validate({'name': 'Neil'})
+
+    schema.disable_cache()
+    assert schema.cache_info() is None
+
+
+def test_validator_dict_shared_tables():
+    """Shared mappings of validator functions remain shared"""
+
+    table = {'type': Validators.is_type}
+    validators = ValidatorDict({int: table, float: table})
+    assert validators[int] is validators[float]
+    assert isinstance(validators[int], dict)
+
+    generation = ValidatorDict.generation
+    validators[int]['>'] = Validators.is_gt
+    assert ValidatorDict.generation > generation
+    assert '>' in validators[float]
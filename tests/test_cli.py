@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from schemadict.__main__ import main, load_schema
+from schemadict import schemadict
+
+SCHEMA_MODULE = """
+from schemadict import schemadict, ValidatorDict, Validators
+
+ORDER = schemadict({
+    '$required_keys': ['id'],
+    'id': {'type': int, '>': 0},
+    'items': {'type': list, 'item_types': str},
+})
+
+PLAIN = {'id': {'type': int}}
+
+
+def has_name(key, value, exp_name, _):
+    # Note: raises 'AttributeError' for values without attribute 'name'
+    if value.name != exp_name:
+        raise ValueError(f"{key!r} has wrong name")
+
+
+NAMED = schemadict(
+    {'id': {'type': object, 'name': 'x'}},
+    validators=ValidatorDict({object: {'type': Validators.is_type, 'name': has_name}}),
+)
+"""
+
+LINES = [
+    '{"id": 1, "items": ["a"]}',
+    '{"id": -2}',
+    '',
+    '{"id": 3, "items": [1]}',
+    '{"id": 4',
+    '{"items": []}',
+    '{"id": 6}',
+]
+
+
+@pytest.fixture
+def schema_module(tmp_path, monkeypatch):
+    (tmp_path / 'cli_schemas.py').write_text(SCHEMA_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tmp_path
+
+
+def test_load_schema(schema_module):
+    assert isinstance(load_schema('cli_schemas:ORDER'), schemadict)
+    assert isinstance(load_schema('cli_schemas:PLAIN'), schemadict)
+
+    with pytest.raises(ValueError):
+        load_schema('cli_schemas')
+
+
+def test_cli_rejects(schema_module, capsys):
+    infile = schema_module / 'orders.jsonl'
+    infile.write_text('\n'.join(LINES) + '\n')
+    rejects = schema_module / 'rejects.txt'
+
+    assert main(['cli_schemas:ORDER', str(infile), '--rejects', str(rejects)]) == 1
+
+    reject_lines = rejects.read_text().splitlines()
+    assert [line.split(':')[0] for line in reject_lines] == ['2', '4', '5', '6']
+    assert reject_lines[0].startswith('2: ValueError:')
+    assert reject_lines[1].startswith('4: TypeError:')
+    assert reject_lines[2].startswith('5: JSONDecodeError:')
+    assert reject_lines[3].startswith('6: KeyError:')
+
+    assert 'records: 6, valid: 2, invalid: 4' in capsys.readouterr().out
+
+
+def test_cli_jobs_stdin(schema_module):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(schema_module)] + sys.path))
+    proc = subprocess.run(
+        [sys.executable, '-m', 'schemadict', 'cli_schemas:ORDER', '--jobs', '2', '--chunksize', '2'],
+        input='\n'.join(LINES*10),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=env,
+    )
+
+    assert proc.returncode == 1
+    reject_linenos = [int(line.split(':')[0]) for line in proc.stderr.splitlines()]
+    assert reject_linenos == [n + 7*i for i in range(10) for n in (2, 4, 5, 6)]
+    assert 'records: 60, valid: 20, invalid: 40' in proc.stdout
+
+
+def test_cli_missing_input(schema_module, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main(['cli_schemas:ORDER', str(schema_module / 'missing.jsonl')])
+
+    assert exc_info.value.code == 2
+    assert 'cannot open input file' in capsys.readouterr().err
+
+
+def test_cli_unexpected_errors(schema_module, capsys):
+    """Unexpected errors of custom validators are reported per record"""
+
+    infile = schema_module / 'orders.jsonl'
+    infile.write_text('{"id": 1}\n{"id": 2}\n')
+
+    assert main(['cli_schemas:NAMED', str(infile)]) == 1
+
+    reject_lines = capsys.readouterr().err.splitlines()
+    assert [line.split(':')[:2] for line in reject_lines] == [['1', ' AttributeError'], ['2', ' AttributeError']]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from schemadict import schemadict, STANDARD_VALIDATORS, ValidatorDict
+
+from helpers import get_error
+
+SCHEMA_CITY = schemadict({
+    '$required_keys': ['name'],
+    'name': {'type': str, 'min_len': 1},
+    'population': {'type': int, '>=': 0},
+})
+
+SCHEMA_COUNTRY = schemadict({
+    '$required_keys': ['name', 'cities'],
+    'name': {'type': str, 'min_len': 3, 'max_len': 12, 'regex': r'[A-Z][a-z]+'},
+    'code': {'type': str, 'one_of': ['NL', 'SE', 'DE']},
+    'area': {'type': float, '>': 0, '<': 1e8},
+    'is_island': {'type': bool},
+    'languages': {'type': tuple, 'item_types': str, 'allowed_items': ('en', 'nl', 'de')},
+    'ip_addrs': {
+        'type': list,
+        'item_schema': {'type': str, 'regex': r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$'},
+    },
+    'capital': {'type': dict, 'schema': SCHEMA_CITY},
+    'cities': {'type': list, 'item_types': dict, 'item_schemadict': SCHEMA_CITY},
+})
+
+VALID = {
+    'name': 'Neverland',
+    'code': 'NL',
+    'area': 3.5,
+    'is_island': False,
+    'languages': ('en', 'nl'),
+    'ip_addrs': ['127.0.0.1'],
+    'capital': {'name': 'Faketown', 'population': 3},
+    'cities': [{'name': 'Faketown', 'population': 3}, {'name': 'Evergreen'}],
+}
+
+INVALID_UPDATES = [
+    {'name': 'neverland'},
+    {'name': 'Ne'},
+    {'name': True},
+    {'code': 'XX'},
+    {'area': 0.0},
+    {'area': 3},
+    {'is_island': 1},
+    {'languages': ('en', 'fr')},
+    {'languages': ('en', 1)},
+    {'ip_addrs': ['127.0.0.1', '1234.5678']},
+    {'capital': {'population': 3}},
+    {'capital': {'name': 'Faketown', 'population': -3}},
+    {'capital': ['Faketown']},
+    {'cities': [{'name': 'Faketown'}, {'name': 'Evergreen', 'population': True}]},
+    {'cities': [{'name': 'Faketown'}, 'Evergreen']},
+]
+
+
+def test_generated_validator_valid():
+    validate = SCHEMA_COUNTRY.generate_validator()
+    assert validate(VALID) is None
+    assert SCHEMA_COUNTRY.generate_validator() is validate
+
+
+@pytest.mark.parametrize('update', INVALID_UPDATES)
+def test_generated_validator_same_errors(update):
+    """Generated validator raises the same errors as 'validate()'"""
+
+    testdict = {**VALID, **update}
+    exp_error = get_error(SCHEMA_COUNTRY.validate, testdict)
+    assert exp_error is not None
+    assert get_error(SCHEMA_COUNTRY.generate_validator(), testdict) == exp_error
+
+
+def test_generated_validator_missing_key_and_testdict_type():
+    validate = SCHEMA_COUNTRY.generate_validator()
+
+    testdict = dict(VALID)
+    del testdict['cities']
+    assert get_error(validate, testdict) == get_error(SCHEMA_COUNTRY.validate, testdict)
+
+    with pytest.raises(TypeError):
+        validate(['not', 'a', 'dict'])
+
+
+def test_generated_validator_custom_validator():
+    def is_divisible(key, value, comp_value, _):
+        if value % comp_value != 0:
+            raise ValueError(f"{key!r} is not divisible by {comp_value}")
+
+    my_validators = ValidatorDict(STANDARD_VALIDATORS)
+    my_validators[int] = {**STANDARD_VALIDATORS[int], '%': is_divisible}
+
+    schema = schemadict({'my_num': {'type': int, '%': 3}}, validators=my_validators)
+    validate = schema.generate_validator()
+
+    validate({'my_num': 33})
+    with pytest.raises(ValueError, match='not divisible'):
+        validate({'my_num': 4})
+
+
+def test_generated_validator_invalidated():
+    schema = schemadict({'a': {'type': int}})
+    validate = schema.generate_validator()
+    validate({'a': 1})
+
+    schema['a'] = {'type': str}
+    assert schema.generate_validator() is not validate
+    schema.generate_validator()({'a': 'string'})
+
+
+def test_generated_validator_recursive_schema():
+    """Recursive schemas are not unrolled infinitely"""
+
+    node = {'value': {'type': int}}
+    node['child'] = {'type': dict, 'schema': node}
+    schema = schemadict(node)
+
+    testdict = {'value': 1, 'child': {'value': 2, 'child': {'value': 'x'}}}
+    assert get_error(schema.generate_validator(), testdict) == get_error(schema.validate, testdict)
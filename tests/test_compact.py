@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pytest
+
+from schemadict import schemadict, footprint
+
+
+def _schema(version):
+    return schemadict({
+        '$required_keys': ['name'],
+        'name': {'type': str, 'min_len': 1},
+        'city': {'type': str, 'min_len': 1},
+        'version': {'type': int, 'one_of': [version]},
+        'pets': {
+            'type': list,
+            'item_schemadict': {'kind': {'type': str, 'one_of': ['cat', 'dog']}},
+        },
+    })
+
+
+def test_slots():
+    schema = _schema(1)
+    assert not hasattr(schema, '__dict__')
+    with pytest.raises(AttributeError):
+        schema.other = 1
+
+
+def test_compact():
+    schemas = [_schema(i % 3) for i in range(100)]
+    before = footprint(*schemas)
+    assert before.entries == before.distinct_entries == 100*5
+
+    for schema in schemas:
+        assert schema.compact() is schema
+    after = footprint(*schemas)
+    assert after.entries == 100*5
+
+    # 'name' and 'city' share an entry, 'version' differs per version
+    assert after.distinct_entries == 1 + 3 + 2
+    assert after.size < before.size/4
+    assert schemas[0]['name'] is schemas[1]['city']
+    assert schemas[0]['version'] is schemas[3]['version']
+
+    testdict = {'name': 'Neil', 'version': 0, 'pets': [{'kind': 'cat'}]}
+    schemas[0].validate(testdict)
+    with pytest.raises(ValueError):
+        schemas[1].validate(testdict)
+    with pytest.raises(ValueError):
+        schemas[3].validate({'name': ''})
+
+    # Compiled checks are shared
+    schemas[3].compile()
+    assert schemas[0]._get_plan().checks_by_key['name'] is schemas[3]._get_plan().checks_by_key['name']
+
+
+def test_compacted_entries_are_read_only():
+    schema = _schema(1).compact()
+    with pytest.raises(TypeError):
+        schema['name']['min_len'] = 3
+
+    # Entries may still be replaced
+    schema['name'] = {'type': str, 'min_len': 3}
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'Al'})
+
+    # Compacted entries are pickled as plain dictionaries
+    entry = pickle.loads(pickle.dumps(schema.compact()['name']))
+    assert type(entry) is dict
+    assert entry == {'type': str, 'min_len': 3}
+
+
+def test_compact_recursive():
+    person = {'name': {'type': str}}
+    person['children'] = {'type': list, 'item_schemadict': person}
+    schema = schemadict(person).compact()
+    schema.validate({'name': 'Neil', 'children': [{'name': 'Anna', 'children': []}]})
+    with pytest.raises(TypeError):
+        schema.validate({'name': 'Neil', 'children': [{'name': 1}]})
+
+    assert schema.footprint().distinct_entries <= schema.footprint().entries
+
+
+def test_compact_defaults():
+    """Default values are not converted (lists remain lists)"""
+
+    schema = schemadict({
+        'tags': {'type': list, 'default': []},
+        'point': {'type': tuple, 'default': (0, 0)},
+        'default': {'type': dict, 'schema': {'default': {'type': list, 'default': ['a']}}},
+    })
+    expected = {'tags': [], 'point': (0, 0), 'default': {'default': ['a']}}
+    assert schema.get_default_value_dict() == expected
+
+    schema.compact()
+    defaults = schema.get_default_value_dict()
+    assert defaults == expected
+    assert type(defaults['tags']) is list
+    assert type(defaults['default']['default']) is list
+
+    testdict = {}
+    schema.validate(testdict, fill_defaults=True)
+    assert testdict == expected
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from schemadict import schemadict, Validators
+
+
+def test_compile_plan():
+    """Only validators for used keywords end up in the plan"""
+
+    schema = schemadict({
+        '$required_keys': ['a'],
+        'a': {'type': int, '>': 0},
+        'b': {'type': str},
+    })
+
+    assert schema.compile() is schema
+    special_checks, key_checks, checks_by_key, _ = schema._plan
+
+    assert [sd_key for _, sd_key, _ in special_checks] == ['$required_keys']
+    assert checks_by_key == dict(key_checks) == {
+        'a': ((Validators.is_type, int), (Validators.is_gt, 0)),
+        'b': ((Validators.is_type, str),),
+    }
+
+
+def test_plan_cached_and_invalidated():
+    """The plan is built on first use and discarded on modification"""
+
+    schema = schemadict({'a': {'type': int}})
+    assert schema._plan is None
+
+    schema.validate({'a': 1})
+    plan = schema._plan
+    assert plan is not None
+
+    schema.validate({'a': 2})
+    assert schema._plan is plan
+
+    schema['b'] = {'type': str, 'min_len': 2}
+    assert schema._plan is None
+    with pytest.raises(ValueError):
+        schema.validate({'a': 1, 'b': 'x'})
+
+    del schema['b']
+    assert schema._plan is None
+    schema.validate({'a': 1, 'b': 'x'})
+
+
+def test_compile_after_in_place_modification():
+    """In place modification of entries requires 'compile()'"""
+
+    schema = schemadict({'a': {'type': int}})
+    schema.validate({'a': 5})
+
+    schema['a']['<'] = 3
+    schema.compile()
+    with pytest.raises(ValueError):
+        schema.validate({'a': 5})
+
+
+def test_nested_schemas_converted_once():
+    """Nested schemas are converted once and reused"""
+
+    schema_city = {'name': {'type': str}, 'population': {'type': int, '>=': 0}}
+    schema = schemadict({
+        'capital': {'type': dict, 'schema': schema_city},
+        'cities': {'type': list, 'item_schemadict': schema_city},
+    })
+
+    testdict = {
+        'capital': {'name': 'A', 'population': 1},
+        'cities': [{'name': 'B', 'population': 2}, {'name': 'C', 'population': 3}],
+    }
+    schema.validate(testdict)
+
+    child = schema._child_schemadict(schema_city)
+    assert isinstance(child, schemadict)
+    assert len(schema._children) == 1
+
+    schema.validate(testdict)
+    assert schema._child_schemadict(schema_city) is child
+
+    testdict['cities'].append({'name': 'D', 'population': -1})
+    with pytest.raises(ValueError):
+        schema.validate(testdict)
+
+    # Cache is discarded with the validation plan
+    schema.compile()
+    assert not schema._children
+
+
+def test_recursive_schema_children():
+    """Recursive schemas resolve to a single nested schemadict"""
+
+    node = {'value': {'type': int}}
+    node['child'] = {'type': dict, 'schema': node}
+    schema = schemadict(node)
+
+    testdict = {'value': 1}
+    for i in range(20):
+        testdict = {'value': i, 'child': testdict}
+    schema.validate(testdict)
+    assert len(schema._children) == 1
+
+    testdict['child']['child']['value'] = 'x'
+    with pytest.raises(TypeError):
+        schema.validate(testdict)
+
+
+def test_regex_compiled_once():
+    """Regex patterns are compiled when the schema is compiled"""
+
+    schema = schemadict({'a': {'type': list, 'item_schema': {'type': str, 'regex': r'\d+'}}})
+    schema.validate({'a': ['1', '22']})
+
+    item_schema = schema['a']['item_schema']
+    (_, _), (_, pattern) = schema._compile_entry(item_schema)
+    assert pattern.pattern == r'\d+'
+    assert item_schema['regex'] == r'\d+'
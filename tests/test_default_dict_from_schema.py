@@ -1,38 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
 
-# SCHEMA_4 = schemadict({
-#     'time': {
-#         'type': str,
-#         'default': time_now
-#     },
-#     'person': {
-#         'type': str,
-#         'default': 'C.Lindbergh'
-#     },
-#     'age': {
-#         'type': int
-#     },
-#     'pets': {
-#         'type': dict,
-#         'schema': {
-#             'dog': {'type': bool, 'default': None},
-#             'cat': {'type': bool}
-#         },
-#     },
-# })
-
-# def test_default_value_dict():
-#     """Test 'get_default_value_dict()'"""
-
-#     defaults = SCHEMA_1.get_default_value_dict()
-#     assert defaults == SCHEMA_1_DEFAULT_VALUE_DICT
-
-#     defaults = SCHEMA_4.get_default_value_dict()
-#     assert isinstance(defaults['time'], str)
-
-#     # Time may vary
-#     del SCHEMA_4_DEFAULT_VALUE_DICT['time']
-#     del defaults['time']
-
-#     assert defaults == SCHEMA_4_DEFAULT_VALUE_DICT
+import pytest
 
+from schemadict import schemadict
 
+from test_basic import (
+    SCHEMA_1,
+    SCHEMA_1_DEFAULT_VALUE_DICT,
+    SCHEMA_4_DEFAULT_VALUE_DICT,
+    time_now,
+)
+
+SCHEMA_4 = schemadict({
+    'time': {
+        'type': str,
+        'default': time_now
+    },
+    'person': {
+        'type': str,
+        'default': 'C.Lindbergh'
+    },
+    'age': {
+        'type': int
+    },
+    'pets': {
+        'type': dict,
+        'schema': {
+            'dog': {'type': bool, 'default': None},
+            'cat': {'type': bool}
+        },
+    },
+})
+
+
+def test_default_value_dict():
+    """Test 'get_default_value_dict()'"""
+
+    defaults = SCHEMA_1.get_default_value_dict()
+    assert defaults == SCHEMA_1_DEFAULT_VALUE_DICT
+
+    defaults = SCHEMA_4.get_default_value_dict()
+    assert isinstance(defaults['time'], str)
+
+    # Time may vary
+    expected = dict(SCHEMA_4_DEFAULT_VALUE_DICT)
+    del expected['time']
+    del defaults['time']
+
+    assert defaults == expected
+
+
+def test_default_values_are_not_shared():
+    schema = schemadict({
+        'tags': {'type': list},
+        'colors': {'type': list, 'default': ['red']},
+        'size': {'type': tuple, 'default': (1, 2)},
+        'nested': {'type': dict, 'schema': {'items': {'type': list}}},
+    })
+
+    first = schema.get_default_value_dict()
+    assert first == {'tags': [], 'colors': ['red'], 'size': (1, 2), 'nested': {'items': []}}
+    first['tags'].append(1)
+    first['colors'].append('blue')
+    first['nested']['items'].append(1)
+
+    second = schema.get_default_value_dict()
+    assert second == {'tags': [], 'colors': ['red'], 'size': (1, 2), 'nested': {'items': []}}
+    assert list(second) == ['tags', 'colors', 'size', 'nested']
+
+
+def test_recursive_schema_defaults():
+    person = {'name': {'type': str, 'default': 'Neil'}}
+    person['partner'] = {'type': dict, 'schema': person}
+    defaults = schemadict(person).get_default_value_dict()
+    assert defaults['name'] == 'Neil'
+    assert defaults['partner']['name'] == 'Neil'
+
+
+def test_validate_fill_defaults():
+    testdict = {'age': 22, 'pets': {'cat': True}}
+    SCHEMA_4.validate(testdict, fill_defaults=True)
+    assert testdict['person'] == 'C.Lindbergh'
+    assert testdict['pets'] == {'dog': None, 'cat': True}
+    assert isinstance(testdict['time'], str)
+
+    testdict = {'age': 22}
+    SCHEMA_4.validate(testdict, fill_defaults=True)
+    assert testdict['pets'] == {'dog': None, 'cat': False}
+
+    # Invalid test dictionaries are not modified
+    testdict = {'age': 'old'}
+    with pytest.raises(TypeError):
+        SCHEMA_4.validate(testdict, fill_defaults=True)
+    assert testdict == {'age': 'old'}
+
+    # Required keys are checked before defaults are added
+    with pytest.raises(KeyError):
+        SCHEMA_1.validate({'name': 'Neil'}, fill_defaults=True)
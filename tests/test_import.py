@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+
+SCRIPT = """
+import sys
+before = set(sys.modules)
+import schemadict
+print(','.join(set(sys.modules) - before))
+"""
+
+
+def test_lazy_imports():
+    """Optional machinery is not imported by 'import schemadict'"""
+
+    proc = subprocess.run(
+        [sys.executable, '-c', SCRIPT],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    modules = set(proc.stdout.strip().split(','))
+    assert 'schemadict' in modules
+    for name in ('asyncio', 'concurrent.futures', 'numpy', 'schemadict._codegen', 'difflib', 'pickle'):
+        assert name not in modules
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from schemadict import (
+    LazyError,
+    schemadict,
+    SpecialValidators,
+    STANDARD_VALIDATORS,
+    ValidatorDict,
+    Validators,
+)
+
+SCHEMA_CITY = schemadict({
+    '$required_keys': ['name'],
+    'name': {'type': str, 'min_len': 1},
+    'population': {'type': int, '>=': 0},
+})
+
+SCHEMA = schemadict({
+    '$required_keys': ['name'],
+    'name': {'type': str, 'max_len': 12, 'regex': r'[A-Z]', 'regex_full': r'\w+'},
+    'code': {'type': str, 'one_of': ['NL', 'SE']},
+    'area': {'type': float, '>': 0, '<': 1e8},
+    'is_island': {'type': bool},
+    'languages': {'type': tuple, 'item_types': str, 'allowed_items': ('en', 'nl')},
+    'samples': {'type': list, 'item_schema': {'type': float, '<=': 1}},
+    'capital': {'type': dict, 'schema': SCHEMA_CITY},
+    'cities': {'type': list, 'item_schemadict': SCHEMA_CITY},
+})
+
+VALID = {
+    'name': 'Neverland',
+    'code': 'NL',
+    'area': 3.5,
+    'is_island': False,
+    'languages': ('en', 'nl'),
+    'samples': [0.5]*2000,
+    'capital': {'name': 'Faketown', 'population': 3},
+    'cities': [{'name': 'Faketown', 'population': 3}, {'name': 'Evergreen'}],
+}
+
+INVALID_UPDATES = [
+    {'name': 'neverland'},
+    {'name': 'Never-land'},
+    {'name': 'NeverlandNeverland'},
+    {'name': True},
+    {'code': 'XX'},
+    {'code': 'NL ', 'area': 0.0},
+    {'area': 3},
+    {'is_island': 1},
+    {'languages': ('en', 'fr')},
+    {'languages': ('en', ['nl'])},
+    {'samples': [0.5]*1999 + [1.5]},
+    {'samples': [0.5, 1.5]},
+    {'capital': {'population': 3}},
+    {'capital': {'name': 'Faketown', 'population': -3}},
+    {'cities': [{'name': 'Faketown'}, {'name': 'Evergreen', 'population': True}]},
+    {'cities': [{'name': 'Faketown'}, 'Evergreen']},
+]
+
+
+def _get_error(testdict):
+    try:
+        SCHEMA.validate(testdict)
+    except Exception as e:
+        return type(e), str(e)
+    return None
+
+
+def test_is_valid():
+    assert SCHEMA.is_valid(VALID)
+    assert SCHEMA.get_error(VALID) is None
+
+    assert not SCHEMA.is_valid({'code': 'NL'})
+    assert not SCHEMA.is_valid(['not', 'a', 'dict'])
+
+
+@pytest.mark.parametrize('update', INVALID_UPDATES)
+def test_get_error_same_as_validate(update):
+    testdict = {**VALID, **update}
+    assert not SCHEMA.is_valid(testdict)
+
+    error = SCHEMA.get_error(testdict)
+    assert isinstance(error, LazyError)
+    assert (type(error.exception), error.message) == _get_error(testdict)
+    with pytest.raises(type(error.exception)):
+        error.raise_error()
+
+
+def test_lazy_error_message():
+    """Error messages are only built on access"""
+
+    num_calls = 0
+
+    def is_even(key, value, exp_value, _):
+        nonlocal num_calls
+        num_calls += 1
+        if value % 2:
+            raise ValueError(f"{key!r} is not even")
+
+    my_validators = ValidatorDict(STANDARD_VALIDATORS)
+    my_validators[int] = {'type': Validators.is_type, 'even': is_even}
+    schema = schemadict({'a': {'type': int, 'even': True}}, validators=my_validators)
+
+    # Validators without predicate are called
+    assert schema.is_valid({'a': 2})
+    assert not schema.is_valid({'a': 3})
+    assert num_calls == 2
+
+    # Opt in to predicate protocol
+    Validators.PREDICATES[is_even] = lambda value, exp_value, _: value % 2 == 0
+    try:
+        assert schema.is_valid({'a': 2})
+        error = schema.get_error({'a': 3})
+        assert num_calls == 2
+
+        assert str(error) == "'a' is not even"
+        assert num_calls == 3
+        assert isinstance(error.exception, ValueError)
+        assert num_calls == 3
+    finally:
+        del Validators.PREDICATES[is_even]
+
+
+def test_predicate_errors(monkeypatch):
+    """Errors raised by predicates are returned, not raised"""
+
+    from numbers import Number
+
+    schema = schemadict({'a': {'type': Number, '>': 0}})
+    testdict = {'a': 1j}
+
+    assert not schema.is_valid(testdict)
+    error = schema.get_error(testdict)
+    assert isinstance(error.exception, TypeError)
+    with pytest.raises(TypeError):
+        schema.validate(testdict)
+
+    def raise_type_error(*args):
+        raise TypeError("unexpected")
+
+    predicates = dict(SpecialValidators.PREDICATES)
+    predicates[SpecialValidators.check_allowed_keys] = raise_type_error
+    monkeypatch.setattr(SpecialValidators, 'PREDICATES', predicates)
+
+    schema = schemadict({'$allowed_keys': ['a'], 'a': {'type': int}})
+    assert not schema.is_valid({'a': 1})
+    assert schema.get_error({'a': 1}).message == "unexpected"
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pytest
+
+from schemadict import (
+    schemadict,
+    SchemaError,
+    SpecialValidators,
+    STANDARD_VALIDATORS,
+    ValidatorDict,
+    Validators,
+)
+
+# Note: other tests add local validator functions to 'STANDARD_VALIDATORS'
+VALIDATORS = ValidatorDict({
+    '$required_keys': SpecialValidators.check_req_keys_in_dict,
+    dict: {'type': Validators.is_type},
+    int: {'type': Validators.is_type, '>=': Validators.is_ge},
+    list: {'type': Validators.is_type, 'item_schemadict': Validators.check_item_schemadict},
+    str: {'type': Validators.is_type, 'regex': Validators.check_regex_match},
+})
+
+SCHEMA = schemadict({
+    '$required_keys': ['name'],
+    'name': {'type': str, 'regex': r'[A-Z]'},
+    'cities': {
+        'type': list,
+        'item_schemadict': {'population': {'type': int, '>=': 0}},
+    },
+}, validators=VALIDATORS)
+
+
+def has_name(key, value, exp_name, _):
+    # Note: raises 'AttributeError' for values without attribute 'name'
+    if (value.name == exp_name) is not True:
+        raise ValueError(f"{key!r} has wrong name")
+
+
+class Named:
+    def __init__(self, name):
+        self.name = name
+
+
+VALIDATORS_NAMED = ValidatorDict({
+    object: {'type': Validators.is_type, 'name': has_name},
+})
+
+
+def _records(n):
+    for i in range(n):
+        if i % 7 == 0:
+            yield {'name': 'Neverland', 'cities': [{'population': -i - 1}]}
+        elif i % 11 == 0:
+            yield {'cities': []}
+        else:
+            yield {'name': 'Neverland', 'cities': [{'population': i}]}
+
+
+def test_pickle_schemadict():
+    SCHEMA.validate({'name': 'Neverland'})
+    SCHEMA.generate_validator()
+
+    schema = pickle.loads(pickle.dumps(SCHEMA))
+    assert schema == SCHEMA
+    assert schema._plan is None
+    assert schema.validators == SCHEMA.validators
+    schema.validate({'name': 'Neverland'})
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'neverland'})
+
+
+def test_validate_parallel():
+    result = SCHEMA.validate_parallel(_records(1000), workers=2, chunksize=64)
+    exp_result = SCHEMA.validate_many(_records(1000))
+
+    assert result.valid == exp_result.valid
+    assert sorted(result.errors) == sorted(exp_result.errors)
+    for i, error in result.errors.items():
+        assert type(error) is type(exp_result.errors[i])
+        assert str(error) == str(exp_result.errors[i])
+        assert error.__traceback__ is None
+
+
+def test_validate_parallel_not_picklable():
+    my_validators = ValidatorDict(STANDARD_VALIDATORS)
+    my_validators[int] = {**STANDARD_VALIDATORS[int], 'even': lambda k, v, e, _: None}
+
+    schema = schemadict({'a': {'type': int, 'even': True}}, validators=my_validators)
+    with pytest.raises(SchemaError):
+        schema.validate_parallel([{'a': 2}], workers=1)
+
+
+def test_validate_parallel_unexpected_errors():
+    """Any error raised by a validator function is reported for its record"""
+
+    schema = schemadict({'a': {'type': object, 'name': 'x'}}, validators=VALIDATORS_NAMED)
+    records = [{'a': Named('x')}, {'a': 5}, {'a': Named('y')}, {'a': Named('x')}]
+
+    result = schema.validate_parallel(records, workers=1, chunksize=2)
+    assert list(result.valid) == [1, 0, 0, 1]
+    assert isinstance(result.errors[1], AttributeError)
+    assert result.errors[1].__traceback__ is None
+    assert isinstance(result.errors[2], ValueError)
+
+
+def test_validate_parallel_after_local_subclass():
+    """Validators resolved for local classes are not sent to workers"""
+
+    class Local(int):
+        pass
+
+    validators = ValidatorDict(VALIDATORS)
+    schemadict({'a': {'type': Local, '>=': 0}}, validators=validators).validate({'a': Local(1)})
+
+    schema = schemadict({'a': {'type': int, '>=': 0}}, validators=validators)
+    result = schema.validate_parallel([{'a': 1}, {'a': -1}], workers=1)
+    assert list(result.valid) == [1, 0]
+
+    copied = pickle.loads(pickle.dumps(validators))
+    assert copied.for_type(bool) is copied[int]
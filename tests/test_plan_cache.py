@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import re
+import subprocess
+import sys
+
+import pytest
+
+from schemadict import schemadict, ValidatorDict, STANDARD_VALIDATORS
+
+needs_cpython = pytest.mark.skipif(
+    sys.implementation.name != 'cpython', reason="regex cache requires CPython"
+)
+
+
+def _is_even(key, value, is_even, _):
+    if is_even and value % 2:
+        raise ValueError(f"{key!r}: value {value!r} is not even")
+
+
+VALIDATORS = ValidatorDict({
+    int: {**STANDARD_VALIDATORS[int], 'even': _is_even},
+    str: STANDARD_VALIDATORS[str],
+    list: STANDARD_VALIDATORS[list],
+    dict: STANDARD_VALIDATORS[dict],
+    '$required_keys': STANDARD_VALIDATORS['$required_keys'],
+})
+
+
+def _schema(min_len=1):
+    return schemadict({
+        '$required_keys': ['name'],
+        'name': {'type': str, 'min_len': min_len, 'regex': '[A-Z]'},
+        'age': {'type': int, 'even': True},
+        'tags': {'type': list, 'item_schema': {'type': str, 'one_of': ['a', 'b']}},
+        'pets': {'type': list, 'item_schemadict': {'kind': {'type': str, 'min_len': 3}}},
+    }, validators=VALIDATORS)
+
+
+def _check(schema):
+    schema.validate({'name': 'Neil', 'age': 2, 'tags': ['a'], 'pets': [{'kind': 'cat'}]})
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'Neil', 'age': 3})
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'Neil', 'tags': ['c']})
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'Neil', 'pets': [{'kind': 'ox'}]})
+    with pytest.raises(KeyError):
+        schema.validate({})
+
+
+def test_fingerprint():
+    assert _schema().fingerprint() == _schema().fingerprint()
+    assert _schema().fingerprint() != _schema(min_len=2).fingerprint()
+
+    schema = _schema()
+    fingerprint = schema.fingerprint()
+    schema.regex_flags = 2
+    assert schema.fingerprint() != fingerprint
+
+
+def test_fingerprint_independent_of_hash_seed():
+    """Sets of strings are iterated in different orders in other processes"""
+
+    script = (
+        "from schemadict import schemadict; " +
+        "print(schemadict({'a': {'type': str, 'one_of': {'x', 'y', 'z', 'w'}}}).fingerprint())"
+    )
+    fingerprints = set()
+    for seed in ('1', '2', '3'):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=os.pathsep.join(sys.path))
+        proc = subprocess.run(
+            [sys.executable, '-c', script], stdout=subprocess.PIPE,
+            universal_newlines=True, check=True, env=env,
+        )
+        fingerprints.add(proc.stdout.strip())
+    assert len(fingerprints) == 1
+
+
+@pytest.fixture
+def loaded_regexes(monkeypatch):
+    """Regexes loaded from cache files (discarded after the test)"""
+
+    monkeypatch.setattr(sys.modules['schemadict.schemadict'], '_loaded_regexes', {})
+    return sys.modules['schemadict.schemadict']._loaded_regexes
+
+
+@needs_cpython
+def test_plan_cache(tmp_path, loaded_regexes):
+    cache_file = tmp_path / 'schema.cache'
+
+    schema = _schema().compile(cache_file=cache_file)
+    assert cache_file.exists()
+    assert not loaded_regexes
+    _check(schema)
+
+    # Regexes are loaded (not compiled) from the cache file
+    schema = _schema().compile(cache_file=cache_file)
+    assert list(loaded_regexes) == [('[A-Z]', 0)]
+    assert schema._get_plan().checks_by_key['name'][-1][1] is loaded_regexes[('[A-Z]', 0)]
+    assert len(schema._children) == 1
+    _check(schema)
+
+    # New regexes are added to the cache file
+    schema = _schema()
+    schema['code'] = {'type': str, 'regex': '[0-9]+'}
+    schema.regex_flags = re.I
+    schema.compile(cache_file=cache_file)
+    loaded_regexes.clear()
+    schema.compile(cache_file=cache_file)
+    assert set(loaded_regexes) == {('[A-Z]', 0), ('[A-Z]', re.I), ('[0-9]+', re.I)}
+    schema.validate({'name': 'neil', 'code': '42'})
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'neil', 'code': 'x'})
+
+
+@needs_cpython
+def test_plan_cache_same_as_compiled(loaded_regexes, tmp_path):
+    cache_file = tmp_path / 'schema.cache'
+    patterns = [r'(?P<user>[\w.]+)@(?P<domain>\w+)\.com', r'(?i)[a-z]{2,}\d*$', r'\bx\b|[^\W\d]']
+
+    schema = schemadict({f"k{i}": {'type': str, 'regex_full': p} for i, p in enumerate(patterns)})
+    schema.compile(cache_file=cache_file)
+    schema.compile(cache_file=cache_file)
+
+    for pattern in patterns:
+        regex, expected = loaded_regexes[(pattern, 0)], re.compile(pattern)
+        assert regex == expected
+        assert (regex.flags, regex.groups, regex.groupindex) == \
+            (expected.flags, expected.groups, expected.groupindex)
+        for string in ('neil@example.com', 'Ab12', 'x', '12', ''):
+            match, expected_match = regex.fullmatch(string), expected.fullmatch(string)
+            assert (match and match.groupdict()) == (expected_match and expected_match.groupdict())
+
+
+def test_plan_cache_fallback(tmp_path, loaded_regexes):
+    cache_file = tmp_path / 'schema.cache'
+    cache_file.write_bytes(b'corrupt')
+    _check(_schema().compile(cache_file=cache_file))
+
+    # Files written by other Python versions are ignored
+    cache_file.write_bytes(pickle.dumps({'version': None, 'regexes': {('[A-Z]', 0): ('invalid',)}}))
+    _check(_schema().compile(cache_file=cache_file))
+    assert not loaded_regexes
+
+    # Nothing is written for schemas without regexes
+    cache_file = tmp_path / 'no_regex.cache'
+    schemadict({'a': {'type': int}}).compile(cache_file=cache_file)
+    assert not cache_file.exists()
+    assert all(path.suffix == '.cache' for path in tmp_path.iterdir())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from schemadict import schemadict, ProfileStats, Validators
+
+SCHEMA = {
+    '$required_keys': ['name'],
+    'name': {'type': str, 'min_len': 3},
+    'age': {'type': int, '>=': 0},
+    'address': {
+        'type': dict,
+        'schema': {'city': {'type': str, 'regex': '[A-Z]'}},
+    },
+    'pets': {
+        'type': list,
+        'item_schemadict': {'kind': {'type': str, 'one_of': ['cat', 'dog']}},
+    },
+}
+
+
+def test_profiling_disabled():
+    schema = schemadict(SCHEMA)
+    assert schema.profile_stats is None
+    _, key_checks, _, _ = schema._get_plan()
+    assert dict(key_checks)['age'][0] == (Validators.is_type, int)
+
+
+def test_profiling():
+    schema = schemadict(SCHEMA)
+    stats = schema.enable_profiling()
+    assert isinstance(stats, ProfileStats)
+    assert schema.profile_stats is stats
+
+    testdict = {
+        'name': 'Neil',
+        'age': 22,
+        'address': {'city': 'Stockholm'},
+        'pets': [{'kind': 'cat'}, {'kind': 'dog'}],
+    }
+    for _ in range(3):
+        schema.validate(testdict)
+    with pytest.raises(ValueError):
+        schema.validate({'name': 'Neil', 'age': -1})
+
+    records = {(r.path, r.keyword): r for r in stats.records()}
+    assert records[('', '$required_keys')].calls == 4
+    assert records[('age', 'type')].calls == 4
+    assert records[('age', '>=')].calls == 4
+    assert records[('age', '>=')].failures == 1
+    assert records[('address.city', 'regex')].calls == 3
+    assert records[('pets[].kind', 'one_of')].calls == 6
+    assert records[('pets', 'item_schemadict')].failures == 0
+
+    assert records[('address', 'schema')].time >= records[('address.city', 'regex')].time
+    assert len(stats.top(3)) == 3
+    assert stats.top(1, sort_by='failures')[0].keyword == '>='
+    assert 'pets[].kind' in stats.report()
+
+    stats.reset()
+    assert all(r.calls == 0 for r in stats.records())
+
+    schema.disable_profiling()
+    schema.validate(testdict)
+    assert all(r.calls == 0 for r in stats.records())
+
+
+def test_profiling_hook():
+    calls = []
+    schema = schemadict(SCHEMA)
+    schema.enable_profiling(hook=lambda *args: calls.append(args))
+
+    assert not schema.is_valid({'name': 'Al'})
+    path, keyword, elapsed, failed = calls[-1]
+    assert (path, keyword, failed) == ('name', 'min_len', True)
+    assert elapsed >= 0
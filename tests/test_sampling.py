@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pytest
+
+from schemadict import schemadict, SamplingPolicy
+
+SCHEMA = {
+    'values': {'type': list, 'item_schema': {'type': int, '>=': 0}},
+    'points': {'type': list, 'item_schemadict': {'x': {'type': float}}},
+}
+
+
+def _testdict(num_items):
+    return {
+        'values': list(range(num_items)),
+        'points': [{'x': float(i)} for i in range(num_items)],
+    }
+
+
+def test_policy_indices():
+    policy = SamplingPolicy(head=2, tail=3, stride=10, min_items=0)
+    assert list(policy.indices(4)) == [0, 1, 2, 3]
+    assert policy.indices(40) == [0, 1, 2, 12, 22, 32, 37, 38, 39]
+
+    policy = SamplingPolicy(head=5, tail=5, rate=0.1, seed=42)
+    indices = policy.indices(10000)
+    assert indices == policy.indices(10000)
+    assert indices[:5] == [0, 1, 2, 3, 4]
+    assert indices[-5:] == [9995, 9996, 9997, 9998, 9999]
+    assert len(indices) == 10 + 999
+    assert indices == sorted(set(indices))
+    assert len(policy.indices(999)) == 999
+
+    with pytest.raises(ValueError):
+        SamplingPolicy(rate=2)
+
+    with pytest.raises(ValueError):
+        SamplingPolicy(stride=0)
+
+
+def test_full_validation_is_default():
+    schema = schemadict(SCHEMA)
+    testdict = _testdict(5000)
+    testdict['values'][2500] = -1
+    with pytest.raises(ValueError):
+        schema.validate(testdict)
+
+    report = schema.validate_sampled(_testdict(5000))
+    assert report.num_lists == 2
+    assert report.num_items == report.num_checked == 10000
+    assert report.coverage == 1.0
+
+
+def test_validate_sampled():
+    schema = schemadict(SCHEMA)
+    policy = SamplingPolicy(head=10, tail=10, stride=100)
+
+    testdict = _testdict(10000)
+    testdict['values'][5050] = -1
+    report = schema.validate_sampled(testdict, policy)
+    assert report.num_items == 20000
+    assert report.num_checked == 2*(20 + 100)
+    assert report.coverage == pytest.approx(0.012)
+
+    # Invalid items in the head, the tail or the sample are found
+    for index in (5, 9995, 5010):
+        testdict = _testdict(10000)
+        testdict['points'][index] = {'x': 'invalid'}
+        with pytest.raises(TypeError):
+            schema.validate_sampled(testdict, policy)
+
+
+def test_schema_policy():
+    policy = SamplingPolicy(stride=100)
+    schema = schemadict({
+        'nested': {'type': dict, 'schema': SCHEMA},
+    }, sampling=policy)
+
+    testdict = {'nested': _testdict(10000)}
+    testdict['nested']['values'][5050] = -1
+    schema.validate(testdict)
+    schema.generate_validator()(testdict)
+    assert schema.is_valid(testdict)
+    assert schema.validate_sampled(testdict).coverage < 0.05
+
+    schema.sampling = None
+    assert not schema.is_valid(testdict)
+
+    # Note: the policy is pickled with the schemadict state
+    state = schemadict(SCHEMA, sampling=policy).__getstate__()
+    assert pickle.loads(pickle.dumps(state['sampling'])).stride == 100
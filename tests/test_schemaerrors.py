@@ -20,3 +20,53 @@ def test_valid_keys():
     schemadict()['c'] = {'type': int}
     with pytest.raises(SchemaError):
         schemadict()[42] = {'type': int}
+
+
+def test_meta_schema():
+    """Schema entries are checked when they are defined"""
+
+    with pytest.raises(SchemaError, match="did you mean 'max_len'"):
+        schemadict({'name': {'type': str, 'max_length': 3}})
+
+    with pytest.raises(SchemaError, match="must define a 'type'"):
+        schemadict({'name': {'min_len': 3}})
+
+    with pytest.raises(SchemaError, match="must be a mapping"):
+        schemadict({'name': str})
+
+    with pytest.raises(SchemaError, match="did you mean '\\$required_keys'"):
+        schemadict({'$required_key': ['name']})
+
+    # Unhashable types
+    with pytest.raises(SchemaError, match="validator functions not defined for type \\[<class 'int'>\\]"):
+        schemadict({'name': {'type': [int]}})
+
+    # Nested schemas
+    with pytest.raises(SchemaError):
+        schemadict({'a': {'type': dict, 'schema': {'b': {'type': int, 'max': 3}}}})
+
+    with pytest.raises(SchemaError):
+        schemadict({'a': {'type': list, 'item_schema': {'type': int, 'max': 3}}})
+
+    with pytest.raises(SchemaError):
+        schemadict({'a': {'type': list, 'item_schemadict': {'b': {'type': int, 'max': 3}}}})
+
+    with pytest.raises(SchemaError, match="'a\\[\\]': schema entry must define a 'type'"):
+        schemadict({'a': {'type': bytes, 'item_schema': {'max': 3}}})
+
+    # Invalid entries are not added
+    schema = schemadict({'a': {'type': int}})
+    with pytest.raises(SchemaError):
+        schema['b'] = {'type': int, 'one_off': [1, 2]}
+    assert 'b' not in schema
+
+
+def test_meta_schema_recursive():
+    schema = {'name': {'type': str}}
+    schema['children'] = {'type': list, 'item_schemadict': schema}
+    schemadict(schema).validate({'name': 'Neil', 'children': [{'name': 'Anna'}]})
+
+
+def test_trusted():
+    schema = schemadict({'name': {'type': str, 'max_length': 3}}, trusted=True)
+    schema.validate({'name': 'Neil'})
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from schemadict import schemadict, ValidatedDict
+
+
+def test_required_keys():
+    schema = schemadict({
+        '$required_keys': ['name', 'age'],
+        'name': {'type': str},
+        'age': {'type': int},
+    })
+
+    schema.validate({'name': 'Neil', 'age': 22, 'other': None})
+    with pytest.raises(KeyError, match="required key 'age' not found"):
+        schema.validate({'name': 'Neil'})
+
+    assert schema.generate_validator()({'name': 'Neil', 'age': 22}) is None
+    with pytest.raises(KeyError, match="required key 'age' not found"):
+        schema.generate_validator()({'name': 'Neil'})
+
+    # The first missing key in the declared order is reported
+    with pytest.raises(KeyError, match="required key 'name' not found"):
+        schema.validate({})
+    with pytest.raises(KeyError, match="required key 'name' not found"):
+        schema.generate_validator()({})
+
+
+def test_allowed_keys():
+    schema = schemadict({
+        '$allowed_keys': ['name', 'age', 'city'],
+        'name': {'type': str},
+        'age': {'type': int},
+    })
+
+    schema.validate({'name': 'Neil', 'city': 'Stockholm'})
+    assert schema.is_valid({})
+    assert not schema.is_valid({'name': 'Neil', 'pets': []})
+
+    for validate in (schema.validate, schema.generate_validator()):
+        with pytest.raises(KeyError, match="key 'pets' not allowed"):
+            validate({'name': 'Neil', 'pets': []})
+
+
+def test_strict():
+    schema = schemadict({
+        '$strict': True,
+        'name': {'type': str},
+        'age': {'type': int},
+    })
+
+    schema.validate({'name': 'Neil', 'age': 22})
+    assert not schema.is_valid({'name': 'Neil', 'city': 'Stockholm'})
+    for validate in (schema.validate, schema.generate_validator()):
+        with pytest.raises(KeyError, match="'\\$strict': key 'city' not allowed"):
+            validate({'name': 'Neil', 'city': 'Stockholm'})
+
+    # Keys added later are part of the schema
+    schema['city'] = {'type': str}
+    schema.validate({'name': 'Neil', 'city': 'Stockholm'})
+
+    schema['$strict'] = False
+    schema.validate({'name': 'Neil', 'pets': []})
+
+
+def test_strict_nested():
+    schema = schemadict({
+        'person': {
+            'type': dict,
+            'schema': {'$strict': True, 'name': {'type': str}},
+        },
+    })
+
+    schema.validate({'person': {'name': 'Neil'}, 'other': 1})
+    with pytest.raises(KeyError):
+        schema.validate({'person': {'name': 'Neil', 'age': 22}})
+
+
+def test_validated_dict_allowed_keys():
+    schema = schemadict({
+        '$strict': True,
+        '$required_keys': ['name'],
+        'name': {'type': str},
+        'age': {'type': int},
+    })
+
+    cfg = ValidatedDict(schema, name='Neil')
+    cfg['age'] = 22
+    del cfg['age']
+
+    with pytest.raises(KeyError):
+        cfg['city'] = 'Stockholm'
+
+    with pytest.raises(KeyError):
+        cfg.update(age=33, city='Stockholm')
+    assert dict(cfg) == {'name': 'Neil'}
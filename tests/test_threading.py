@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+
+import pytest
+
+from schemadict import schemadict, STANDARD_VALIDATORS, ValidatorDict
+
+SCHEMA = schemadict({
+    '$required_keys': ['id', 'name'],
+    'id': {'type': int},
+    'name': {'type': str},
+    'child': {
+        'type': dict,
+        'schema': {
+            '$required_keys': ['id'],
+            'id': {'type': int},
+        },
+    },
+})
+
+
+def _record(i):
+    """Every third record is missing a (nested) required key"""
+
+    if i % 3 == 0:
+        return {'id': i}
+    elif i % 3 == 1:
+        return {'id': i, 'name': 'a', 'child': {'name': 'b'}}
+    return {'id': i, 'name': 'a', 'child': {'id': i}}
+
+
+def _is_valid(i):
+    try:
+        SCHEMA.validate(_record(i))
+    except KeyError:
+        return False
+    return True
+
+
+def test_shared_schema_many_threads():
+    """A single schemadict can be used from many threads at the same time"""
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(_is_valid, range(20000)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert results == [i % 3 == 2 for i in range(20000)]
+
+
+def _schema():
+    return schemadict({
+        '$required_keys': ['id'],
+        'id': {'type': int},
+        'tags': {'type': list, 'item_schema': {'type': str, 'min_len': 1}},
+        'child': {
+            'type': dict,
+            'schema': {
+                '$required_keys': ['id'],
+                'id': {'type': int},
+                'points': {'type': list, 'item_schemadict': {'x': {'type': float}}},
+            },
+        },
+    })
+
+
+def _validate_all(schema, num_records):
+    """Validate records, return the number of unexpected outcomes"""
+
+    num_unexpected = 0
+    for i in range(num_records):
+        testdict = {'id': i, 'tags': ['a']*5, 'child': {'id': i, 'points': [{'x': 1.0}]*5}}
+        if i % 2:
+            testdict['child']['points'].append({'x': 'not_a_float'})
+        try:
+            schema.validate(testdict)
+        except TypeError:
+            num_unexpected += not i % 2
+        else:
+            num_unexpected += i % 2
+    return num_unexpected
+
+
+def _run_threads(func, num_threads=8):
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [executor.submit(func) for _ in range(num_threads)]
+            return [future.result() for future in futures]
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_cold_start_many_threads():
+    """Threads may compile a shared schemadict at the same time"""
+
+    for _ in range(50):
+        schema = _schema()
+        assert _run_threads(lambda: _validate_all(schema, 20)) == [0]*8
+
+
+def test_generation_changed_while_validating():
+    """Modifying an unrelated 'ValidatorDict' does not disturb validation"""
+
+    class MyType:
+        pass
+
+    def touch_validators():
+        my_validators = ValidatorDict(STANDARD_VALIDATORS)
+        while not stop.is_set():
+            my_validators.register_type(MyType)
+
+    schema = _schema()
+    stop = threading.Event()
+    thread = threading.Thread(target=touch_validators)
+    thread.start()
+    try:
+        assert _run_threads(lambda: _validate_all(schema, 3000)) == [0]*8
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_generation_changed_while_creating_nested_schemadict():
+    """
+    The plan of a schemadict may be rebuilt (e.g. by another thread) while
+    a nested schemadict is being created
+    """
+
+    class InterruptingSchema(dict):
+        def __iter__(self):
+            if not interrupted:
+                interrupted.append(True)
+                ValidatorDict(STANDARD_VALIDATORS).register_type(InterruptingSchema)
+                schema._get_plan()
+            return super().__iter__()
+
+    interrupted = []
+    schema = schemadict({
+        'child': {'type': dict, 'schema': InterruptingSchema({'id': {'type': int}})},
+    })
+    schema.validate({'child': {'id': 1}})
+    assert interrupted
+
+    with pytest.raises(TypeError):
+        schema.validate({'child': {'id': 'a'}})
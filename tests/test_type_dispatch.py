@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from enum import IntEnum
+
+import pytest
+
+from schemadict import schemadict, SchemaError, ValidatorDict, Validators
+
+
+class Color(IntEnum):
+    RED = 1
+    BLUE = 2
+
+
+def test_subclass_types():
+    schema = schemadict({
+        'color': {'type': Color, '>=': 2},
+        'config': {'type': OrderedDict, 'schema': {'name': {'type': str}}},
+    })
+
+    schema.validate({'color': Color.BLUE, 'config': OrderedDict(name='Neil')})
+
+    with pytest.raises(ValueError):
+        schema.validate({'color': Color.RED})
+
+    with pytest.raises(TypeError):
+        schema.validate({'color': 2})
+
+    with pytest.raises(TypeError):
+        schema.validate({'config': {'name': 'Neil'}})
+
+
+def test_for_type():
+    class MyInt(int):
+        pass
+
+    validators = ValidatorDict({int: {'type': Validators.is_type}})
+    assert validators.for_type(int) is validators[int]
+    assert validators.for_type(MyInt) is validators[int]
+
+    # Registered subclasses take precedence
+    validators[MyInt] = {'type': Validators.is_type, '>': Validators.is_gt}
+    assert validators.for_type(MyInt) is validators[MyInt]
+
+    del validators[MyInt]
+    assert validators.for_type(MyInt) is validators[int]
+
+    with pytest.raises(SchemaError):
+        validators.for_type(str)
+
+    with pytest.raises(SchemaError):
+        schemadict({'a': {'type': set}}).validate({'a': set()})
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections.abc import MutableMapping
+
+import pytest
+
+from schemadict import schemadict, ValidatedDict
+
+SCHEMA = schemadict({
+    '$required_keys': ['name', 'age'],
+    'name': {'type': str, 'min_len': 3},
+    'age': {'type': int, '>=': 0},
+    'pets': {'type': list, 'item_types': str},
+})
+
+
+def test_validated_dict():
+    cfg = ValidatedDict(SCHEMA, name='Neil', age=22)
+    assert isinstance(cfg, MutableMapping)
+    assert cfg == {'name': 'Neil', 'age': 22}
+
+    cfg['age'] = 23
+    cfg['pets'] = ['cat']
+    cfg['other'] = 'not_in_schema'
+    cfg.update({'name': 'Anna'}, age=30)
+    assert dict(cfg) == {'name': 'Anna', 'age': 30, 'pets': ['cat'], 'other': 'not_in_schema'}
+
+    del cfg['pets']
+    assert 'pets' not in cfg
+    assert repr(cfg) == "ValidatedDict({'name': 'Anna', 'age': 30, 'other': 'not_in_schema'})"
+
+
+def test_invalid_initial_content():
+    with pytest.raises(KeyError):
+        ValidatedDict(SCHEMA, name='Neil')
+
+    with pytest.raises(ValueError):
+        ValidatedDict(SCHEMA, name='Neil', age=-1)
+
+
+def test_invalid_updates():
+    cfg = ValidatedDict(SCHEMA, name='Neil', age=22)
+
+    with pytest.raises(ValueError):
+        cfg['age'] = -1
+
+    with pytest.raises(TypeError):
+        cfg['pets'] = ['cat', 5]
+
+    # Invalid update is not applied at all
+    with pytest.raises(ValueError):
+        cfg.update(age=44, name='A')
+
+    with pytest.raises(KeyError):
+        del cfg['name']
+
+    with pytest.raises(KeyError):
+        cfg.clear()
+
+    assert dict(cfg) == {'name': 'Neil', 'age': 22}
+
+
+def test_custom_special_validator():
+    """Unknown special validators are run for the updated dictionary"""
+
+    def check_max_num_keys(sd_key, max_num_keys, context):
+        if len(context.testdict) > max_num_keys:
+            raise KeyError(f"{sd_key!r}: too many keys")
+
+    my_validators = dict(SCHEMA.validators)
+    my_validators['$max_num_keys'] = check_max_num_keys
+    schema = schemadict({'$max_num_keys': 2}, validators=my_validators)
+
+    cfg = ValidatedDict(schema, a=1)
+    cfg['b'] = 2
+
+    with pytest.raises(KeyError):
+        cfg['c'] = 3
+
+    assert dict(cfg) == {'a': 1, 'b': 2}
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from numbers import Number
+
+import pytest
+
+from schemadict import schemadict
+
+from helpers import get_error
+
+N = 5000
+
+
+def _schema(item_type):
+    return schemadict({
+        'samples': {
+            'type': list,
+            'item_schema': {'type': item_type, '>=': 0, '<': 1},
+        },
+    })
+
+
+@pytest.mark.parametrize('validate_attr', ['validate', 'generate_validator'])
+def test_large_numeric_lists(validate_attr):
+    pytest.importorskip('numpy')
+
+    for item_type in (float, Number):
+        schema = _schema(item_type)
+        validate = getattr(schema, validate_attr)
+        if validate_attr == 'generate_validator':
+            validate = validate()
+
+        samples = [i/N for i in range(N)]
+        validate({'samples': samples})
+
+        for bad_value in (1.0, -0.5, float('nan')):
+            samples[3000] = bad_value
+            samples[4000] = 7.0
+            with pytest.raises(ValueError):
+                validate({'samples': samples})
+            samples[3000] = samples[4000] = 0.5
+
+
+def test_same_error_as_item_loop():
+    """Vectorized checks raise the same error as the per-item loop"""
+
+    samples = [0.5]*N
+    samples[1234] = 1.5
+    samples[2345] = -1.5
+
+    exp_error = (ValueError, "'samples' too large: expected < 1, but was 1.5")
+    assert get_error(_schema(float).validate, {'samples': samples}) == exp_error
+    assert get_error(_schema(float).validate, {'samples': samples[1200:1400]}) == exp_error
+
+
+@pytest.mark.parametrize('validate_attr', ['validate', 'generate_validator'])
+def test_large_integers_float_bounds(validate_attr):
+    """Integers above 2**53 cannot be compared exactly as float64"""
+
+    pytest.importorskip('numpy')
+
+    schema = schemadict({
+        'samples': {'type': list, 'item_schema': {'type': int, '<=': 9007199254740992.0}},
+    })
+    validate = getattr(schema, validate_attr)
+    if validate_attr == 'generate_validator':
+        validate = validate()
+
+    samples = [0]*1500 + [2**53 + 1]
+    exp_error = get_error(validate, {'samples': samples[-6:]})
+    assert exp_error is not None
+    assert get_error(validate, {'samples': samples}) == exp_error
+
+    validate({'samples': [0]*1500 + [2**53, -2**53]})
+
+
+def test_fallback_to_item_loop():
+    """Non-numeric or mixed items are checked by the per-item loop"""
+
+    samples = [0]*N
+    _schema(int).validate({'samples': samples})
+
+    samples[100] = True
+    with pytest.raises(TypeError):
+        _schema(int).validate({'samples': samples})
+
+    samples[100] = 0.5
+    with pytest.raises(TypeError):
+        _schema(int).validate({'samples': samples})
+
+    # Mixed int and float items
+    samples[100] = 2**60
+    with pytest.raises(ValueError):
+        _schema(Number).validate({'samples': samples})
+
+    samples[100] = 'string'
+    with pytest.raises(TypeError):
+        _schema(Number).validate({'samples': samples})
+
+
+def test_item_types_large_list():
+    schema = schemadict({'a': {'type': list, 'item_types': (int, float)}})
+    schema.validate({'a': [1, 2.0]*N})
+
+    with pytest.raises(TypeError):
+        schema.validate({'a': [1, 2.0]*N + ['3']})